@@ -0,0 +1,157 @@
+"""Headless channel-capacity sweeps - no tkinter / matplotlib required
+
+Examples:
+    python capacity_cli.py channels.npy -o results.csv --workers 8
+    python capacity_cli.py chain1.npz chain2.npz --mode chain -o results.jsonl
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+from collections import deque
+import numpy as np
+
+from tabs.channel import ChannelModel
+from tabs.channel.channel_model import CAPACITY_METHODS, CVXPY_SOLVERS
+
+
+def load_matrices(path):
+    """
+    Yield (label, matrix) pairs from a .npy / .npz / .csv file.
+
+    .npy files are memory-mapped; a 2-D array is one matrix and a 3-D array a stack
+    of matrices. Every array of an .npz file is read the same way, one at a time.
+    CSV files hold one matrix, or several separated by blank lines.
+    """
+    name = os.path.basename(path)
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.npy':
+        yield from _split_array(name, np.load(path, mmap_mode='r'))
+    elif ext == '.npz':
+        with np.load(path) as archive:
+            for key in archive.files:
+                yield from _split_array(f"{name}:{key}", archive[key])
+    elif ext in ('.csv', '.txt'):
+        with open(path, encoding='utf-8') as f:
+            blocks = [b for b in f.read().replace('\r\n', '\n').split('\n\n') if b.strip()]
+        for i, block in enumerate(blocks):
+            matrix = np.loadtxt(io.StringIO(block), delimiter=',', ndmin=2)
+            yield (name if len(blocks) == 1 else f"{name}[{i}]"), matrix
+    else:
+        raise ValueError(f"Unsupported input format: {path}")
+
+
+def _split_array(label, array):
+    if array.ndim == 2:
+        yield label, array
+    elif array.ndim == 3:
+        for i in range(array.shape[0]):
+            yield f"{label}[{i}]", array[i]
+    else:
+        raise ValueError(f"{label}: expected a 2-D matrix or a 3-D stack, got shape {array.shape}")
+
+
+def iter_jobs(paths, mode, model, labels):
+    """
+    Yield the matrices to solve, recording (label, error) pairs in `labels` in the same order.
+    Files that cannot be used yield a placeholder and carry the error message instead.
+    """
+    for path in paths:
+        try:
+            if mode == 'capacity':
+                for label, matrix in load_matrices(path):
+                    labels.append((label, None))
+                    yield matrix
+                continue
+
+            # Chain mode: every input file is one cascade P1 x P2 x ... x Pn
+            matrices = [np.asarray(matrix, dtype=float) for _, matrix in load_matrices(path)]
+            is_valid, error_msg = model.check_for_matrix_dimensions(matrices)
+            if not is_valid:
+                raise ValueError(error_msg)
+            combined = model.combine_matrices(matrices)
+        except (OSError, ValueError) as e:
+            labels.append((os.path.basename(path), str(e)))
+            yield np.full(1, np.nan)
+        else:
+            labels.append((os.path.basename(path), None))
+            yield combined
+
+
+class ResultWriter:
+    """Writes one CSV row or JSON line per result and flushes it immediately."""
+
+    FIELDS = ['source', 'capacity', 'status', 'x_optimal']
+
+    def __init__(self, stream, fmt):
+        self.stream = stream
+        self.fmt = fmt
+        if fmt == 'csv':
+            self.writer = csv.writer(stream)
+            self.writer.writerow(self.FIELDS)
+
+    def write(self, label, capacity, x_optimal, status):
+        x_list = np.atleast_1d(x_optimal).tolist()
+        if self.fmt == 'csv':
+            self.writer.writerow([label, f"{capacity:.10g}", status, ' '.join(f"{v:.10g}" for v in x_list)])
+        else:
+            record = {'source': label, 'capacity': None if np.isnan(capacity) else float(capacity),
+                      'status': status, 'x_optimal': [None if np.isnan(v) else v for v in x_list]}
+            self.stream.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self.stream.flush()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Channel capacity sweeps over matrix files")
+    parser.add_argument('inputs', nargs='+', help=".npy / .npz / .csv files with P(Y|X) matrices")
+    parser.add_argument('--mode', choices=('capacity', 'chain'), default='capacity',
+                        help="capacity of every matrix, or of every file as one channel chain")
+    parser.add_argument('--method', choices=CAPACITY_METHODS, default='blahut_arimoto')
+    parser.add_argument('-m', type=int, default=None, help="number of inputs M (default: matrix columns)")
+    parser.add_argument('--tol', type=float, default=1e-7, help="Blahut-Arimoto tolerance in bits")
+    parser.add_argument('--max-iter', type=int, default=10000, help="Blahut-Arimoto iteration cap")
+    parser.add_argument('--solver', choices=CVXPY_SOLVERS, default=None, help="cvxpy solver")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="worker processes (default: CPU count, 0 = run in this process)")
+    parser.add_argument('--chunksize', type=int, default=64, help="matrices per worker task")
+    parser.add_argument('-o', '--output', default=None, help="output .csv or .jsonl file (default: stdout)")
+    parser.add_argument('--format', choices=('csv', 'jsonl'), default=None,
+                        help="output format (default: from the output extension, else csv)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    fmt = args.format or ('jsonl' if args.output and args.output.endswith(('.jsonl', '.json')) else 'csv')
+    if args.method == 'blahut_arimoto':
+        solver_options = {'tol': args.tol, 'max_iter': args.max_iter}
+    else:
+        solver_options = {'solver': args.solver}
+
+    model = ChannelModel(cache=False)
+    labels = deque()
+    jobs = iter_jobs(args.inputs, args.mode, model, labels)
+    results = model.calculate_capacity_batch(jobs, m=args.m, method=args.method, max_workers=args.workers,
+                                             chunksize=args.chunksize, **solver_options)
+
+    stream = open(args.output, 'w', newline='', encoding='utf-8') if args.output else sys.stdout
+    try:
+        writer = ResultWriter(stream, fmt)
+        failures = 0
+        for capacity, x_optimal, status in results:
+            label, error = labels.popleft()
+            if error is not None:
+                status = f"error: {error}"
+            failures += status.startswith('error')
+            writer.write(label, capacity, x_optimal, status)
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,15 +1,24 @@
 """Main application entry point - MVC Orchestrator"""
 
+import os
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 from app_theme.dark_theme import ModernDarkTheme
 from tabs.common.shared_ui import SharedUI
+from tabs.common.background import BackgroundExecutor
 
 # Import tab components
 from tabs.entropy import EntropyModel, EntropyView, EntropyController
-from tabs.channel import ChannelModel, ChannelView, ChannelController
+from tabs.channel import ChannelModel, ChannelView, ChannelController, CapacityCache
 from tabs.huffman import HuffmanModel, HuffmanView, HuffmanController
 
+# Η cache χωρητικότητας διατηρείται μεταξύ των εκτελέσεων μόνο αν οριστεί αρχείο (.npz)
+# στη μεταβλητή περιβάλλοντος INFOTHEORY_CAPACITY_CACHE· αλλιώς μένει μόνο στη μνήμη
+CAPACITY_CACHE_PATH = os.environ.get("INFOTHEORY_CAPACITY_CACHE") or None
+
+# Μέγιστη αναμονή (δευτερόλεπτα) κατά το κλείσιμο για τις εργασίες που τρέχουν στο παρασκήνιο
+CLOSE_WAIT_SECONDS = 5.0
+
 class InfoTheoryApp(SharedUI):  # CHANGED: Inherit from SharedUI
     """Main application class - orchestrates all MVC components"""
 
@@ -29,11 +38,16 @@ class InfoTheoryApp(SharedUI):  # CHANGED: Inherit from SharedUI
         self.notebook = ttk.Notebook(root)
         self.notebook.pack(expand=True, fill="both")
 
+        # Shared worker for long computations of all tabs
+        self.executor = BackgroundExecutor(self.root)
+
         # Initialize all tab components
         self._init_entropy_tab()
         self._init_channel_tab()
         self._init_huffman_tab()
 
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
     def _configure_style(self):
         """Configure ttk styles"""
         style = ttk.Style(self.root)
@@ -47,19 +61,30 @@ class InfoTheoryApp(SharedUI):  # CHANGED: Inherit from SharedUI
         """Initialize Entropy tab (MVC)"""
         entropy_model = EntropyModel()
         entropy_view = EntropyView(self.notebook)
-        entropy_controller = EntropyController(entropy_model, entropy_view)
+        entropy_controller = EntropyController(entropy_model, entropy_view, self.executor)
 
     def _init_channel_tab(self):
         """Initialize Channel tab (MVC)"""
-        channel_model = ChannelModel()
+        self.channel_model = ChannelModel(cache=CapacityCache(path=CAPACITY_CACHE_PATH))
         channel_view = ChannelView(self.notebook)
-        channel_controller = ChannelController(channel_model, channel_view)
+        channel_controller = ChannelController(self.channel_model, channel_view, self.executor)
 
     def _init_huffman_tab(self):
         """Initialize Huffman tab (MVC)"""
         huffman_model = HuffmanModel()
         huffman_view = HuffmanView(self.notebook)
-        huffman_controller = HuffmanController(huffman_model, huffman_view)
+        huffman_controller = HuffmanController(huffman_model, huffman_view, self.executor)
+
+    def _on_close(self):
+        """Stop background work, save the capacity cache (if persistent) and close the application"""
+        # Μια επίλυση που τρέχει ακόμα προλαβαίνει να αποθηκεύσει το αποτέλεσμά της στην cache
+        self.executor.shutdown(wait=True, timeout=CLOSE_WAIT_SECONDS)
+        if CAPACITY_CACHE_PATH is not None:
+            try:
+                self.channel_model.cache.save()
+            except Exception:
+                pass  # μια cache που δεν αποθηκεύεται δεν πρέπει να εμποδίζει το κλείσιμο
+        self.root.destroy()
 
     def _create_menu_bar(self):
         """Create top menu bar"""
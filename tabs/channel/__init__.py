@@ -1,6 +1,17 @@
 """Channel capacity calculations module"""
 from .channel_model import ChannelModel
-from .channel_view import ChannelView
-from .channel_controller import ChannelController
+from .capacity_cache import CapacityCache
 
-__all__ = ['ChannelModel', 'ChannelView', 'ChannelController']
+__all__ = ['ChannelModel', 'ChannelView', 'ChannelController', 'CapacityCache']
+
+
+def __getattr__(name):
+    # View/Controller load tkinter and matplotlib, so they are imported only on demand
+    # (the headless capacity_cli.py never touches them)
+    if name == 'ChannelView':
+        from .channel_view import ChannelView
+        return ChannelView
+    if name == 'ChannelController':
+        from .channel_controller import ChannelController
+        return ChannelController
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
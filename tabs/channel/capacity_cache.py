@@ -0,0 +1,178 @@
+"""LRU cache (με κλειδί το περιεχόμενο των πινάκων) για τους υπολογισμούς του Channel tab"""
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+import numpy as np
+import scipy.sparse as sp
+
+
+class CapacityCache:
+    """
+    Απομνημόνευση αποτελεσμάτων με κλειδί το hash των bytes, του dtype και του σχήματος
+    κάθε πίνακα μαζί με τις υπόλοιπες παραμέτρους (π.χ. M, μέθοδος).
+
+    Η εκκαθάριση γίνεται LRU με όριο πλήθους (max_entries) και μνήμης (max_bytes).
+    Αν δοθεί path, η cache φορτώνεται από το αρχείο και αποθηκεύεται με save(). Το αρχείο
+    είναι .npz χωρίς pickle (arrays και ένας JSON κατάλογος με έκδοση FILE_VERSION), ώστε η
+    φόρτωση να μην εκτελεί κώδικα· ένα αρχείο που δεν διαβάζεται δίνει απλώς κενή cache.
+    Οι εγγραφές προστατεύονται με lock, ώστε το save() από το thread του Tk να είναι ασφαλές
+    ενώ μια εργασία στο παρασκήνιο χρησιμοποιεί την cache.
+    """
+
+    FILE_VERSION = 1
+
+    def __init__(self, max_entries=256, max_bytes=64 * 2 ** 20, path=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (value, size)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        if path is not None and os.path.exists(path):
+            self.load(path)
+
+    def make_key(self, *parts):
+        h = hashlib.blake2b(digest_size=20)
+        for part in parts:
+            if sp.issparse(part):
+                part = sp.csr_matrix(part, copy=True)
+                part.sum_duplicates()
+                h.update(f"sparse:{part.dtype.str}:{part.shape}:".encode())
+                for array in (part.data, part.indices, part.indptr):
+                    h.update(np.ascontiguousarray(array).tobytes())
+            elif isinstance(part, np.ndarray):
+                h.update(f"ndarray:{part.dtype.str}:{part.shape}:".encode())
+                h.update(np.ascontiguousarray(part).tobytes())
+            else:
+                h.update(f"{type(part).__name__}:{part!r};".encode())
+        return h.hexdigest()
+
+    def get(self, key):
+        """Επιστρέφει την αποθηκευμένη τιμή ή None, ενημερώνοντας τους μετρητές hits/misses."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value):
+        size = self._size_of(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+            }
+
+    def save(self, path=None):
+        path = path or self.path
+        if path is None:
+            raise ValueError("No cache file path given")
+        with self._lock:
+            entries = list(self._entries.items())  # στιγμιότυπο: η κωδικοποίηση γίνεται εκτός lock
+        arrays = {}
+        index = []
+        for key, (value, _) in entries:
+            try:
+                index.append([key, self._encode(value, arrays)])
+            except TypeError:
+                continue  # τιμές που δεν αποθηκεύονται χωρίς pickle μένουν μόνο στη μνήμη
+        arrays['index'] = np.array(json.dumps({'version': self.FILE_VERSION, 'entries': index}))
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+
+    def load(self, path=None):
+        """Προσθέτει τις εγγραφές του αρχείου· ένα αρχείο που δεν διαβάζεται δεν προσθέτει τίποτα."""
+        path = path or self.path
+        try:
+            with np.load(path, allow_pickle=False) as archive:
+                header = json.loads(str(archive['index']))
+                if header['version'] != self.FILE_VERSION:
+                    raise ValueError(f"Unsupported cache file version {header['version']}")
+                entries = [(str(key), self._decode(value, archive)) for key, value in header['entries']]
+        except Exception:
+            return
+        for key, value in entries:
+            self.put(key, value)
+
+    def _encode(self, value, arrays):
+        """Δομή JSON για μια τιμή· τα arrays προστίθενται στο `arrays` με αύξοντα ονόματα."""
+        if isinstance(value, np.ndarray):
+            if value.dtype.hasobject:
+                raise TypeError("object arrays are not stored")
+            name = f"a{len(arrays)}"
+            arrays[name] = value
+            return {'array': name}
+        if sp.issparse(value):
+            value = sp.csr_matrix(value)
+            return {'sparse': {'parts': [self._encode(a, arrays) for a in (value.data, value.indices, value.indptr)],
+                               'shape': list(value.shape)}}
+        if isinstance(value, (tuple, list)):
+            return {'tuple' if isinstance(value, tuple) else 'list': [self._encode(v, arrays) for v in value]}
+        if isinstance(value, dict):
+            if not all(isinstance(k, str) for k in value):
+                raise TypeError("only string dict keys are stored")
+            return {'dict': {k: self._encode(v, arrays) for k, v in value.items()}}
+        if isinstance(value, np.generic):
+            value = value.item()
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return {'value': value}
+        raise TypeError(f"{type(value).__name__} values are not stored")
+
+    def _decode(self, node, archive):
+        (kind, content), = node.items()
+        if kind == 'array':
+            return archive[content]
+        if kind == 'sparse':
+            data, indices, indptr = (self._decode(part, archive) for part in content['parts'])
+            return sp.csr_matrix((data, indices, indptr), shape=tuple(content['shape']))
+        if kind == 'tuple':
+            return tuple(self._decode(v, archive) for v in content)
+        if kind == 'list':
+            return [self._decode(v, archive) for v in content]
+        if kind == 'dict':
+            return {k: self._decode(v, archive) for k, v in content.items()}
+        if kind == 'value':
+            return content
+        raise ValueError(f"Unknown cache entry kind '{kind}'")
+
+    def _size_of(self, value):
+        if isinstance(value, np.ndarray):
+            return value.nbytes + 112
+        if sp.issparse(value):
+            value = sp.csr_matrix(value)
+            return value.data.nbytes + value.indices.nbytes + value.indptr.nbytes + 112
+        if isinstance(value, (tuple, list)):
+            return sum(self._size_of(v) for v in value) + 56
+        if isinstance(value, dict):
+            return sum(self._size_of(v) for v in value.values()) + 232
+        return 32
@@ -1,11 +1,13 @@
 from tkinter import messagebox
 import numpy as np
+from tabs.common.background import BackgroundExecutor
 
 
 class ChannelController:
-    def __init__(self, model, view):
+    def __init__(self, model, view, executor=None):
         self.model = model
         self.view = view
+        self.executor = executor or BackgroundExecutor(view.frame)
         self._bind_commands()
 
     def _bind_commands(self):
@@ -49,25 +51,32 @@ class ChannelController:
 
     def handle_calculate_capacity(self):
         try:
-            if not self.view.matrix_entries:
+            if self.view.matrix_grid is None:
                 messagebox.showerror("Σφάλμα", "Μη βιάζεστε! Δημιουργήστε πρώτα έναν πίνακα!")
                 return
 
             # Extract matrix data (reusable function)
-            matrix_data = self._extract_matrix_data(self.view.matrix_entries, "Πίνακας")
-            P_YX = np.array(matrix_data)
+            P_YX = self._extract_matrix_data(self.view.matrix_grid, "Πίνακας")
 
             m = int(self.view.m_entry.get())
             if m <= 0:
                 raise ValueError("Το M πρέπει να είναι θετικός ακέραιος!")
 
-            capacity, x_optimal = self.model.calculate_uniform_channel_capacity(m, P_YX, 1)
-            self.view.display_capacity_result(P_YX, m, capacity)
+            method = self.view.get_capacity_method(self.view.method_combo)
 
         except ValueError as e:
             messagebox.showerror("Σφάλμα", str(e))
-        except Exception as e:
-            messagebox.showerror("Σφάλμα", f"Σφάλμα υπολογισμού: {str(e)}")
+            return
+
+        def task(progress):
+            capacity, x_optimal = self.model.calculate_uniform_channel_capacity(
+                m, P_YX, 1, method=method, callback=self._capacity_progress(progress))
+            return capacity, dict(self.model.last_solve_info)
+
+        # Both channel tasks share self.model, so they run on one lane; cvxpy never reports progress
+        self.executor.submit('channel_capacity', task, status=self.view.capacity_status,
+                             on_done=lambda result: self.view.display_capacity_result(P_YX, m, *result),
+                             on_error=self._show_error, lane='channel', cancellable=method != 'cvxpy')
 
     def handle_create_chain_matrices(self):
         try:
@@ -90,12 +99,11 @@ class ChannelController:
 
             # For each chain matrix, extract data (same way as 2nd subtab)
             for idx, frame_data in enumerate(self.view.chain_frames):
-                if not frame_data['matrix_entries']:
+                if frame_data['grid'] is None:
                     raise ValueError(f"Ο Πίνακας {idx + 1} δεν έχει δημιουργηθεί!")
 
                 # Reuse the same extraction logic!
-                matrix_data = self._extract_matrix_data(frame_data['matrix_entries'], f"Πίνακας {idx + 1}")
-                matrices.append(np.array(matrix_data))
+                matrices.append(self._extract_matrix_data(frame_data['grid'], f"Πίνακας {idx + 1}"))
 
             if not matrices:
                 raise ValueError("Δημιουργήστε τουλάχιστον έναν πίνακα!")
@@ -105,40 +113,77 @@ class ChannelController:
             if not is_valid:
                 raise ValueError(f"Μη συμβατές διαστάσεις: {error_msg}")
 
-            # Combine matrices
-            P_combined = self.model.combine_matrices(matrices)
-
             m = int(self.view.m_chain_entry.get())
             if m <= 0:
                 raise ValueError("Το M πρέπει να είναι θετικός ακέραιος!")
 
-            capacity, x_optimal = self.model.calculate_uniform_channel_capacity(m, P_combined, 1)
-            self.view.display_chain_result(matrices, P_combined, m, capacity)
+            method = self.view.get_capacity_method(self.view.chain_method_combo)
 
         except ValueError as e:
             messagebox.showerror("Σφάλμα", str(e))
-        except Exception as e:
+            return
+
+        def task(progress):
+            # Combine matrices
+            progress(None, "Πολλαπλασιασμός πινάκων...")
+            P_combined = self.model.combine_matrices(matrices)
+            chain_stats = self.model.last_chain_stats
+            capacity, x_optimal = self.model.calculate_uniform_channel_capacity(
+                m, P_combined, 1, method=method, callback=self._capacity_progress(progress))
+            return P_combined, capacity, chain_stats, dict(self.model.last_solve_info)
+
+        self.executor.submit('channel_chain', task, status=self.view.chain_status,
+                             on_done=lambda result: self.view.display_chain_result(
+                                 matrices, result[0], m, result[1], result[2], result[3]),
+                             on_error=self._show_error, lane='channel', cancellable=method != 'cvxpy')
+
+    def _capacity_progress(self, progress, tol=1e-7):
+        """Callback του Blahut–Arimoto που μετατρέπει τη διαφορά ορίων σε ποσοστό προόδου."""
+        first_gap = []
+
+        def callback(iteration, lower, upper):
+            gap = max(upper - lower, tol)
+            if not first_gap:
+                first_gap.append(gap)
+            fraction = np.log(first_gap[0] / gap) / np.log(first_gap[0] / tol) if first_gap[0] > tol else 1.0
+            progress(fraction, f"Επανάληψη {iteration}: {lower:.6f} ≤ C ≤ {upper:.6f}")
+
+        return callback
+
+    def _show_error(self, e):
+        if isinstance(e, ValueError):
+            messagebox.showerror("Σφάλμα", str(e))
+        else:
             messagebox.showerror("Σφάλμα", f"Σφάλμα υπολογισμού: {str(e)}")
 
-    def _extract_matrix_data(self, matrix_entries, matrix_name):
+    def _extract_matrix_data(self, matrix_grid, matrix_name, max_listed=10):
         """
-        Reusable method to extract and validate matrix data from Entry widgets.
+        Reusable method to extract and validate matrix data from a MatrixGrid.
         Works for both 2nd subtab (single matrix) and 3rd subtab (multiple matrices).
+        All columns (P(Y|X=x), the convention of the capacity solvers) are validated at once
+        and reported in a single message.
         """
-        matrix_data = []
-
-        for i, row in enumerate(matrix_entries):
-            row_values = [float(entry.get()) for entry in row]
-
-            # Validate probabilities
-            if not self.model.check_for_correct_probabilities(row_values):
-                raise ValueError(f"{matrix_name} - Γραμμή {i + 1}: Όλες οι τιμές πρέπει να είναι στο [0,1]")
-
-            # Warn if row doesn't sum to 1
-            if not np.isclose(sum(row_values), 1.0, atol=0.01):
-                messagebox.showwarning("Προειδοποίηση",
-                                       f"{matrix_name} - Γραμμή {i + 1} αθροίζει σε {sum(row_values):.3f} (όχι 1.0)")
-
-            matrix_data.append(row_values)
+        matrix_data = matrix_grid.get_matrix()
+        bad_columns, unnormalized_columns, column_sums = self.model.find_invalid_columns(matrix_data)
+
+        # Validate probabilities
+        if bad_columns.size:
+            raise ValueError(f"{matrix_name} - Στήλες {self._format_indices(bad_columns, max_listed)}: "
+                             f"Όλες οι τιμές πρέπει να είναι αριθμοί στο [0,1]")
+
+        # Warn if columns (the distributions P(Y|X=x)) don't sum to 1
+        if unnormalized_columns.size:
+            details = "\n".join(f"Στήλη {j + 1}: {column_sums[j]:.3f}" for j in unnormalized_columns[:max_listed])
+            if unnormalized_columns.size > max_listed:
+                details += f"\n... και {unnormalized_columns.size - max_listed} ακόμη"
+            messagebox.showwarning("Προειδοποίηση",
+                                   f"{matrix_name} - {unnormalized_columns.size} στήλες δεν αθροίζουν σε 1.0:\n{details}")
 
         return matrix_data
+
+    @staticmethod
+    def _format_indices(indices, max_listed):
+        listed = ", ".join(str(i + 1) for i in indices[:max_listed])
+        if indices.size > max_listed:
+            listed += f" (και {indices.size - max_listed} ακόμη)"
+        return listed
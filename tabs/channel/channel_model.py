@@ -1,33 +1,355 @@
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
 import numpy as np
 import cvxpy as cp
+import scipy.sparse as sp
 from scipy.special import xlogy
+from .capacity_cache import CapacityCache
+
+
+CAPACITY_METHODS = ('cvxpy', 'blahut_arimoto')
+CVXPY_SOLVERS = ('SCS', 'CLARABEL', 'ECOS')
+MAX_COMPILED_PROBLEMS = 16
+# Ανοχή στα αθροίσματα στηλών του πίνακα διαύλου
+COLUMN_SUM_ATOL = 0.01
+SWEEP_CHANNELS = ('bsc', 'bec', 'z', 'binary')
+
+
+def binary_entropy(p):
+    """
+    Δυαδική εντροπία h(p) σε bits, διανυσματικά για οποιοδήποτε array.
+    Με xlogy ισχύει 0·log0 = 0, άρα h(0) = h(1) = 0 χωρίς ειδικές περιπτώσεις.
+    """
+    p = np.asarray(p, dtype=float)
+    return -(xlogy(p, p) + xlogy(1 - p, 1 - p)) / np.log(2)
+
+
+def _column_plogp(P):
+    """Σ_y P[y, x]·ln P[y, x] ανά στήλη. Για sparse πίνακες μόνο πάνω στα αποθηκευμένα μη μηδενικά."""
+    if sp.issparse(P):
+        P = sp.csc_matrix(P)
+        plogp = sp.csc_matrix((xlogy(P.data, P.data), P.indices, P.indptr), shape=P.shape)
+        return np.asarray(plogp.sum(axis=0)).ravel()
+    return xlogy(P, P).sum(axis=0)
+
+
+def _check_channel_matrix(P, m, atol=COLUMN_SUM_ATOL):
+    """
+    (σφάλμα, προειδοποίηση) για πίνακα διαύλου (dense ή sparse), όπου κάθε στοιχείο είναι
+    μήνυμα ή None. Το σφάλμα αφορά σχήμα και τιμές, η προειδοποίηση στήλες που δεν αθροίζουν
+    σε 1: και οι δύο μέθοδοι θεωρούν τη στήλη P[:, j] κατανομή P(Y|X=j) (σύμβαση του `P @ x`).
+    """
+    if P.ndim != 2:
+        return f"expected a 2-D matrix, got shape {P.shape}", None
+    if P.shape[1] != m:
+        return f"matrix shape {P.shape} does not match M = {m}", None
+    values = P.data if sp.issparse(P) else P
+    if not np.all(np.isfinite(values)) or np.any(values < 0):
+        return "matrix entries must be finite and non-negative", None
+    column_sums = np.asarray(P.sum(axis=0)).ravel()
+    unnormalized = np.flatnonzero(~np.isclose(column_sums, 1.0, atol=atol))
+    if unnormalized.size:
+        listed = ", ".join(str(j + 1) for j in unnormalized[:10])
+        if unnormalized.size > 10:
+            listed += ", ..."
+        return None, (f"{unnormalized.size} columns do not sum to 1 ({listed}); "
+                      f"the columns of P must be the distributions P(Y|X=x)")
+    return None, None
+
+
+def _blahut_arimoto(P, tol=1e-7, max_iter=10000, x0=None, callback=None):
+    """
+    Αλγόριθμος Blahut–Arimoto σε καθαρό NumPy, για στοίβα πινάκων ίδιου σχήματος P[k, y, x]
+    ή για έναν scipy.sparse πίνακα (k = 1), ώστε μνήμη και χρόνος να κλιμακώνονται με το nnz.
+
+    Κάθε πίνακας ακολουθεί τη σύμβαση του `P @ x`: η στήλη P[:, j] είναι η P(Y|X=j).
+    Σε κάθε επανάληψη υπολογίζονται το κάτω όριο I(x) και το άνω όριο
+    max_j D(P[:, j] || Px) της χωρητικότητας (σε bits), τα οποία δίνονται στο
+    callback(iteration, lower, upper) ως arrays μήκους k. Για ταχύτερη σύγκλιση το
+    βήμα x <- x·exp(mu·D) μεγαλώνει όσο αυξάνεται το I(x) και επανέρχεται στο κλασικό
+    mu = 1 (που είναι μονότονο) μόλις το I(x) μειωθεί. Οι πίνακες που συγκλίνουν
+    «παγώνουν», ώστε οι υπόλοιποι να συνεχίζουν μόνοι τους.
+
+    Επιστρέφει (lower, x, upper, iterations, converged).
+    """
+    sparse = sp.issparse(P)
+    if sparse:
+        P = sp.csr_matrix(P)
+        PT = P.T.tocsr()
+        k, n = 1, P.shape[1]
+        c = _column_plogp(P)[None]
+    else:
+        k, _, n = P.shape
+        c = xlogy(P, P).sum(axis=1)
+
+    if x0 is None:
+        x = np.full((k, n), 1.0 / n)
+    else:
+        x = np.array(x0, dtype=float).reshape(k, n)
+        totals = x.sum(axis=1, keepdims=True)
+        if np.any(x < 0) or not np.all(np.isfinite(x)) or np.any(totals <= 0):
+            raise ValueError("Warm start x0 must be a non-negative, non-zero vector")
+        # Μικρή ανάμειξη με την ομοιόμορφη ώστε κανένα σύμβολο να μην μείνει κλειδωμένο στο 0
+        x = 0.999 * x / totals + 0.001 / n
+
+    lower = np.full(k, -np.inf)
+    upper = np.full(k, np.inf)
+    D_accepted = np.zeros((k, n))
+    x_accepted = x.copy()
+    mu = np.ones(k)
+    iterations = np.zeros(k, dtype=int)
+    converged = np.zeros(k, dtype=bool)
+    active = np.arange(k)
+
+    for iteration in range(1, max_iter + 1):
+        xa = x[active]
+        if sparse:
+            q = (P @ xa[0])[None]
+            log_q = np.log(np.where(q > 0, q, 1.0))
+            D = c - (PT @ log_q[0])[None]
+        else:
+            Pa = P[active]
+            q = np.einsum('kyn,kn->ky', Pa, xa)
+            log_q = np.log(np.where(q > 0, q, 1.0))
+            D = c[active] - np.einsum('ky,kyn->kn', log_q, Pa)
+        lo = np.einsum('kn,kn->k', xa, D) / np.log(2)
+        up = D.max(axis=1) / np.log(2)
+
+        # Επιταχυμένο βήμα που μείωσε το I(x): επιστροφή στο προηγούμενο σημείο με mu = 1
+        rejected = lo < lower[active]
+        if rejected.any():
+            xa[rejected] = x_accepted[active[rejected]]
+            D[rejected] = D_accepted[active[rejected]]
+            lo[rejected] = lower[active[rejected]]
+            up[rejected] = upper[active[rejected]]
+        mu_a = np.where(rejected, 1.0, np.where(np.isfinite(lower[active]), np.minimum(mu[active] * 1.5, 256.0), 1.0))
+
+        x_accepted[active], D_accepted[active] = xa, D
+        lower[active], upper[active], mu[active] = lo, up, mu_a
+        iterations[active] = iteration
+        if callback is not None:
+            callback(iteration, lower, upper)
+
+        done = up - lo < tol
+        converged[active[done]] = True
+        keep = ~done
+        if not keep.any():
+            break
+        D = D[keep]
+        step = xa[keep] * np.exp(mu_a[keep, None] * (D - D.max(axis=1, keepdims=True)))
+        active = active[keep]
+        x[active] = step / step.sum(axis=1, keepdims=True)
+
+    return lower, x_accepted, upper, iterations, converged
+
+
+def _solve_capacity_chunk(stack, m, method, solver_options):
+    """
+    Worker του calculate_capacity_batch: λύνει μια στοίβα πινάκων ίδιου σχήματος
+    (3-D array, ή λίστα sparse πινάκων που λύνονται ένας-ένας). Τα σφάλματα αναφέρονται ανά στοιχείο ως (nan, nan, 'error: ...') χωρίς να διακόπτεται η παρτίδα.
+    """
+    results = [None] * len(stack)
+    valid = []
+    for i, P in enumerate(stack):
+        error, warning = _check_channel_matrix(P, P.shape[1] if m is None else m)
+        if warning is not None and method == 'blahut_arimoto':
+            error = warning
+        if error is not None:
+            results[i] = (np.nan, np.nan, f"error: {error}")
+        else:
+            valid.append(i)
+
+    if method == 'blahut_arimoto' and valid:
+        if isinstance(stack, np.ndarray):
+            solved = [_blahut_arimoto(stack[valid], **solver_options)]
+        else:
+            solved = [_blahut_arimoto(stack[i], **solver_options) for i in valid]
+        capacities, xs, _, _, converged = (np.concatenate(parts) for parts in zip(*solved))
+        for j, i in enumerate(valid):
+            status = 'optimal' if converged[j] else 'max_iter_reached'
+            results[i] = (capacities[j], xs[j], status)
+    else:
+        model = ChannelModel()
+        for i in valid:
+            try:
+                capacity, x_optimal = model.calculate_uniform_channel_capacity(
+                    stack[i].shape[1], stack[i], 1, method=method, **solver_options)
+                status = model.last_solve_info.get('status', 'optimal')
+                if model.last_solve_info.get('warning'):
+                    status += f"; warning: {model.last_solve_info['warning']}"
+                results[i] = (capacity, x_optimal, status)
+            except Exception as e:
+                results[i] = (np.nan, np.nan, f"error: {e}")
+    return results
+
+
+def _chain_order(dims):
+    """
+    Δυναμικός προγραμματισμός του matrix-chain: για πίνακες με διαστάσεις
+    dims[i] x dims[i + 1] επιστρέφει (ελάχιστο κόστος σε FLOPs, πίνακας διασπάσεων).
+    """
+    n = len(dims) - 1
+    cost = [[0] * n for _ in range(n)]
+    split = [[0] * n for _ in range(n)]
+    for length in range(1, n):
+        for i in range(n - length):
+            j = i + length
+            cost[i][j] = None
+            for k in range(i, j):
+                c = cost[i][k] + cost[k + 1][j] + 2 * dims[i] * dims[k + 1] * dims[j + 1]
+                if cost[i][j] is None or c < cost[i][j]:
+                    cost[i][j], split[i][j] = c, k
+    return cost[0][n - 1], split
+
+
+def _multiply_in_order(matrices, split, i, j):
+    """Επιστρέφει (γινόμενο matrices[i..j], παρενθετοποίηση) με τη σειρά του πίνακα split."""
+    if i == j:
+        return matrices[i], f"P{i + 1}"
+    k = split[i][j]
+    left, left_order = _multiply_in_order(matrices, split, i, k)
+    right, right_order = _multiply_in_order(matrices, split, k + 1, j)
+    return left @ right, f"({left_order} {right_order})"
 
 
 class ChannelModel:
     """Περιέχει όλες της συναρτήσεις του Channel tab για τους απαραίτητους υπολογισμούς"""
 
+    def __init__(self, cache=True):
+        # Πληροφορίες της τελευταίας επίλυσης χωρητικότητας (επαναλήψεις, όρια κ.λπ.)
+        self.last_solve_info = {}
+        # cache: True -> νέα CapacityCache στη μνήμη, False/None -> χωρίς cache, ή έτοιμο CapacityCache
+        if cache is True:
+            cache = CapacityCache()
+        self.cache = cache or None
+        # Κατάσταση αλυσίδας για επαναϋπολογισμό μόνο του πίνακα που άλλαξε
+        self._chain_matrices = []
+        self._chain_product = None
+        self._prefix_products = {}  # k -> P1 ... Pk
+        self._suffix_products = {}  # k -> Pk+1 ... Pn
+        self.last_chain_stats = {}
+        # Μεταγλωττισμένα (DPP) προβλήματα cvxpy ανά σχήμα πίνακα
+        self._cvxpy_problems = OrderedDict()
+
     def calculate_bsc_capacity(self, e):
-        if e in (0, 1):
-            return 0
-        return 1 + e * np.log2(e) + (1 - e) * np.log2(1 - e)
+        return 1 - binary_entropy(e)
 
     def generate_bsc_curve_graphics(self, num_points=200):
         x = np.linspace(0.001, 0.99, num_points)
-        y = [self.calculate_bsc_capacity(e) for e in x]
+        y = self.capacity_sweep('bsc', x)
         return x, y
 
+    def capacity_sweep(self, channel, a, b=None):
+        """
+        Καμπύλες χωρητικότητας δυαδικών διαύλων σε ένα διανυσματικό πέρασμα.
+
+        channel: 'bsc'    -> a = πιθανότητα σφάλματος e
+                 'bec'    -> a = πιθανότητα διαγραφής
+                 'z'      -> a = P(Y=0|X=1)
+                 'binary' -> a = P(Y=1|X=0), b = P(Y=0|X=1) (γενικός δυαδικός δίαυλος)
+        Τα a, b μπορεί να είναι arrays οποιουδήποτε σχήματος (γίνεται broadcasting).
+        """
+        a = np.asarray(a, dtype=float)
+        if channel == 'bsc':
+            return 1 - binary_entropy(a)
+        if channel == 'bec':
+            return 1 - a
+        if channel == 'z':
+            return self._binary_channel_capacity(np.zeros_like(a), a)
+        if channel == 'binary':
+            if b is None:
+                raise ValueError("The general binary channel needs both crossover probabilities a and b")
+            return self._binary_channel_capacity(a, np.asarray(b, dtype=float))
+        raise ValueError(f"Unknown channel '{channel}', expected one of {SWEEP_CHANNELS}")
+
+    def _binary_channel_capacity(self, a, b):
+        # Κλειστή μορφή για W = [[1-a, a], [b, 1-b]]: λύνουμε W c = [h(a), h(b)]
+        # και C = log2(2^-c0 + 2^-c1). Για a + b = 1 οι έξοδοι είναι ανεξάρτητες, C = 0.
+        a, b = np.broadcast_arrays(a, b)
+        det = 1 - a - b
+        singular = np.abs(det) < 1e-12
+        safe_det = np.where(singular, 1.0, det)
+        ha, hb = binary_entropy(a), binary_entropy(b)
+        c0 = ((1 - b) * ha - a * hb) / safe_det
+        c1 = ((1 - a) * hb - b * ha) / safe_det
+        C = np.logaddexp2(-c0, -c1)
+        return np.where(singular, 0.0, np.maximum(C, 0.0))
+
+
+    def calculate_uniform_channel_capacity(self, m, P, sum_x=1, method='cvxpy', tol=1e-7,
+                                           max_iter=10000, x0=None, callback=None,
+                                           solver=None, solver_options=None):
+        """
+        Χωρητικότητα διαύλου με πίνακα P (στήλες = P(Y|X=x)) και M εισόδους.
+
+        method: 'cvxpy' (κυρτή βελτιστοποίηση) ή 'blahut_arimoto' (επαναληπτικά, NumPy).
+        Οι tol, max_iter και callback αφορούν μόνο το Blahut–Arimoto, οι solver και
+        solver_options μόνο το cvxpy. Το x0 (warm start) χρησιμοποιείται και από τα δύο.
+        Με ενεργή cache, ένας ίδιος πίνακας λύνεται μία φορά (το callback δεν καλείται σε hit).
+        """
+        args = (m, P, sum_x, method, tol, max_iter, x0, callback, solver, solver_options)
+        if self.cache is None:
+            return self._calculate_capacity(*args)
+
+        key = self.cache.make_key('capacity', P if sp.issparse(P) else np.asarray(P), m, sum_x, method,
+                                  tol, max_iter, solver, sorted((solver_options or {}).items()))
+        cached = self.cache.get(key)
+        if cached is None:
+            capacity, x_optimal = self._calculate_capacity(*args)
+            info = {k: v for k, v in self.last_solve_info.items() if k != 'bounds_history'}
+            cached = (capacity, x_optimal, info)
+            self.cache.put(key, cached)
+        else:
+            self.last_solve_info = dict(cached[2], cached=True)
+
+        capacity, x_optimal, _ = cached
+        return capacity, np.copy(x_optimal) if isinstance(x_optimal, np.ndarray) else x_optimal
+
+    def _calculate_capacity(self, m, P, sum_x, method, tol, max_iter, x0, callback, solver, solver_options):
+        if method == 'blahut_arimoto':
+            return self.calculate_capacity_blahut_arimoto(m, P, sum_x, tol, max_iter, x0, callback)
+        if method != 'cvxpy':
+            raise ValueError(f"Unknown capacity method '{method}', expected one of {CAPACITY_METHODS}")
+        return self.calculate_capacity_cvxpy(m, P, sum_x, solver, solver_options, x0)
+
+    def calculate_capacity_cvxpy(self, m, P, sum_x=1, solver=None, solver_options=None, x0=None):
+        """
+        Χωρητικότητα με cvxpy. Για dense πίνακες το πρόβλημα μεταγλωττίζεται μία φορά ανά
+        σχήμα με DPP παραμέτρους (P, Σ P·logP, sum_x) και επαναχρησιμοποιείται με warm start
+        από την προηγούμενη λύση. solver: 'SCS', 'CLARABEL', 'ECOS' ή None (προεπιλογή cvxpy),
+        solver_options: π.χ. {'eps': 1e-6} για SCS ή {'tol_gap_abs': 1e-9} για Clarabel.
+        """
+        if solver is not None and solver not in CVXPY_SOLVERS:
+            raise ValueError(f"Unknown solver '{solver}', expected one of {CVXPY_SOLVERS}")
+        if solver is not None and solver not in cp.installed_solvers():
+            raise ValueError(f"Solver '{solver}' is not installed")
+
+        P = P.astype(float) if sp.issparse(P) else np.asarray(P, dtype=float)
+        error, warning = _check_channel_matrix(P, m)
+        if error is not None:
+            raise ValueError(f"Optimization failed: {error}")
 
-    def calculate_uniform_channel_capacity(self, m, P, sum_x=1):
         try:
-            n = m
-            x = cp.Variable(shape=n)
-            y = P @ x
-            c = np.sum(np.array((xlogy(P, P) / np.log(2))), axis=0)
-            I = c @ x + cp.sum(cp.entr(y) / np.log(2))
-            obj = cp.Maximize(I)
-            constraints = [cp.sum(x) == sum_x, x >= 0]
-            prob = cp.Problem(obj, constraints)
-            prob.solve()
+            if sp.issparse(P):
+                # Sparse πίνακες: νέο πρόβλημα κάθε φορά, ώστε να μη γίνει dense παράμετρος
+                n = m
+                x = cp.Variable(shape=n)
+                y = P @ x
+                c = _column_plogp(P) / np.log(2)
+                I = c @ x + cp.sum(cp.entr(y) / np.log(2))
+                prob = cp.Problem(cp.Maximize(I), [cp.sum(x) == sum_x, x >= 0])
+            else:
+                prob, x, P_param, c_param, sum_param = self._compiled_capacity_problem(P.shape)
+                P_param.value = P
+                c_param.value = _column_plogp(P) / np.log(2)
+                sum_param.value = sum_x
+            if x0 is not None:
+                x.value = np.asarray(x0, dtype=float).reshape(m)
+
+            prob.solve(solver=solver, warm_start=True, **(solver_options or {}))
+            self.last_solve_info = {'method': 'cvxpy', 'status': prob.status, 'solver': prob.solver_stats.solver_name,
+                                    'warning': warning}
 
             if prob.status == 'optimal':
                 return prob.value, x.value
@@ -36,17 +358,268 @@ class ChannelModel:
         except Exception as e:
             raise ValueError(f"Optimization failed: {str(e)}")
 
+    def _compiled_capacity_problem(self, shape):
+        entry = self._cvxpy_problems.get(shape)
+        if entry is None:
+            ny, n = shape
+            x = cp.Variable(shape=n)
+            P_param = cp.Parameter(shape, nonneg=True)
+            c_param = cp.Parameter(n)
+            sum_param = cp.Parameter(nonneg=True)
+            I = c_param @ x + cp.sum(cp.entr(P_param @ x)) / np.log(2)
+            prob = cp.Problem(cp.Maximize(I), [cp.sum(x) == sum_param, x >= 0])
+            entry = (prob, x, P_param, c_param, sum_param)
+            self._cvxpy_problems[shape] = entry
+            if len(self._cvxpy_problems) > MAX_COMPILED_PROBLEMS:
+                self._cvxpy_problems.popitem(last=False)
+        else:
+            self._cvxpy_problems.move_to_end(shape)
+        return entry
+
+    def calculate_capacity_blahut_arimoto(self, m, P, sum_x=1, tol=1e-7, max_iter=10000,
+                                          x0=None, callback=None):
+        """
+        Χωρητικότητα με Blahut–Arimoto. Επιστρέφει (capacity, x_optimal) όπως η cvxpy εκδοχή,
+        ενώ τα όρια κάθε επανάληψης αποθηκεύονται στο self.last_solve_info. Πίνακες με στήλες
+        που δεν αθροίζουν σε 1 απορρίπτονται, αφού τότε τα όρια δεν ισχύουν.
+        """
+        if sum_x != 1:
+            raise ValueError("Blahut-Arimoto requires sum_x == 1")
+        P = P.astype(float) if sp.issparse(P) else np.asarray(P, dtype=float)
+        error, warning = _check_channel_matrix(P, m)
+        if error is not None or warning is not None:
+            # Χωρίς κατανομές στις στήλες τα όρια του Blahut–Arimoto δεν ισχύουν
+            raise ValueError(f"Optimization failed: {error or warning}")
+
+        history = []
+
+        def report(iteration, lower, upper):
+            history.append((lower[0], upper[0]))
+            if callback is not None:
+                callback(iteration, lower[0], upper[0])
+
+        x0 = None if x0 is None else np.asarray(x0, dtype=float)[None]
+        lower, x, upper, iterations, converged = _blahut_arimoto(
+            P if sp.issparse(P) else P[None], tol, max_iter, x0, report)
+        self.last_solve_info = {
+            'method': 'blahut_arimoto',
+            'iterations': int(iterations[0]),
+            'lower_bound': lower[0],
+            'upper_bound': upper[0],
+            'converged': bool(converged[0]),
+            'bounds_history': history,
+        }
+        return lower[0], x[0]
+
+    def calculate_capacity_batch(self, matrices, m=None, method='blahut_arimoto',
+                                 max_workers=None, chunksize=64, **solver_options):
+        """
+        Χωρητικότητες για πολλούς πίνακες (3-D array ή iterator dense/scipy.sparse πινάκων).
+
+        Οι πίνακες ομαδοποιούνται ανά σχήμα σε κομμάτια των `chunksize`, τα οποία
+        μοιράζονται σε process pool με `max_workers` διεργασίες (0 = χωρίς pool).
+        Είναι generator που επιστρέφει (capacity, x_optimal, status) με τη σειρά εισόδου.
+        Το m (πλήθος εισόδων) είναι προαιρετικό, αλλιώς λαμβάνεται από τις στήλες κάθε πίνακα.
+        """
+        if method not in CAPACITY_METHODS:
+            raise ValueError(f"Unknown capacity method '{method}', expected one of {CAPACITY_METHODS}")
+        if chunksize <= 0:
+            raise ValueError("chunksize must be a positive integer")
+
+        # 0: όλα σε αυτή τη διεργασία, None: μία διεργασία ανά CPU
+        workers = 1 if max_workers == 0 else max_workers or os.cpu_count() or 1
+        pool = ProcessPoolExecutor(workers) if max_workers != 0 else None
+        max_buffered = chunksize * workers * 4
+
+        groups = {}      # (sparse, shape) -> (indices, matrices) που δεν έχουν σταλεί ακόμη
+        in_flight = {}   # future -> indices
+        results = {}
+        next_index = 0
+        buffered = 0
+
+        def submit(group):
+            indices, stack = groups.pop(group)
+            sparse, _ = group
+            if not sparse:
+                stack = np.stack(stack)
+            if pool is None:
+                results.update(zip(indices, _solve_capacity_chunk(stack, m, method, solver_options)))
+            else:
+                in_flight[pool.submit(_solve_capacity_chunk, stack, m, method, solver_options)] = indices
+
+        def collect(block):
+            if not in_flight:
+                return
+            done, _ = wait(in_flight, timeout=None if block else 0, return_when=FIRST_COMPLETED)
+            for future in done:
+                results.update(zip(in_flight.pop(future), future.result()))
+
+        try:
+            for index, P in enumerate(matrices):
+                sparse = sp.issparse(P)
+                P = P.astype(float) if sparse else np.asarray(P, dtype=float)
+                if P.ndim != 2:
+                    results[index] = (np.nan, np.nan, f"error: expected a 2-D matrix, got shape {P.shape}")
+                else:
+                    # Οι sparse πίνακες ομαδοποιούνται χωριστά, αφού δεν στοιβάζονται σε 3-D array
+                    group = (sparse, P.shape)
+                    indices, stack = groups.setdefault(group, ([], []))
+                    indices.append(index)
+                    stack.append(P)
+                    buffered += 1
+                    if len(indices) >= chunksize:
+                        buffered -= len(indices)
+                        submit(group)
+                    if buffered >= max_buffered:
+                        for group in list(groups):
+                            submit(group)
+                        buffered = 0
+
+                while len(in_flight) > 2 * workers:
+                    collect(block=True)
+                collect(block=False)
+                while next_index in results:
+                    yield results.pop(next_index)
+                    next_index += 1
+
+            for group in list(groups):
+                submit(group)
+            while in_flight or next_index in results:
+                while next_index in results:
+                    yield results.pop(next_index)
+                    next_index += 1
+                collect(block=True)
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
     def check_for_correct_probabilities(self, values):
-        return all(0 <= v <= 1 for v in values)
+        if sp.issparse(values):
+            values = values.data
+        values = np.asarray(values, dtype=float)
+        return bool(np.all((values >= 0) & (values <= 1)))
+
+    def find_invalid_columns(self, P, atol=COLUMN_SUM_ATOL):
+        """
+        Διανυσματικός έλεγχος όλων των στηλών ενός πίνακα διαύλου με μία διέλευση. Η στήλη j
+        είναι η κατανομή P(Y|X=j), η ίδια σύμβαση με το _check_channel_matrix των επιλυτών.
+        Επιστρέφει (στήλες με τιμές εκτός [0,1] ή μη αριθμητικές, στήλες που δεν αθροίζουν
+        σε 1 με ανοχή atol, αθροίσματα στηλών). Οι δείκτες ξεκινούν από 0.
+        """
+        if sp.issparse(P):
+            P = sp.csc_matrix(P)
+            bad_values = ~((P.data >= 0) & (P.data <= 1))  # NaN -> True
+            bad_columns = np.unique(np.repeat(np.arange(P.shape[1]), np.diff(P.indptr))[bad_values])
+            column_sums = np.asarray(P.sum(axis=0)).ravel()
+        else:
+            P = np.asarray(P, dtype=float)
+            bad_columns = np.flatnonzero(np.any(~((P >= 0) & (P <= 1)), axis=0))
+            column_sums = P.sum(axis=0)
+        unnormalized_columns = np.flatnonzero(~np.isclose(column_sums, 1.0, atol=atol))
+        unnormalized_columns = np.setdiff1d(unnormalized_columns, bad_columns, assume_unique=True)
+        return bad_columns, unnormalized_columns, column_sums
 
     def combine_matrices(self, matrices):
+        """
+        Γινόμενο P1 × P2 × ... × Pn με τη βέλτιστη σειρά πολλαπλασιασμών (matrix-chain DP).
+        Αν σε σχέση με την προηγούμενη κλήση άλλαξε μόνο ένας πίνακας Pk, χρησιμοποιούνται
+        τα αποθηκευμένα γινόμενα προθέματος/επιθέματος (δύο πολλαπλασιασμοί).
+        Τα FLOPs που εξοικονομήθηκαν καταγράφονται στο self.last_chain_stats.
+        """
         if not matrices:
             raise ValueError("No matrices provided!")
 
-        combined_matrix = matrices[0]
-        for matrix in matrices[1:]:
-            combined_matrix = combined_matrix @ matrix
-        return combined_matrix
+        naive_flops = self._left_to_right_flops(matrices)
+        if self.cache is not None:
+            key = self.cache.make_key('chain', *(matrix if sp.issparse(matrix) else np.asarray(matrix)
+                                                 for matrix in matrices))
+            combined_matrix = self.cache.get(key)
+            if combined_matrix is not None:
+                self.last_chain_stats = {'flops': 0, 'naive_flops': naive_flops,
+                                         'saved_flops': naive_flops, 'order': 'cached'}
+                return combined_matrix.copy()
+            combined_matrix = self._multiply_chain(matrices, naive_flops)
+            self.cache.put(key, combined_matrix)
+            return combined_matrix.copy()
+        # Αντίγραφο: το self._chain_product χρησιμοποιείται στην επόμενη κλήση
+        return self._multiply_chain(matrices, naive_flops).copy()
+
+    def _left_to_right_flops(self, matrices):
+        rows = matrices[0].shape[0]
+        return sum(2 * rows * m.shape[0] * m.shape[1] for m in matrices[1:])
+
+    def _multiply_chain(self, matrices, naive_flops):
+        matrices = [matrix.copy() if sp.issparse(matrix) else np.array(matrix) for matrix in matrices]
+        previous = self._chain_matrices
+        changed = None
+        if len(previous) == len(matrices) and all(a.shape == b.shape for a, b in zip(previous, matrices)):
+            changed = [k for k, (a, b) in enumerate(zip(previous, matrices)) if not self._same_matrix(a, b)]
+
+        dims = [matrices[0].shape[0]] + [m.shape[1] for m in matrices]
+        full_flops, split = _chain_order(dims)
+        incremental = False
+
+        if changed == [] and self._chain_product is not None:
+            product, flops, order = self._chain_product, 0, 'unchanged'
+        else:
+            self._chain_matrices = matrices
+            if changed is not None and len(changed) == 1 and len(matrices) > 2:
+                k = changed[0]
+                self._prefix_products = {i: p for i, p in self._prefix_products.items() if i <= k}
+                self._suffix_products = {i: p for i, p in self._suffix_products.items() if i > k}
+                left_flops = 0 if k == 0 or k in self._prefix_products else _chain_order(dims[:k + 1])[0]
+                right_flops = 0 if k + 1 == len(matrices) or k + 1 in self._suffix_products \
+                    else _chain_order(dims[k + 1:])[0]
+                middle_dims = ([dims[0]] if k > 0 else []) + dims[k:k + 2] \
+                    + ([dims[-1]] if k + 1 < len(matrices) else [])
+                incremental = left_flops + right_flops + _chain_order(middle_dims)[0] <= full_flops
+            else:
+                self._prefix_products, self._suffix_products = {}, {}
+
+            if incremental:
+                left, left_flops = self._prefix_product(k)
+                right, right_flops = self._suffix_product(k + 1)
+                parts = [p for p in (left, matrices[k], right) if p is not None]
+                chain_flops, part_split = _chain_order([parts[0].shape[0]] + [p.shape[1] for p in parts])
+                product, _ = _multiply_in_order(parts, part_split, 0, len(parts) - 1)
+                flops = left_flops + right_flops + chain_flops
+                order = f"incremental (P{k + 1})"
+            else:
+                flops = full_flops
+                product, order = _multiply_in_order(matrices, split, 0, len(matrices) - 1)
+
+        self._chain_product = product
+        self.last_chain_stats = {'flops': flops, 'naive_flops': naive_flops,
+                                 'saved_flops': naive_flops - flops, 'order': order}
+        return product
+
+    def _same_matrix(self, a, b):
+        if sp.issparse(a) or sp.issparse(b):
+            return sp.issparse(a) and sp.issparse(b) and (a != b).nnz == 0
+        return np.array_equal(a, b)
+
+    def _prefix_product(self, k):
+        """P1 ... Pk (None για k = 0) και τα FLOPs που χρειάστηκαν για τον υπολογισμό του."""
+        if k == 0:
+            return None, 0
+        if k not in self._prefix_products:
+            part = self._chain_matrices[:k]
+            flops, split = _chain_order([part[0].shape[0]] + [m.shape[1] for m in part])
+            self._prefix_products[k] = (_multiply_in_order(part, split, 0, k - 1)[0], flops)
+            return self._prefix_products[k]
+        return self._prefix_products[k][0], 0
+
+    def _suffix_product(self, k):
+        """Pk+1 ... Pn (None για k = n) και τα FLOPs που χρειάστηκαν για τον υπολογισμό του."""
+        n = len(self._chain_matrices)
+        if k == n:
+            return None, 0
+        if k not in self._suffix_products:
+            part = self._chain_matrices[k:]
+            flops, split = _chain_order([part[0].shape[0]] + [m.shape[1] for m in part])
+            self._suffix_products[k] = (_multiply_in_order(part, split, 0, n - k - 1)[0], flops)
+            return self._suffix_products[k]
+        return self._suffix_products[k][0], 0
 
     def check_for_matrix_dimensions(self, matrices):
         for i in range(len(matrices) - 1):
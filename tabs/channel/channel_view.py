@@ -4,6 +4,15 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 from app_theme.dark_theme import ModernDarkTheme
 from tabs.common.shared_ui import SharedUI
+from .matrix_grid import MatrixGrid
+
+
+# Ετικέτες μεθόδων επίλυσης χωρητικότητας -> όρισμα method του ChannelModel
+# (η πρώτη είναι η προεπιλογή: το cvxpy, που δέχεται και πίνακες με στήλες εκτός κατανομής)
+CAPACITY_METHOD_LABELS = {
+    "cvxpy": 'cvxpy',
+    "Blahut–Arimoto": 'blahut_arimoto',
+}
 
 
 class ChannelView(SharedUI):
@@ -19,7 +28,7 @@ class ChannelView(SharedUI):
         self._create_matrix_subtab()
         self._create_chain_subtab()
 
-        self.matrix_entries = []
+        self.matrix_grid = None
         self.chain_matrices = []
         self.chain_frames = []
 
@@ -75,11 +84,19 @@ class ChannelView(SharedUI):
         self.calc_capacity_btn = self._button(f, "Υπολογισμός Χωρητικότητας", color=ModernDarkTheme.BG_LIGHT_ORANGE)
         self.calc_capacity_btn.grid(row=3, column=2, padx=6, pady=4)
 
+        self._label(f, "Μέθοδος επίλυσης:", 4, 0)
+        self.method_combo = self._method_combo(f)
+        self.method_combo.grid(row=4, column=1, padx=6, pady=4, sticky="w")
+
+        self.capacity_status = self._task_status(f)
+        self.capacity_status.grid(row=4, column=2, padx=6, pady=4, sticky="w")
+
         self.matrix_result = self._scrolled(f, 14)
-        self.matrix_result.grid(row=4, column=0, columnspan=3, padx=6, pady=6, sticky="nsew")
+        self.matrix_result.grid(row=5, column=0, columnspan=3, padx=6, pady=6, sticky="nsew")
 
         f.grid_columnconfigure(1, weight=1)
-        f.grid_rowconfigure(4, weight=1)
+        f.grid_rowconfigure(2, weight=1)
+        f.grid_rowconfigure(5, weight=1)
 
     def _create_chain_subtab(self):
         f = tk.Frame(self.notebook, bg=ModernDarkTheme.BG_FRAME)
@@ -114,8 +131,15 @@ class ChannelView(SharedUI):
         self.m_chain_entry = self._entry(calc_frame, width=8, default="2")
         self.m_chain_entry.grid(row=0, column=1, padx=4)
 
+        self._label(calc_frame, "Μέθοδος:", 0, 2)
+        self.chain_method_combo = self._method_combo(calc_frame)
+        self.chain_method_combo.grid(row=0, column=3, padx=4)
+
         self.calc_chain_btn = self._button(calc_frame, "Υπολογισμός Αλυσίδας", color=ModernDarkTheme.BG_LIGHT_ORANGE)
-        self.calc_chain_btn.grid(row=0, column=2, padx=6, pady=4)
+        self.calc_chain_btn.grid(row=0, column=4, padx=6, pady=4)
+
+        self.chain_status = self._task_status(calc_frame)
+        self.chain_status.grid(row=1, column=0, columnspan=5, padx=6, pady=2)
 
         self.chain_result = self._scrolled(f, 16)
         self.chain_result.grid(row=4, column=0, columnspan=3, padx=6, pady=6, sticky="nsew")
@@ -123,30 +147,20 @@ class ChannelView(SharedUI):
         f.grid_columnconfigure(0, weight=1)
         f.grid_rowconfigure(4, weight=1)
 
+    def _method_combo(self, parent):
+        combo = ttk.Combobox(parent, values=list(CAPACITY_METHOD_LABELS), width=16, state="readonly")
+        combo.current(0)
+        return combo
+
+    def get_capacity_method(self, combo):
+        return CAPACITY_METHOD_LABELS[combo.get()]
+
     def create_matrix_grid(self, rows, cols):
         for widget in self.matrix_frame.winfo_children():
             widget.destroy()
-        self.matrix_entries = []
-
-        tk.Label(self.matrix_frame, text="P(Y|X)", bg=ModernDarkTheme.BG_FRAME, fg=ModernDarkTheme.BG_BLUISH,
-                 font=("Consolas", 10, "bold")).grid(row=0, column=0, padx=4, pady=4)
 
-        for j in range(cols):
-            tk.Label(self.matrix_frame, text=f"Y{j + 1}", bg=ModernDarkTheme.BG_FRAME, fg=ModernDarkTheme.BG_BLUISH,
-                     font=("Consolas", 9, "bold")).grid(row=0, column=j + 1, padx=2)
-
-        for i in range(rows):
-            tk.Label(self.matrix_frame, text=f"X{i + 1}", bg=ModernDarkTheme.BG_FRAME, fg=ModernDarkTheme.BG_BLUISH,
-                     font=("Consolas", 9, "bold")).grid(row=i + 1, column=0, padx=4)
-
-            row_entries = []
-            for j in range(cols):
-                entry = tk.Entry(self.matrix_frame, width=7, bg=ModernDarkTheme.BG_FRAME, fg=ModernDarkTheme.WHITE_TEXT,
-                                 font=("Consolas", 9), justify='center', insertbackground=ModernDarkTheme.WHITE_TEXT)
-                entry.insert(0, f"{1.0 / cols:.2f}")
-                entry.grid(row=i + 1, column=j + 1, padx=2, pady=2)
-                row_entries.append(entry)
-            self.matrix_entries.append(row_entries)
+        self.matrix_grid = MatrixGrid(self.matrix_frame, rows, cols)
+        self.matrix_grid.pack(fill=tk.BOTH, expand=True)
 
     def create_chain_matrices(self, num_matrices):
         for widget in self.chain_container.winfo_children():
@@ -181,7 +195,7 @@ class ChannelView(SharedUI):
                 'rows_entry': rows_entry,
                 'cols_entry': cols_entry,
                 'grid_container': grid_container,
-                'matrix_entries': []
+                'grid': None
             })
 
             create_btn = self._button(dims_frame, "Δημιουργία", color=ModernDarkTheme.BG_BLUISH)
@@ -202,17 +216,8 @@ class ChannelView(SharedUI):
             for widget in frame_data['grid_container'].winfo_children():
                 widget.destroy()
 
-            frame_data['matrix_entries'] = []
-
-            for i in range(rows):
-                row_entries = []
-                for j in range(cols):
-                    entry = tk.Entry(frame_data['grid_container'], width=8, bg=ModernDarkTheme.BG_ENTRY,fg=ModernDarkTheme.WHITE_TEXT, font=("Consolas", 9), justify='center',
-                                     insertbackground=ModernDarkTheme.WHITE_TEXT)
-                    entry.insert(0, f"{1.0 / cols:.2f}")
-                    entry.grid(row=i, column=j, padx=2, pady=2)
-                    row_entries.append(entry)
-                frame_data['matrix_entries'].append(row_entries)
+            frame_data['grid'] = MatrixGrid(frame_data['grid_container'], rows, cols, height=150, width=520)
+            frame_data['grid'].pack(fill=tk.BOTH, expand=True)
 
             return True, ""
         except ValueError:
@@ -243,10 +248,10 @@ class ChannelView(SharedUI):
     def display_matrix_creation_success(self, rows, cols):
         self.matrix_result.delete("1.0", tk.END)
         self.matrix_result.insert(tk.END, f"Ο Πίνακας {rows}×{cols} δημιουργήθηκε με επιτυχία!\n\n")
-        self.matrix_result.insert(tk.END, "Σημείωση: Κάθε γραμμή πρέπει να αθροίζει σε 1\n")
+        self.matrix_result.insert(tk.END, "Σημείωση: Κάθε στήλη (η κατανομή P(Y|X=x)) πρέπει να αθροίζει σε 1\n")
         self.matrix_result.insert(tk.END, "Πίνακας P(Y|X)\n")
 
-    def display_capacity_result(self, P_YX, m, capacity):
+    def display_capacity_result(self, P_YX, m, capacity, solve_info=None):
         self.matrix_result.delete("1.0", tk.END)
         self.matrix_result.insert(tk.END, "--- Αποτελέσματα ---\n")
         self.matrix_result.insert(tk.END, "\nΧωρητικότητα Διαύλου\n")
@@ -254,13 +259,31 @@ class ChannelView(SharedUI):
         self.matrix_result.insert(tk.END, f"{P_YX}\n\n")
         self.matrix_result.insert(tk.END, f"M = {m}\n\n")
         self.matrix_result.insert(tk.END, f"Χωρητικότητα: C = {capacity:.4f} bits/symbol\n\n")
+        self.matrix_result.insert(tk.END, self._solve_info_text(solve_info))
+
+    @staticmethod
+    def _solve_info_text(solve_info):
+        """Όρια, σύγκλιση και προειδοποιήσεις της επίλυσης (ChannelModel.last_solve_info)"""
+        if not solve_info:
+            return ""
+        lines = []
+        if 'lower_bound' in solve_info:
+            lines.append(f"Όρια: {solve_info['lower_bound']:.6f} ≤ C ≤ {solve_info['upper_bound']:.6f} "
+                         f"({solve_info['iterations']} επαναλήψεις)")
+            if not solve_info.get('converged', True):
+                lines.append("ΠΡΟΣΟΧΗ: Ο Blahut–Arimoto δεν συνέκλινε· η τιμή είναι μόνο κάτω όριο της χωρητικότητας")
+        if solve_info.get('status') not in (None, 'optimal'):
+            lines.append(f"ΠΡΟΣΟΧΗ: Κατάσταση επίλυσης cvxpy: {solve_info['status']}")
+        if solve_info.get('warning'):
+            lines.append(f"ΠΡΟΣΟΧΗ: {solve_info['warning']}")
+        return "".join(line + "\n" for line in lines)
 
     def display_chain_frames_created(self, num_matrices):
         self.chain_result.delete("1.0", tk.END)
         self.chain_result.insert(tk.END, f"Δημιουργήθηκαν {num_matrices} πλαίσια πινάκων!\n\n")
         self.chain_result.insert(tk.END, "Ορίστε διαστάσεις και πατήστε 'Δημιουργία'\nγια κάθε πίνακα.\n")
 
-    def display_chain_result(self, matrices, P_combined, m, capacity):
+    def display_chain_result(self, matrices, P_combined, m, capacity, chain_stats=None, solve_info=None):
         self.chain_result.delete("1.0", tk.END)
         self.chain_result.insert(tk.END, "--- Αποτελέσματα ---\n")
         self.chain_result.insert(tk.END, "\nΑΛΥΣΙΔΑ ΚΑΝΑΛΙΩΝ\n")
@@ -271,5 +294,10 @@ class ChannelView(SharedUI):
 
         self.chain_result.insert(tk.END, "Τελικός Πίνακας (P₁ × P₂ × ..... × Pₙ):\n")
         self.chain_result.insert(tk.END, f"{P_combined}\n\n")
+        if chain_stats:
+            self.chain_result.insert(tk.END, f"Σειρά πολλαπλασιασμών: {chain_stats['order']}\n")
+            self.chain_result.insert(tk.END, f"FLOPs: {chain_stats['flops']} "
+                                             f"(εξοικονόμηση {chain_stats['saved_flops']} από {chain_stats['naive_flops']})\n\n")
         self.chain_result.insert(tk.END, f"M = {m}\n\n")
         self.chain_result.insert(tk.END, f"Χωρητικότητα Αλυσίδας: C = {capacity:.4f} bits/symbol\n\n")
+        self.chain_result.insert(tk.END, self._solve_info_text(solve_info))
@@ -0,0 +1,287 @@
+"""Virtualized πλέγμα πίνακα για το Channel tab (ένας καμβάς αντί για ένα tk.Entry ανά κελί)"""
+
+import re
+import tkinter as tk
+from tkinter import filedialog, messagebox
+import numpy as np
+from app_theme.dark_theme import ModernDarkTheme
+
+
+class MatrixGrid(tk.Frame):
+    """
+    Πλέγμα πίνακα που αποθηκεύει τις τιμές σε NumPy array και σχεδιάζει μόνο τα ορατά κελιά.
+
+    Click σε κελί ανοίγει ένα μοναδικό Entry επεξεργασίας (Enter: κάτω, Tab: δεξιά, Esc: ακύρωση).
+    Ctrl+V ή το κουμπί "Επικόλληση" επικολλά πίνακα από το clipboard (στήλες με tab/κόμμα/κενό)
+    ξεκινώντας από το επιλεγμένο κελί, ενώ το "Φόρτωση..." διαβάζει .npy/.csv αρχείο.
+    Το πλέγμα μεγαλώνει αυτόματα όταν τα δεδομένα δεν χωρούν.
+    """
+
+    CELL_W = 64
+    CELL_H = 24
+    HEADER_W = 48
+    HEADER_H = 22
+
+    def __init__(self, parent, rows, cols, height=260, width=640):
+        super().__init__(parent, bg=ModernDarkTheme.BG_FRAME)
+        self.data = np.full((rows, cols), 1.0 / cols)
+        self.current = (0, 0)
+        self._editor = None
+
+        toolbar = tk.Frame(self, bg=ModernDarkTheme.BG_FRAME)
+        toolbar.grid(row=0, column=0, columnspan=2, sticky="w")
+        for text, command in (("Επικόλληση", self.paste_from_clipboard), ("Φόρτωση...", self.load_from_dialog)):
+            tk.Button(toolbar, text=text, command=command, bg=ModernDarkTheme.BG_ENTRY,
+                      fg=ModernDarkTheme.WHITE_TEXT, font=("Consolas", 9)).pack(side=tk.LEFT, padx=2, pady=2)
+        self.shape_label = tk.Label(toolbar, bg=ModernDarkTheme.BG_FRAME, fg=ModernDarkTheme.BG_BLUISH,
+                                    font=("Consolas", 9, "bold"))
+        self.shape_label.pack(side=tk.LEFT, padx=8)
+
+        self.canvas = tk.Canvas(self, bg=ModernDarkTheme.BG_FRAME, highlightthickness=0,
+                                height=height, width=width)
+        self.canvas.grid(row=1, column=0, sticky="nsew")
+        ybar = tk.Scrollbar(self, orient=tk.VERTICAL, command=self._yview)
+        ybar.grid(row=1, column=1, sticky="ns")
+        xbar = tk.Scrollbar(self, orient=tk.HORIZONTAL, command=self._xview)
+        xbar.grid(row=2, column=0, sticky="ew")
+        self.canvas.config(xscrollcommand=xbar.set, yscrollcommand=ybar.set)
+        self.grid_rowconfigure(1, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self.canvas.bind("<Configure>", lambda e: self.redraw())
+        self.canvas.bind("<Button-1>", self._on_click)
+        self.canvas.bind("<MouseWheel>", self._on_wheel)
+        self.canvas.bind("<Button-4>", lambda e: self._yview("scroll", -1, "units"))
+        self.canvas.bind("<Button-5>", lambda e: self._yview("scroll", 1, "units"))
+        self.canvas.bind("<Control-v>", lambda e: self.paste_from_clipboard())
+        self._update_scrollregion()
+
+    # ──────────────────────────────────────────────────────────────────
+    # Δεδομένα
+    # ──────────────────────────────────────────────────────────────────
+
+    def get_matrix(self):
+        self._commit_edit()
+        return self.data.copy()
+
+    def set_matrix(self, matrix, row=0, col=0):
+        """Γράφει τον πίνακα ξεκινώντας από το κελί (row, col), μεγαλώνοντας το πλέγμα αν χρειάζεται."""
+        matrix = np.atleast_2d(np.asarray(matrix, dtype=float))
+        if matrix.ndim != 2:
+            raise ValueError(f"Αναμενόταν 2-D πίνακας, δόθηκε σχήμα {matrix.shape}")
+        self._commit_edit()
+        rows = max(self.data.shape[0], row + matrix.shape[0])
+        cols = max(self.data.shape[1], col + matrix.shape[1])
+        if (rows, cols) != self.data.shape:
+            grown = np.zeros((rows, cols))
+            grown[:self.data.shape[0], :self.data.shape[1]] = self.data
+            self.data = grown
+        self.data[row:row + matrix.shape[0], col:col + matrix.shape[1]] = matrix
+        self._update_scrollregion()
+
+    def paste_from_clipboard(self):
+        try:
+            text = self.clipboard_get()
+        except tk.TclError:
+            messagebox.showerror("Σφάλμα", "Το clipboard είναι άδειο!")
+            return
+        try:
+            self.set_matrix(parse_matrix_text(text), *self.current)
+        except ValueError as e:
+            messagebox.showerror("Σφάλμα", str(e))
+
+    def load_from_dialog(self):
+        path = filedialog.askopenfilename(filetypes=[("Πίνακες", "*.npy *.csv *.txt"), ("Όλα", "*.*")])
+        if not path:
+            return
+        try:
+            matrix = load_matrix_file(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Σφάλμα", f"Αποτυχία φόρτωσης: {e}")
+            return
+        self._close_editor()
+        self.data = np.zeros((0, 0))
+        self.current = (0, 0)
+        self.set_matrix(matrix)
+
+    # ──────────────────────────────────────────────────────────────────
+    # Σχεδίαση μόνο των ορατών κελιών
+    # ──────────────────────────────────────────────────────────────────
+
+    def redraw(self):
+        c = self.canvas
+        c.delete("cell")
+        rows, cols = self.data.shape
+        x0, y0 = c.canvasx(0), c.canvasy(0)
+        width, height = c.winfo_width(), c.winfo_height()
+
+        first_col = max(0, int((x0 - self.HEADER_W) // self.CELL_W))
+        last_col = min(cols, int((x0 + width - self.HEADER_W) // self.CELL_W) + 1)
+        first_row = max(0, int((y0 - self.HEADER_H) // self.CELL_H))
+        last_row = min(rows, int((y0 + height - self.HEADER_H) // self.CELL_H) + 1)
+
+        font = ("Consolas", 9)
+        for i in range(first_row, last_row):
+            y = self.HEADER_H + i * self.CELL_H
+            for j in range(first_col, last_col):
+                x = self.HEADER_W + j * self.CELL_W
+                value = self.data[i, j]
+                selected = (i, j) == self.current
+                c.create_rectangle(x + 1, y + 1, x + self.CELL_W - 1, y + self.CELL_H - 1, tags="cell",
+                                   fill=ModernDarkTheme.BG_ENTRY,
+                                   outline=ModernDarkTheme.BG_BLUISH if selected else ModernDarkTheme.BG_FRAME)
+                valid = np.isfinite(value) and 0 <= value <= 1
+                c.create_text(x + self.CELL_W / 2, y + self.CELL_H / 2, tags="cell", font=font,
+                              text=f"{value:.4g}" if np.isfinite(value) else "?",
+                              fill=ModernDarkTheme.WHITE_TEXT if valid else ModernDarkTheme.BG_LIGHT_ORANGE)
+
+        # Οι κεφαλίδες σχεδιάζονται στην άκρη της ορατής περιοχής, ώστε να μένουν σταθερές
+        bold = ("Consolas", 9, "bold")
+        c.create_rectangle(x0, y0, x0 + width, y0 + self.HEADER_H, tags="cell",
+                           fill=ModernDarkTheme.BG_FRAME, outline="")
+        c.create_rectangle(x0, y0, x0 + self.HEADER_W, y0 + height, tags="cell",
+                           fill=ModernDarkTheme.BG_FRAME, outline="")
+        for j in range(first_col, last_col):
+            x = self.HEADER_W + j * self.CELL_W + self.CELL_W / 2
+            c.create_text(x, y0 + self.HEADER_H / 2, text=f"Y{j + 1}", tags="cell",
+                          fill=ModernDarkTheme.BG_BLUISH, font=bold)
+        for i in range(first_row, last_row):
+            y = self.HEADER_H + i * self.CELL_H + self.CELL_H / 2
+            c.create_text(x0 + self.HEADER_W / 2, y, text=f"X{i + 1}", tags="cell",
+                          fill=ModernDarkTheme.BG_BLUISH, font=bold)
+        c.create_text(x0 + self.HEADER_W / 2, y0 + self.HEADER_H / 2, text="P(Y|X)", tags="cell",
+                      fill=ModernDarkTheme.BG_BLUISH, font=("Consolas", 8, "bold"))
+        if self._editor is not None:
+            c.tag_raise("editor")
+
+    def _update_scrollregion(self):
+        rows, cols = self.data.shape
+        self.canvas.config(scrollregion=(0, 0, self.HEADER_W + cols * self.CELL_W,
+                                         self.HEADER_H + rows * self.CELL_H))
+        self.shape_label.config(text=f"{rows}×{cols}")
+        self.redraw()
+
+    def _xview(self, *args):
+        self._commit_edit()
+        self.canvas.xview(*args)
+        self.redraw()
+
+    def _yview(self, *args):
+        self._commit_edit()
+        self.canvas.yview(*args)
+        self.redraw()
+
+    def _on_wheel(self, event):
+        self._yview("scroll", -1 if event.delta > 0 else 1, "units")
+
+    # ──────────────────────────────────────────────────────────────────
+    # Επεξεργασία κελιού
+    # ──────────────────────────────────────────────────────────────────
+
+    def _on_click(self, event):
+        self.canvas.focus_set()
+        x, y = self.canvas.canvasx(event.x), self.canvas.canvasy(event.y)
+        i = int((y - self.HEADER_H) // self.CELL_H)
+        j = int((x - self.HEADER_W) // self.CELL_W)
+        if 0 <= i < self.data.shape[0] and 0 <= j < self.data.shape[1] \
+                and x >= self.HEADER_W and y >= self.HEADER_H:
+            self._edit(i, j)
+
+    def _edit(self, i, j):
+        self._commit_edit()
+        self.current = (i, j)
+        self._scroll_into_view(i, j)
+        x = self.HEADER_W + j * self.CELL_W
+        y = self.HEADER_H + i * self.CELL_H
+        entry = tk.Entry(self.canvas, width=7, bg=ModernDarkTheme.BG_FRAME, fg=ModernDarkTheme.WHITE_TEXT,
+                         font=("Consolas", 9), justify='center', insertbackground=ModernDarkTheme.WHITE_TEXT)
+        value = self.data[i, j]
+        entry.insert(0, f"{value:.6g}" if np.isfinite(value) else "")
+        entry.select_range(0, tk.END)
+        entry.bind("<Return>", lambda e: self._move(1, 0))
+        entry.bind("<Tab>", lambda e: self._move(0, 1))
+        entry.bind("<Shift-Tab>", lambda e: self._move(0, -1))
+        entry.bind("<Escape>", lambda e: self._close_editor())
+        entry.bind("<FocusOut>", lambda e: self._commit_edit() if self._editor and self._editor[0] is entry else None)
+        entry.bind("<Control-v>", lambda e: self._paste_from_editor())
+        self._editor = (entry, i, j)
+        self.canvas.create_window(x + 1, y + 1, window=entry, anchor="nw", tags="editor",
+                                  width=self.CELL_W - 2, height=self.CELL_H - 2)
+        self.redraw()
+        entry.focus_set()
+
+    def _move(self, di, dj):
+        i, j = self.current
+        self._commit_edit()
+        rows, cols = self.data.shape
+        if dj and not 0 <= j + dj < cols:  # Tab στο τέλος γραμμής -> επόμενη γραμμή
+            i, j = i + dj, (j + dj) % cols
+        else:
+            i, j = i + di, j + dj
+        self._edit(min(max(i, 0), rows - 1), min(max(j, 0), cols - 1))
+        return "break"
+
+    def _paste_from_editor(self):
+        self._close_editor()
+        self.paste_from_clipboard()
+        return "break"
+
+    def _commit_edit(self):
+        if self._editor is None:
+            return
+        entry, i, j = self._editor
+        text = entry.get().strip()
+        try:
+            self.data[i, j] = float(text)
+        except ValueError:
+            self.data[i, j] = np.nan
+        self._close_editor()
+
+    def _close_editor(self):
+        if self._editor is None:
+            return
+        entry = self._editor[0]
+        self._editor = None
+        self.canvas.delete("editor")
+        entry.destroy()
+        self.redraw()
+
+    def _scroll_into_view(self, i, j):
+        rows, cols = self.data.shape
+        total_w = self.HEADER_W + cols * self.CELL_W
+        total_h = self.HEADER_H + rows * self.CELL_H
+        x0, y0 = self.canvas.canvasx(0), self.canvas.canvasy(0)
+        width, height = self.canvas.winfo_width(), self.canvas.winfo_height()
+        x = self.HEADER_W + j * self.CELL_W
+        y = self.HEADER_H + i * self.CELL_H
+        if x < x0 + self.HEADER_W or x + self.CELL_W > x0 + width:
+            self.canvas.xview_moveto(max(0, x - self.HEADER_W) / total_w)
+        if y < y0 + self.HEADER_H or y + self.CELL_H > y0 + height:
+            self.canvas.yview_moveto(max(0, y - self.HEADER_H) / total_h)
+
+
+def parse_matrix_text(text):
+    """Πίνακας από κείμενο (γραμμές ανά νέα γραμμή, στήλες με tab, κόμμα, ερωτηματικό ή κενά)."""
+    lines = [line.strip() for line in text.strip().splitlines() if line.strip()]
+    if not lines:
+        raise ValueError("Δεν βρέθηκαν δεδομένα για επικόλληση!")
+    rows = [re.split(r"[\t,;\s]+", line) for line in lines]
+    if len({len(row) for row in rows}) != 1:
+        raise ValueError("Όλες οι γραμμές πρέπει να έχουν το ίδιο πλήθος τιμών!")
+    try:
+        return np.array(rows, dtype=float)
+    except ValueError:
+        raise ValueError("Τα δεδομένα περιέχουν μη αριθμητικές τιμές!")
+
+
+def load_matrix_file(path):
+    """Φορτώνει 2-D πίνακα από .npy ή κείμενο/CSV."""
+    if path.lower().endswith(".npy"):
+        matrix = np.load(path, allow_pickle=False)
+    else:
+        with open(path, encoding="utf-8") as f:
+            matrix = parse_matrix_text(f.read())
+    matrix = np.atleast_2d(matrix)
+    if matrix.ndim != 2:
+        raise ValueError(f"Αναμενόταν 2-D πίνακας, δόθηκε σχήμα {matrix.shape}")
+    return matrix.astype(float)
@@ -0,0 +1,175 @@
+"""
+Module με τον BackgroundExecutor που χρησιμοποιούν όλοι οι controllers για να εκτελούν
+χρονοβόρους υπολογισμούς εκτός του event loop του Tk
+"""
+
+import itertools
+import queue
+import threading
+import time
+
+
+class OperationCancelled(Exception):
+    """Σηκώνεται από το progress() μιας εργασίας που ακυρώθηκε ή αντικαταστάθηκε"""
+
+
+class BackgroundExecutor:
+    """
+    Εκτελεί εργασίες σε worker threads και επιστρέφει τα αποτελέσματα στο Tk μέσω root.after.
+
+    Κάθε εργασία έχει ένα κλειδί (π.χ. 'channel_capacity'). Νέα εργασία με το ίδιο κλειδί
+    αντικαθιστά την προηγούμενη: αν δεν έχει ξεκινήσει παραλείπεται, αν τρέχει ακυρώνεται
+    στο επόμενο progress() και σε κάθε περίπτωση το αποτέλεσμά της απορρίπτεται.
+
+    Κάθε lane (προεπιλογή: το κλειδί) έχει δικό της worker thread και οι εργασίες της
+    εκτελούνται μία-μία. Εργασίες που μοιράζονται ένα model δηλώνουν την ίδια lane, ώστε
+    τα models να μη χρειάζονται κλειδώματα, ενώ μια αργή εργασία (π.χ. επίλυση cvxpy) δεν
+    καθυστερεί τις εργασίες των άλλων lanes. Ένα βήμα που δεν καλεί progress() δεν
+    διακόπτεται: η ακύρωση απορρίπτει αμέσως το αποτέλεσμα, αλλά η lane μένει απασχολημένη
+    μέχρι να επιστρέψει. Γι' αυτό τέτοιες εργασίες υποβάλλονται με cancellable=False.
+    """
+
+    def __init__(self, root, poll_ms=50):
+        self.root = root
+        self.poll_ms = poll_ms
+        self._tokens = {}         # key -> token της πιο πρόσφατης εργασίας
+        self._cancel_events = {}  # key -> threading.Event της πιο πρόσφατης εργασίας
+        self._counter = itertools.count()
+        self._lanes = {}          # lane -> ουρά εργασιών του worker thread της
+        self._workers = {}        # lane -> worker thread
+        self._messages = queue.Queue()
+        self._callbacks = {}      # token -> (on_done, on_error, on_progress, status, on_cancel)
+        self._polling = False
+
+    def submit(self, key, fn, on_done=None, on_error=None, on_progress=None, status=None, on_cancel=None,
+               lane=None, cancellable=True):
+        """
+        Προγραμματίζει την fn(progress) στο worker thread.
+
+        Η fn καλεί progress(fraction, message) για ενημέρωση (fraction στο [0, 1] ή None),
+        το οποίο σηκώνει OperationCancelled όταν η εργασία ακυρωθεί. Μπορεί να καλείται
+        σε κάθε επανάληψη: οι ενημερώσεις προς το Tk περιορίζονται σε μία ανά poll_ms.
+        Τα on_done(result), on_error(exception), on_progress(fraction, message) καλούνται
+        στο thread του Tk, όπως και το on_cancel() όταν η εργασία ακυρωθεί ή αντικατασταθεί.
+        Το status (π.χ. TaskStatus) ενημερώνεται αυτόματα· με cancellable=False δεν εμφανίζει
+        κουμπί ακύρωσης. Η εργασία εκτελείται στο worker thread της lane (προεπιλογή: key).
+        """
+        self.cancel(key)
+        token = next(self._counter)
+        cancel_event = threading.Event()
+        self._tokens[key] = token
+        self._cancel_events[key] = cancel_event
+        self._callbacks[token] = (on_done, on_error, on_progress, status, on_cancel)
+
+        if status is not None:
+            status.start(cancel_command=(lambda: self.cancel(key)) if cancellable else None)
+
+        last_report = [0.0]
+
+        def progress(fraction=None, message=""):
+            if cancel_event.is_set():
+                raise OperationCancelled()
+            now = time.monotonic()
+            if now - last_report[0] >= self.poll_ms / 1000:
+                last_report[0] = now
+                self._messages.put(('progress', key, token, (fraction, message)))
+
+        self._lane(key if lane is None else lane).put((key, token, cancel_event, fn, progress))
+        self._schedule_poll()
+        return token
+
+    def cancel(self, key):
+        """Ακυρώνει την τρέχουσα εργασία του κλειδιού (το αποτέλεσμά της δεν θα εμφανιστεί)."""
+        token = self._tokens.pop(key, None)
+        event = self._cancel_events.pop(key, None)
+        if event is not None:
+            event.set()
+        if token is not None:
+            callbacks = self._callbacks.pop(token, None)
+            if callbacks is not None:
+                _, _, _, status, on_cancel = callbacks
+                if status is not None:
+                    status.finish("Ακυρώθηκε")
+                if on_cancel is not None:
+                    on_cancel()
+
+    def is_running(self, key):
+        return key in self._tokens
+
+    def shutdown(self, wait=False, timeout=None):
+        """
+        Ακυρώνει όλες τις εργασίες και τερματίζει τα worker threads. Με wait=True περιμένει
+        (το πολύ timeout δευτερόλεπτα συνολικά) να επιστρέψει η εργασία που τρέχει σε κάθε lane.
+        Επιστρέφει True αν όλα τα worker threads έχουν τερματιστεί.
+        """
+        for key in list(self._tokens):
+            self.cancel(key)
+        for tasks in self._lanes.values():
+            tasks.put(None)
+        if not wait:
+            return not any(worker.is_alive() for worker in self._workers.values())
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for worker in self._workers.values():
+            worker.join(None if deadline is None else max(deadline - time.monotonic(), 0.0))
+        return not any(worker.is_alive() for worker in self._workers.values())
+
+    def _lane(self, lane):
+        tasks = self._lanes.get(lane)
+        if tasks is None:
+            tasks = self._lanes[lane] = queue.Queue()
+            worker = self._workers[lane] = threading.Thread(target=self._run, args=(tasks,), daemon=True)
+            worker.start()
+        return tasks
+
+    def _run(self, tasks):
+        while True:
+            item = tasks.get()
+            if item is None:
+                return
+            key, token, cancel_event, fn, progress = item
+            if cancel_event.is_set():
+                continue
+            try:
+                self._messages.put(('done', key, token, fn(progress)))
+            except OperationCancelled:
+                pass
+            except Exception as e:
+                self._messages.put(('error', key, token, e))
+
+    def _schedule_poll(self):
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.poll_ms, self._poll)
+
+    def _poll(self):
+        while True:
+            try:
+                kind, key, token, payload = self._messages.get_nowait()
+            except queue.Empty:
+                break
+            if self._tokens.get(key) != token:
+                continue  # αποτέλεσμα εργασίας που ακυρώθηκε ή αντικαταστάθηκε
+            on_done, on_error, on_progress, status, _ = self._callbacks[token]
+            if kind == 'progress':
+                if status is not None:
+                    status.update(*payload)
+                if on_progress is not None:
+                    on_progress(*payload)
+                continue
+
+            del self._tokens[key], self._cancel_events[key], self._callbacks[token]
+            if kind == 'done':
+                if status is not None:
+                    status.finish("Ολοκληρώθηκε")
+                if on_done is not None:
+                    on_done(payload)
+            else:
+                if status is not None:
+                    status.finish("Σφάλμα")
+                if on_error is not None:
+                    on_error(payload)
+
+        if self._tokens:
+            self.root.after(self.poll_ms, self._poll)
+        else:
+            self._polling = False
@@ -3,9 +3,52 @@ Module που περιέχει την κλάση SharedUI που κληρωνο
 """
 
 import tkinter as tk
-from tkinter import scrolledtext  # Widget κειμένου με scrollbar
+from tkinter import ttk, scrolledtext  # Widget κειμένου με scrollbar
 from app_theme.dark_theme import ModernDarkTheme
 
+
+class TaskStatus(tk.Frame):
+    """
+    Γραμμή κατάστασης για εργασίες του BackgroundExecutor:
+    μπάρα προόδου, μήνυμα και κουμπί ακύρωσης.
+    """
+
+    def __init__(self, parent):
+        super().__init__(parent, bg=ModernDarkTheme.BG_FRAME)
+        self.bar = ttk.Progressbar(self, length=220, maximum=1.0)
+        self.bar.grid(row=0, column=0, padx=6, pady=2)
+        self.message = tk.Label(self, text="", bg=ModernDarkTheme.BG_FRAME,
+                                fg=ModernDarkTheme.WHITE_TEXT, font=("Consolas", 10))
+        self.message.grid(row=0, column=1, padx=6, sticky="w")
+        self.cancel_btn = tk.Button(self, text="Ακύρωση", bg=ModernDarkTheme.BG_LIGHT_ORANGE,
+                                    fg=ModernDarkTheme.WHITE_TEXT, font=("Consolas", 10, "bold"))
+        self.cancel_btn.grid(row=0, column=2, padx=6)
+        self.cancel_btn.grid_remove()
+
+    def start(self, cancel_command=None):
+        """Χωρίς cancel_command (εργασία που δεν διακόπτεται) το κουμπί ακύρωσης δεν εμφανίζεται"""
+        self.cancel_btn.config(command=cancel_command)
+        if cancel_command is None:
+            self.cancel_btn.grid_remove()
+        else:
+            self.cancel_btn.grid()
+        self.bar.config(mode="indeterminate")
+        self.bar.start(15)
+        self.message.config(text="Υπολογισμός...")
+
+    def update(self, fraction=None, message=""):
+        if fraction is not None:
+            self.bar.stop()
+            self.bar.config(mode="determinate", value=min(max(fraction, 0.0), 1.0))
+        if message:
+            self.message.config(text=message)
+
+    def finish(self, message=""):
+        self.bar.stop()
+        self.bar.config(mode="determinate", value=0.0)
+        self.message.config(text=message)
+        self.cancel_btn.grid_remove()
+
 class SharedUI:
     """
     Η βασική κλάση.
@@ -80,6 +123,15 @@ class SharedUI:
         )
         return btn
 
+    def _task_status(self, parent):
+        """
+        Δημιουργεί γραμμή κατάστασης (TaskStatus) για υπολογισμούς στο παρασκήνιο.
+
+        Παράμετροι:
+            parent: Γονικό widget
+        """
+        return TaskStatus(parent)
+
     def _entry(self, parent, width=10, default=""):
         """
         Δημιουργεί ένα παράθυρο εισαγωγής κειμένου.
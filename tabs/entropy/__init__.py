@@ -1,5 +1,7 @@
 from .entropy_model import EntropyModel
 from .entropy_view import EntropyView
 from .entropy_controller import EntropyController
+from .joint_histogram import JointHistogram
+from .sparse_distribution import SparseDistribution
 
-__all__ = ['EntropyModel', 'EntropyView', 'EntropyController']
+__all__ = ['EntropyModel', 'EntropyView', 'EntropyController', 'JointHistogram', 'SparseDistribution']
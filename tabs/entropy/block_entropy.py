@@ -0,0 +1,249 @@
+"""Εντροπίες μπλοκ H(Xⁿ) και εκτιμήσεις του ρυθμού εντροπίας από μετρήσεις n-grams"""
+import numpy as np
+from scipy.special import xlogy
+
+# Σύμβολα ανά τμήμα κατά την καταμέτρηση n-grams (η μνήμη ανά τμήμα είναι O(BLOCK_CHUNK_SYMBOLS))
+BLOCK_CHUNK_SYMBOLS = 2 ** 22
+
+# n-grams με χώρο κλειδιών ως αυτό μετρώνται με πυκνό np.bincount
+DENSE_KEY_SPACE = 2 ** 22
+
+# Πάνω από τόσα διαφορετικά n-grams οι ακριβείς μετρήσεις αντικαθίστανται από hashed
+MAX_DISTINCT_NGRAMS = 2 ** 23
+HASH_BUCKETS = 2 ** 23
+
+_HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+_ROLLING_HASH_PRIME = np.uint64(0x100000001B3)
+
+
+def _bucket(keys, buckets):
+    """Ανάμειξη (Fibonacci hashing) και αντιστοίχιση των κλειδιών σε buckets (δύναμη του 2)"""
+    shift = np.uint64(64 - int(buckets).bit_length() + 1)
+    return ((keys * _HASH_MULTIPLIER) >> shift).astype(np.intp)
+
+
+class BlockEntropyCounter:
+    """
+    Μετρά όλα τα n-grams για n = 1..k μιας ακολουθίας ακεραίων στο [0, alphabet_size),
+    τμήμα-τμήμα με update().
+
+    Κάθε n-gram γίνεται ένα uint64 κλειδί με κυλιόμενη αριθμητική key = key·A + x πάνω σε
+    ολόκληρους πίνακες NumPy. Για τα n με Aⁿ ≤ 2⁶⁴ τα κλειδιά είναι ακριβή και διατάσσονται
+    λεξικογραφικά, οπότε οι μετρήσεις κάθε μικρότερου n προκύπτουν με ακέραιη διαίρεση
+    (πρόθεμα) από εκείνες του μεγαλύτερου. Οι μικροί χώροι κλειδιών μετρώνται πυκνά με
+    bincount. Από τα υπόλοιπα ακριβή n κρατείται μόνο το μεγαλύτερο: κάθε τμήμα προσθέτει
+    ένα ταξινομημένο run (κλειδιά, μετρήσεις), και τα runs συγχωνεύονται με μία ταξινόμηση
+    μόνο όταν το συνολικό τους μέγεθος ξεπεράσει το max_distinct ή στο τέλος. Όταν τα
+    διαφορετικά n-grams ξεπεράσουν το max_distinct (ή όταν Aⁿ > 2⁶⁴), οι μετρήσεις γίνονται
+    σε σταθερό πλήθος hashed buckets και το αποτέλεσμα για αυτά τα n σημειώνεται ως
+    προσεγγιστικό (οι συγκρούσεις μειώνουν ελαφρά την εντροπία).
+    """
+
+    def __init__(self, k, alphabet_size, max_distinct=MAX_DISTINCT_NGRAMS, hash_buckets=HASH_BUCKETS):
+        if k <= 0:
+            raise ValueError("Το μέγιστο μήκος μπλοκ k πρέπει να είναι θετικό")
+        if alphabet_size <= 0:
+            raise ValueError("Το αλφάβητο πρέπει να έχει τουλάχιστον ένα σύμβολο")
+        self.k = k
+        self.alphabet_size = alphabet_size
+        self.max_distinct = max_distinct
+        self.hash_buckets = 1 << (int(hash_buckets) - 1).bit_length()
+        self.symbols = 0
+
+        # Μεγαλύτερο n με ακριβή κλειδιά uint64
+        self.exact_n = 1
+        while self.exact_n < k and alphabet_size ** (self.exact_n + 1) <= 2 ** 64:
+            self.exact_n += 1
+
+        self._tail = np.zeros(0, dtype=np.uint64)
+        # n -> ('dense', counts) | ('sparse', None) | ('hashed', counts). Οι μετρήσεις των sparse n
+        # βρίσκονται στα runs του μεγαλύτερου από αυτά (sparse_n) και προκύπτουν από εκεί στο τέλος
+        self._tables = {}
+        self._sparse_n = 0
+        self._runs = []
+        for n in range(1, k + 1):
+            if n <= self.exact_n and alphabet_size ** n <= DENSE_KEY_SPACE:
+                self._tables[n] = ('dense', np.zeros(alphabet_size ** n, dtype=np.int64))
+            elif n <= self.exact_n:
+                self._tables[n] = ('sparse', None)
+                self._sparse_n = n
+            else:
+                self._tables[n] = ('hashed', np.zeros(self.hash_buckets, dtype=np.int64))
+
+    def update(self, symbols):
+        symbols = np.asarray(symbols).ravel()
+        if symbols.size == 0:
+            return self
+        if symbols.min() < 0 or symbols.max() >= self.alphabet_size:
+            raise ValueError(f"Τα σύμβολα πρέπει να ανήκουν στο [0, {self.alphabet_size})")
+        self.symbols += symbols.size
+        data = np.concatenate([self._tail, symbols.astype(np.uint64)])
+        self._tail = data[max(data.size - (self.k - 1), 0):]
+        if data.size >= self.k:
+            self._count(data, data.size - self.k + 1)
+        return self
+
+    def block_entropies(self):
+        """
+        Επιστρέφει dict με τις εντροπίες μπλοκ H(Xⁿ) για n = 1..k (bits), τις διαφορές
+        H(Xⁿ) - H(Xⁿ⁻¹) (εκτιμήσεις του ρυθμού εντροπίας υπό συνθήκη), τα H(Xⁿ)/n,
+        το πλήθος των διαφορετικών n-grams και ποιες τιμές είναι προσεγγιστικές.
+        """
+        if self.symbols == 0:
+            raise ValueError("Δεν υπάρχουν σύμβολα για τον υπολογισμό")
+        entropies = np.full(self.k, np.nan)
+        distinct = np.zeros(self.k, dtype=np.int64)
+        approximate = np.zeros(self.k, dtype=bool)
+        for n, counts in self._final_counts().items():
+            total = counts.sum()
+            if total == 0:
+                continue  # η ακολουθία είναι μικρότερη από n σύμβολα
+            entropies[n - 1] = (np.log(total) - xlogy(counts, counts).sum() / total) / np.log(2) + 0.0
+            distinct[n - 1] = np.count_nonzero(counts)
+            approximate[n - 1] = self._tables[n][0] == 'hashed'
+        n = np.arange(1, self.k + 1)
+        return {
+            'n': n,
+            'block_entropies': entropies,
+            'conditional_entropies': np.diff(entropies, prepend=0.0),
+            'per_symbol': entropies / n,
+            'distinct': distinct,
+            'approximate': approximate,
+            'symbols': self.symbols,
+            'alphabet_size': self.alphabet_size,
+        }
+
+    def _count(self, data, starts):
+        """Μετρά τα n-grams που ξεκινούν στις θέσεις 0..starts-1 του data, για κάθε n."""
+        top = self.exact_n
+        keys = self._ngram_keys(data, starts, top)
+
+        for n in range(1, top + 1):
+            if self._tables[n][0] != 'sparse':
+                divisor = np.uint64(self.alphabet_size ** (top - n))
+                self._tables[n] = self._added(self._tables[n], keys // divisor, inplace=True)
+        if self._sparse_n:
+            # Τα προθέματα ταξινομημένων κλειδιών παραμένουν ταξινομημένα: ένα run ανά τμήμα
+            prefixes = np.sort(keys) // np.uint64(self.alphabet_size ** (top - self._sparse_n))
+            self._runs.append(_run_lengths(prefixes))
+            if sum(run_keys.size for run_keys, _ in self._runs) > self.max_distinct:
+                self._merge_runs()
+
+        # n-grams μεγαλύτερα από τα ακριβή κλειδιά: κυλιόμενο hash πάνω στο ακριβές κλειδί
+        hashed = keys
+        for n in range(top + 1, self.k + 1):
+            hashed = self._extend_hash(hashed, data, starts, n)
+            self._tables[n] = self._added(self._tables[n], hashed, inplace=True)
+
+    def _merge_runs(self):
+        """
+        Συγχωνεύει τα runs του sparse_n σε ένα. Όσο τα διαφορετικά n-grams ξεπερνούν το max_distinct,
+        το sparse_n περνά σε hashed μετρήσεις και τα runs αντικαθίστανται από τα προθέματά τους (n - 1).
+        """
+        keys, counts = _merged(self._runs)
+        while self._sparse_n and keys.size > self.max_distinct:
+            # Έκρηξη του χώρου κλειδιών: συνέχεια με hashed μετρήσεις σταθερής μνήμης
+            hashed = ('hashed', np.zeros(self.hash_buckets, dtype=np.int64))
+            self._tables[self._sparse_n] = self._added(hashed, keys, counts, inplace=True)
+            self._sparse_n -= 1
+            if self._tables.get(self._sparse_n, ('dense',))[0] != 'sparse':
+                self._sparse_n = 0
+            else:
+                keys, counts = _prefix_counts(keys, counts, self.alphabet_size)
+        self._runs = [(keys, counts)] if self._sparse_n else []
+
+    def _ngram_keys(self, data, starts, n):
+        """Κλειδιά Σ x[i+j]·A^(n-1-j) των n-grams που ξεκινούν στις θέσεις 0..starts-1"""
+        A = np.uint64(self.alphabet_size)
+        keys = data[:starts].copy()
+        for j in range(1, n):
+            keys *= A
+            keys += data[j:starts + j]
+        return keys
+
+    @staticmethod
+    def _extend_hash(hashed, data, starts, n):
+        """Hash του n-gram από το hash του (n-1)-gram που ξεκινά στην ίδια θέση"""
+        return hashed * _ROLLING_HASH_PRIME + data[n - 1:starts + n - 1] + np.uint64(1)
+
+    def _added(self, entry, keys, counts=None, inplace=False):
+        """
+        Πίνακας μετρήσεων με τα keys να προστίθενται counts φορές (από μία αν counts=None).
+        Οι πυκνοί/hashed πίνακες ενημερώνονται επί τόπου μόνο με inplace=True.
+        """
+        kind, table = entry
+        if kind in ('dense', 'hashed'):
+            index = keys.astype(np.intp) if kind == 'dense' else _bucket(keys, self.hash_buckets)
+            added = np.bincount(index, weights=counts, minlength=table.size)
+            if counts is not None:
+                added = np.rint(added).astype(np.int64)
+            if inplace:
+                table += added
+                return entry
+            return kind, table + added
+
+        # sparse (μόνο για τα n-grams του τέλους): συγχώνευση με τα κλειδιά του πίνακα
+        keys, counts = _merged([table, np.unique(keys, return_counts=True)])
+        if keys.size > self.max_distinct:
+            return self._added(('hashed', np.zeros(self.hash_buckets, dtype=np.int64)), keys, counts)
+        return 'sparse', (keys, counts)
+
+    def _final_counts(self):
+        """Οι πίνακες πλήθους, μαζί με τα n-grams που ξεκινούν στα τελευταία k-1 σύμβολα."""
+        if self._sparse_n:
+            self._merge_runs()
+        tables = dict(self._tables)
+        if self._sparse_n:
+            # Μετρήσεις κάθε μικρότερου sparse n από τα προθέματα του μεγαλύτερου
+            keys, counts = self._runs[0]
+            for n in range(self._sparse_n, 0, -1):
+                if tables[n][0] != 'sparse':
+                    break
+                tables[n] = ('sparse', (keys, counts))
+                keys, counts = _prefix_counts(keys, counts, self.alphabet_size)
+
+        tail = self._tail
+        result = {}
+        keys = None
+        for n in range(1, self.k + 1):
+            entry = tables[n]
+            extra = tail.size - n + 1
+            if extra > 0:
+                if n <= self.exact_n:
+                    keys = self._ngram_keys(tail, extra, n)
+                else:
+                    keys = self._extend_hash(keys[:extra], tail, extra, n)
+                entry = self._added(entry, keys)
+            kind, table = entry
+            result[n] = table[1] if kind == 'sparse' else table
+        return result
+
+
+def _run_lengths(sorted_keys):
+    """(διακριτά κλειδιά, πλήθος) ενός ταξινομημένου πίνακα κλειδιών"""
+    if sorted_keys.size == 0:
+        return sorted_keys, np.zeros(0, dtype=np.int64)
+    starts = np.concatenate([[0], np.flatnonzero(sorted_keys[1:] != sorted_keys[:-1]) + 1])
+    return sorted_keys[starts], np.diff(np.append(starts, sorted_keys.size))
+
+
+def _merged(runs):
+    """Ένα ταξινομημένο (κλειδιά, μετρήσεις) από ταξινομημένα runs (η σταθερή ταξινόμηση συγχωνεύει runs)"""
+    keys = np.concatenate([run_keys for run_keys, _ in runs]) if runs else np.zeros(0, dtype=np.uint64)
+    counts = np.concatenate([run_counts for _, run_counts in runs]) if runs else np.zeros(0, dtype=np.int64)
+    if len(runs) > 1:
+        order = np.argsort(keys, kind='stable')
+        keys, counts = keys[order], counts[order]
+    if keys.size == 0:
+        return keys.astype(np.uint64), counts.astype(np.int64)
+    starts = np.concatenate([[0], np.flatnonzero(keys[1:] != keys[:-1]) + 1])
+    return keys[starts], np.add.reduceat(counts, starts).astype(np.int64)
+
+
+def _prefix_counts(keys, counts, alphabet_size):
+    """Μετρήσεις των (n-1)-grams από τις ταξινομημένες μετρήσεις των n-grams (πρόθεμα = key // A)"""
+    if keys.size == 0:
+        return keys, counts
+    prefixes = keys // np.uint64(alphabet_size)
+    starts = np.concatenate([[0], np.flatnonzero(prefixes[1:] != prefixes[:-1]) + 1])
+    return prefixes[starts], np.add.reduceat(counts, starts)
@@ -0,0 +1,149 @@
+"""Εντροπία απευθείας από ακέραια πλήθη εμφανίσεων, με πίνακα τιμών n·log2 n"""
+import threading
+import numpy as np
+from scipy.special import xlogy
+
+# Ο πίνακας n·log2 n μεγαλώνει (σε δυνάμεις του 2) μέχρι αυτό το μέγεθος (512 KB). Μεγαλύτερα
+# πλήθη υπολογίζονται απευθείας με log2, αφού είναι λίγα σε σχέση με τα bins του ιστογράμματος.
+MAX_NLOGN_TABLE = 2 ** 16
+
+
+class NLogNTable:
+    """Πίνακας τιμών f(n) = n·log2 n (f(0) = 0) που μεγαλώνει μόνο όταν χρειαστεί μεγαλύτερο n"""
+
+    def __init__(self, size=1024, max_size=MAX_NLOGN_TABLE):
+        self.max_size = max_size
+        self.values = np.zeros(0)
+        self._lock = threading.Lock()
+        self.grow(size)
+
+    def grow(self, size):
+        """Εξασφαλίζει ότι ο πίνακας καλύπτει τα n < size (έως max_size) και τον επιστρέφει"""
+        size = min(size, self.max_size)
+        # Τοπικό αντίγραφο της αναφοράς: εργασίες σε άλλα threads μπορεί να μεγαλώνουν τον πίνακα ταυτόχρονα.
+        # Η επέκταση υπολογίζεται εκτός lock, η δημοσίευση γίνεται με lock ώστε να κρατείται πάντα ο
+        # μεγαλύτερος πίνακας (ένας μικρότερος από άλλο thread δεν τον αντικαθιστά)
+        values = self.values
+        if size > values.size:
+            size = min(1 << (size - 1).bit_length(), self.max_size)
+            n = np.arange(values.size, size, dtype=np.float64)
+            values = np.concatenate([values, xlogy(n, n) / np.log(2)])
+            with self._lock:
+                if values.size > self.values.size:
+                    self.values = values
+                else:
+                    values = self.values
+        return values
+
+    def __call__(self, counts):
+        """f(n) για κάθε στοιχείο ενός πίνακα μη αρνητικών ακεραίων"""
+        counts = np.asarray(counts)
+        if counts.size == 0:
+            return np.zeros(counts.shape)
+        table = self.grow(int(counts.max()) + 1)
+        if counts.max() < table.size:
+            return table[counts]
+        small = counts < table.size
+        result = np.empty(counts.shape)
+        result[small] = table[counts[small]]
+        large = counts[~small].astype(np.float64)
+        result[~small] = large * np.log2(large)
+        return result
+
+
+# Κοινός πίνακας για όλους τους υπολογισμούς της εφαρμογής
+NLOGN = NLogNTable()
+
+
+def nlogn_values(size):
+    """Πίνακας f(n) για όλα τα n < size: ο κοινός αν το size χωρά σε αυτόν, αλλιώς ένας νέος"""
+    if size <= NLOGN.max_size:
+        return NLOGN.grow(size)
+    return NLogNTable(size, max_size=size).values
+
+
+def count_entropy(counts, axis=-1, table=NLOGN):
+    """
+    H = log2 N - (1/N) Σ n_i log2 n_i (bits) για ακέραια πλήθη κατά μήκος του axis.
+    Οι λογάριθμοι των πληθών έρχονται από τον πίνακα, οπότε ανά κλήση υπολογίζεται
+    μόνο το log2 N κάθε ιστογράμματος.
+    """
+    counts = np.asarray(counts)
+    if not np.issubdtype(counts.dtype, np.integer):
+        raise ValueError("Τα πλήθη εμφανίσεων πρέπει να είναι ακέραιοι")
+    if counts.size and counts.min() < 0:
+        raise ValueError("Τα πλήθη εμφανίσεων πρέπει να είναι μη αρνητικά")
+    N = counts.sum(axis=axis)
+    if np.any(N == 0):
+        raise ValueError("Δεν υπάρχουν σύμβολα για τον υπολογισμό της εντροπίας")
+    return np.log2(N) - table(counts).sum(axis=axis) / N + 0.0
+
+
+class CountEntropy:
+    """
+    Ιστόγραμμα που διατηρεί το N και το S = Σ n_i log2 n_i, ώστε η εντροπία
+    H = log2 N - S/N να είναι διαθέσιμη σε O(1) μετά από κάθε μεταβολή.
+
+    Το update(bins, deltas) αλλάζει λίγα bins με κόστος ανάλογο του πλήθους τους
+    (όχι του αλφαβήτου). Το add()/remove() είναι η βαθμωτή εκδοχή για ένα σύμβολο.
+    """
+
+    def __init__(self, counts=None, size=None, table=NLOGN):
+        if counts is None:
+            if size is None:
+                raise ValueError("Δώστε αρχικά πλήθη ή μέγεθος αλφαβήτου")
+            counts = np.zeros(size, dtype=np.int64)
+        counts = np.array(counts, dtype=np.int64).ravel()
+        if counts.size and counts.min() < 0:
+            raise ValueError("Τα πλήθη εμφανίσεων πρέπει να είναι μη αρνητικά")
+        self.table = table
+        self.counts = counts
+        self.N = int(counts.sum())
+        self.S = float(table(counts).sum())
+
+    @property
+    def entropy(self):
+        if self.N == 0:
+            return 0.0
+        return float(np.log2(self.N) - self.S / self.N) + 0.0
+
+    def update(self, bins, deltas=1):
+        """Προσθέτει deltas (θετικά ή αρνητικά) στα bins. Επαναλαμβανόμενα bins αθροίζονται."""
+        bins = np.asarray(bins, dtype=np.intp).ravel()
+        deltas = np.broadcast_to(np.asarray(deltas, dtype=np.int64), bins.shape)
+        if bins.size > 1:
+            bins, inverse = np.unique(bins, return_inverse=True)
+            deltas = np.bincount(inverse, weights=deltas).astype(np.int64)
+        old = self.counts[bins]
+        new = old + deltas
+        if new.size and new.min() < 0:
+            raise ValueError("Αρνητικό πλήθος εμφανίσεων μετά την ενημέρωση")
+        self.S += float(self.table(new).sum() - self.table(old).sum())
+        self.N += int(deltas.sum())
+        self.counts[bins] = new
+        return self.entropy
+
+    def add(self, symbol, count=1):
+        return self._change(symbol, count)
+
+    def remove(self, symbol, count=1):
+        return self._change(symbol, -count)
+
+    def _change(self, symbol, delta):
+        old = int(self.counts[symbol])
+        new = old + delta
+        if new < 0:
+            raise ValueError(f"Αρνητικό πλήθος εμφανίσεων για το σύμβολο {symbol}")
+        values = self.table.grow(max(old, new) + 1)
+        if max(old, new) < values.size:
+            self.S += values[new] - values[old]
+        else:
+            self.S += float(self.table(np.array([new]))[0] - self.table(np.array([old]))[0])
+        self.N += delta
+        self.counts[symbol] = new
+        return self.entropy
+
+    def resync(self):
+        """Υπολογίζει ξανά το S από τα πλήθη (για μακριές ακολουθίες ενημερώσεων)"""
+        self.N = int(self.counts.sum())
+        self.S = float(self.table(self.counts).sum())
@@ -1,23 +1,32 @@
+import pathlib
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import messagebox, filedialog
 import numpy as np
+from tabs.common.background import BackgroundExecutor
 
 
 class EntropyController:
     """Το Controller λειτουργεί ως μεσολαβητής μεταξύ του Model και του View"""
 
-    def __init__(self, model, view):
+    def __init__(self, model, view, executor=None):
         self.model = model
         self.view = view
+        self.executor = executor or BackgroundExecutor(view.frame)
         self._bind_commands()
 
     def _bind_commands(self):
         """Σύνδεση όλων των button σε μεθόδους"""
         self.view.calc_entropy_btn.config(command=self.handle_calc_entropy)
+        self.view.calc_file_entropy_btn.config(command=self.handle_calc_file_entropy)
         self.view.calc_kl_btn.config(command=self.handle_calc_kl)
         self.view.calc_joint_btn.config(command=self.handle_calc_joint_entropy)
         self.view.calc_mi_btn.config(command=self.handle_calc_mutual_info)
+        self.view.calc_mi_samples_btn.config(command=self.handle_calc_sample_information)
         self.view.calc_cond_btn.config(command=self.handle_calc_conditional)
+        self.view.calc_rolling_btn.config(command=self.handle_calc_rolling_entropy)
+        self.view.calc_block_text_btn.config(command=self.handle_calc_block_entropy_text)
+        self.view.calc_block_file_btn.config(command=self.handle_calc_block_entropy_file)
+        self.view.calc_profile_btn.config(command=self.handle_calc_profile)
 
 
     def handle_calc_entropy(self):
@@ -34,8 +43,8 @@ class EntropyController:
             self.view.result_text.insert(tk.END, "--- Αποτελέσματα ---\n")
             self.view.result_text.insert(tk.END, f"H(X) = {H:.4f} bits/symbol\n\n")
 
-            for i, val in enumerate(p, 1):
-                I = self.model.calculate_information(val)
+            information = self.model.calculate_information(np.array(p))
+            for i, (val, I) in enumerate(zip(p, information), 1):
                 self.view.result_text.insert(tk.END,f"P{i}={val:.3f} → I={I:.4f} bits\n")
 
         except ValueError:
@@ -43,7 +52,47 @@ class EntropyController:
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
+    def handle_calc_file_entropy(self, max_listed=32):
+        """Εμπειρική εντροπία αρχείου (στο παρασκήνιο, σε σταθερή μνήμη)"""
+        path = filedialog.askopenfilename(title="Επιλογή αρχείου")
+        if not path:
+            return
+        symbol_bits = self.view.get_symbol_bits()
+
+        def task(progress):
+            return self.model.calculate_file_entropy(path, symbol_bits, progress=progress)
+
+        self.executor.submit('entropy_file', task, status=self.view.file_entropy_status,
+                             on_done=lambda stats: self._display_file_entropy(path, stats, max_listed),
+                             on_error=lambda e: messagebox.showerror("Σφάλμα", str(e)))
+
+    def _display_file_entropy(self, path, stats, max_listed):
+        counts = stats['counts']
+        digits = stats['symbol_bits'] // 4
+
+        self.view.result_text.delete("1.0", tk.END)
+        self.view.result_text.insert(tk.END, "--- Εντροπία Αρχείου ---\n")
+        self.view.result_text.insert(tk.END, f"{path}\n")
+        self.view.result_text.insert(tk.END, f"Μέγεθος: {stats['bytes']:,} bytes, "
+                                             f"{stats['symbols']:,} σύμβολα των {stats['symbol_bits']} bits\n")
+        if stats['trailing_bytes']:
+            self.view.result_text.insert(tk.END, f"(τα τελευταία {stats['trailing_bytes']} bytes δεν σχηματίζουν σύμβολο)\n")
+        self.view.result_text.insert(tk.END, f"Χρόνος: {stats['seconds']:.3f} s ({stats['mb_per_s']:.1f} MB/s)\n\n")
+        self.view.result_text.insert(tk.END, f"H(X) = {stats['entropy']:.4f} bits/symbol "
+                                             f"(μέγιστη {stats['symbol_bits']} bits)\n")
+        self.view.result_text.insert(tk.END, f"Διαφορετικά σύμβολα: {np.count_nonzero(counts)}\n\n")
+
+        order = np.argsort(counts)[::-1][:max_listed]
+        for symbol in order[counts[order] > 0]:
+            self.view.result_text.insert(
+                tk.END, f"0x{symbol:0{digits}X}: n={counts[symbol]:,} P={stats['probabilities'][symbol]:.5f} "
+                        f"→ I={stats['self_information'][symbol]:.4f} bits\n")
+
     def handle_calc_kl(self):
+        # Κατανομές της μορφής "a:0.5 b:0.3 c:0.2" υπολογίζονται ως αραιές, χωρίς κοινό αλφάβητο
+        if ":" in self.view.P_entry.get() + self.view.Q_entry.get():
+            self.handle_calc_sparse_kl()
+            return
         try:
             P = [float(x) for x in self.view.P_entry.get().split()]
             Q = [float(x) for x in self.view.Q_entry.get().split()]
@@ -71,112 +120,257 @@ class EntropyController:
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
-    def handle_calc_joint_entropy(self):
+    def handle_calc_sparse_kl(self):
         try:
-            px = [float(x) for x in self.view.px_entry.get().split()]
-            py = [float(x) for x in self.view.py_entry.get().split()]
+            P = self._parse_sparse_distribution(self.view.P_entry.get())
+            Q = self._parse_sparse_distribution(self.view.Q_entry.get())
+            stats = self.model.compare_sparse_distributions(P, Q)
 
-            if not self.model.check_sum(px):
-                messagebox.showerror("Σφάλμα", "Το Px δεν αθροίζει σε 1!")
-                return
-            if not self.model.check_sum(py):
-                messagebox.showerror("Σφάλμα", "Το Py δεν αθροίζει σε 1!")
-                return
+            self.view.kl_result_text.delete("1.0", tk.END)
+            self.view.kl_result_text.insert(tk.END, "--- Αποτελέσματα (αραιές κατανομές) ---\n")
+            self.view.kl_result_text.insert(tk.END, f"Ένωση φορέων: {stats['support']} σύμβολα, "
+                                                    f"κοινά: {stats['common']}\n")
+            self.view.kl_result_text.insert(tk.END, f"Μόνο στο P: {stats['only_in_p']} "
+                                                    f"(μάζα {stats['mass_only_in_p']:.4f})\n")
+            self.view.kl_result_text.insert(tk.END, f"Μόνο στο Q: {stats['only_in_q']} "
+                                                    f"(μάζα {stats['mass_only_in_q']:.4f})\n\n")
+            self.view.kl_result_text.insert(tk.END, f"D(P‖Q) = {stats['kl_pq']:.6f} bits\n")
+            self.view.kl_result_text.insert(tk.END, f"D(Q‖P) = {stats['kl_qp']:.6f} bits\n")
+            self.view.kl_result_text.insert(tk.END, f"H(P,Q) = {stats['cross_entropy_pq']:.6f} bits\n")
+            self.view.kl_result_text.insert(tk.END, f"H(Q,P) = {stats['cross_entropy_qp']:.6f} bits\n")
+            self.view.kl_result_text.insert(tk.END, f"JS(P‖Q) = {stats['js']:.6f} bits\n")
+
+        except ValueError as e:
+            messagebox.showerror("Σφάλμα", str(e))
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
 
-            px_array = np.array(px)
-            py_array = np.array(py)
-            P_XY = np.vstack([px_array, py_array])
+    def _parse_sparse_distribution(self, text):
+        """Μετατρέπει κείμενο "σύμβολο:τιμή ..." σε dict (οι τιμές κανονικοποιούνται από το model)"""
+        distribution = {}
+        for token in text.split():
+            symbol, sep, value = token.rpartition(":")
+            if not sep or not symbol:
+                raise ValueError(f"Μη έγκυρο στοιχείο '{token}': αναμενόταν σύμβολο:πιθανότητα")
+            distribution[symbol] = distribution.get(symbol, 0.0) + float(value)
+        return distribution
+
+    def _read_joint_table(self, text_widget):
+        """
+        Πίνακας P(X,Y) από το κείμενο (μία γραμμή ανά x, τιμές ανά y με κενό ή κόμμα) και τα
+        μεγέθη πληροφορίας του (information_from_joint_counts). None αν το άθροισμα δεν είναι 1.
+        """
+        lines = [line.replace(",", " ").split() for line in text_widget.get("1.0", tk.END).splitlines()]
+        rows = [[float(x) for x in line] for line in lines if line]
+        if not rows:
+            raise ValueError("Εισάγετε τον πίνακα P(X,Y)!")
+        if len({len(row) for row in rows}) != 1:
+            raise ValueError("Όλες οι γραμμές του P(X,Y) πρέπει να έχουν το ίδιο πλήθος τιμών!")
+        P_XY = np.array(rows)
+        if np.any(P_XY < 0):
+            raise ValueError("Οι πιθανότητες του P(X,Y) πρέπει να είναι μη αρνητικές!")
+        if not self.model.check_sum(P_XY.ravel()):
+            messagebox.showerror("Σφάλμα", f"Ο πίνακας P(X,Y) αθροίζει σε {P_XY.sum():.4f}, όχι σε 1!")
+            return None, None
+        return P_XY, self.model.information_from_joint_counts(P_XY)
+
+    @staticmethod
+    def _format_marginals(P_XY):
+        return (f"Px = {np.round(P_XY.sum(axis=1), 6).tolist()}\n"
+                f"Py = {np.round(P_XY.sum(axis=0), 6).tolist()}\n\n")
 
-            H_XY = self.model.calculate_joint_entropy(P_XY)
+    def handle_calc_joint_entropy(self):
+        try:
+            P_XY, stats = self._read_joint_table(self.view.joint_table_text)
+            if P_XY is None:
+                return
 
             self.view.joint_result_text.delete("1.0", tk.END)
             self.view.joint_result_text.insert(tk.END, "ΣΥΝΔΕΤΙΚΗ ΕΝΤΡΟΠΙΑ\n")
-            self.view.joint_result_text.insert(tk.END, f"Px = {px}\n")
-            self.view.joint_result_text.insert(tk.END, f"Py = {py}\n\n")
             self.view.joint_result_text.insert(tk.END, "Πίνακας P(X,Y):\n")
             self.view.joint_result_text.insert(tk.END, f"{P_XY}\n\n")
-            self.view.joint_result_text.insert(tk.END, f"H(X,Y) = {H_XY:.4f} bits\n")
+            self.view.joint_result_text.insert(tk.END, self._format_marginals(P_XY))
+            self.view.joint_result_text.insert(tk.END, f"H(X,Y) = {stats['H_XY']:.4f} bits\n")
 
-        except ValueError:
-            messagebox.showerror("Σφάλμα", "Παρακαλώ εισάγετε έγκυρες πιθανότητες!")
+        except ValueError as e:
+            messagebox.showerror("Σφάλμα", str(e) or "Παρακαλώ εισάγετε έγκυρες πιθανότητες!")
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
     def handle_calc_mutual_info(self):
         try:
-            px = [float(x) for x in self.view.mi_px_entry.get().split()]
-            py = [float(x) for x in self.view.mi_py_entry.get().split()]
-
-            if not self.model.check_sum(px):
-                messagebox.showerror("Σφάλμα", "Το Px δεν αθροίζει σε 1!")
-                return
-            if not self.model.check_sum(py):
-                messagebox.showerror("Σφάλμα", "Το Py δεν αθροίζει σε 1!")
+            P_XY, stats = self._read_joint_table(self.view.mi_table_text)
+            if P_XY is None:
                 return
 
-
-            px_array = np.array(px)
-            py_array = np.array(py)
-            P_XY = np.vstack([px_array, py_array])
-
-            Hx = self.model.calculate_entropy(px)
-            Hy = self.model.calculate_entropy(py)
-            Hxy = self.model.calculate_joint_entropy(P_XY)
-
-            Ixy = Hx + Hy - Hxy  # I(X;Y) = H(X) + H(Y) - H(X,Y)
-
             self.view.mi_result_text.delete("1.0", tk.END)
             self.view.mi_result_text.insert(tk.END, "ΔΙΑΠΛΗΡΟΦΟΡΙΑ I(X;Y)\n")
-
-            self.view.mi_result_text.insert(tk.END, f"Px = {px}\n")
-            self.view.mi_result_text.insert(tk.END, f"Py = {py}\n\n")
+            self.view.mi_result_text.insert(tk.END, self._format_marginals(P_XY))
+            self.view.mi_result_text.insert(tk.END, f"H(X) = {stats['H_X']:.4f}, H(Y) = {stats['H_Y']:.4f}, "
+                                                    f"H(X,Y) = {stats['H_XY']:.4f} bits\n")
             self.view.mi_result_text.insert(
-                tk.END, f"I(X;Y) = H(X)+H(Y) -H(X,Y) = {Ixy:.14f} bits/symbol\n"
+                tk.END, f"I(X;Y) = H(X)+H(Y) -H(X,Y) = {stats['I_XY']:.14f} bits/symbol\n"
             )
 
-        except ValueError:
-            messagebox.showerror("Σφάλμα", "Παρακαλώ εισάγετε έγκυρες πιθανότητες!")
+        except ValueError as e:
+            messagebox.showerror("Σφάλμα", str(e) or "Παρακαλώ εισάγετε έγκυρες πιθανότητες!")
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
+    def handle_calc_sample_information(self):
+        """Όλα τα μεγέθη πληροφορίας από ζεύγη παρατηρήσεων (X, Y) σε αρχείο"""
+        path = filedialog.askopenfilename(
+            title="Δείγματα (X, Y)",
+            filetypes=[("NumPy / CSV", "*.npy *.npz *.csv *.txt"), ("Όλα τα αρχεία", "*.*")])
+        if not path:
+            return
+
+        def task(progress):
+            return self.model.calculate_sample_file_information(path, progress=progress)
+
+        self.executor.submit('entropy_samples', task, status=self.view.mi_samples_status,
+                             on_done=lambda stats: self._display_sample_information(path, stats),
+                             on_error=lambda e: messagebox.showerror("Σφάλμα", str(e)))
+
+    def _display_sample_information(self, path, stats):
+        histogram = stats['histogram']
+        self.view.mi_result_text.delete("1.0", tk.END)
+        self.view.mi_result_text.insert(tk.END, "ΔΙΑΠΛΗΡΟΦΟΡΙΑ ΑΠΟ ΔΕΙΓΜΑΤΑ\n")
+        self.view.mi_result_text.insert(tk.END, f"{path}\n")
+        self.view.mi_result_text.insert(tk.END, f"Δείγματα: {stats['n']:,}, |X| = {histogram.x_values.size}, "
+                                                f"|Y| = {histogram.y_values.size}\n\n")
+        self.view.mi_result_text.insert(tk.END, f"H(X)   = {stats['H_X']:.4f} bits\n")
+        self.view.mi_result_text.insert(tk.END, f"H(Y)   = {stats['H_Y']:.4f} bits\n")
+        self.view.mi_result_text.insert(tk.END, f"H(X,Y) = {stats['H_XY']:.4f} bits\n")
+        self.view.mi_result_text.insert(tk.END, f"H(X|Y) = {stats['H_X_given_Y']:.4f} bits\n")
+        self.view.mi_result_text.insert(tk.END, f"H(Y|X) = {stats['H_Y_given_X']:.4f} bits\n")
+        self.view.mi_result_text.insert(tk.END, f"I(X;Y) = {stats['I_XY']:.6f} bits\n")
+
     def handle_calc_conditional(self):
         try:
-            px = [float(x) for x in self.view.cond_px_entry.get().split()]
-            py = [float(x) for x in self.view.cond_py_entry.get().split()]
-
-            if not self.model.check_sum(px):
-                messagebox.showerror("Σφάλμα", "Το Px δεν αθροίζει σε 1!")
+            P_XY, stats = self._read_joint_table(self.view.cond_table_text)
+            if P_XY is None:
                 return
-            if not self.model.check_sum(py):
-                messagebox.showerror("Σφάλμα", "Το Py δεν αθροίζει σε 1!")
-                return
-
-            px_array = np.array(px)
-            py_array = np.array(py)
-            P_XY = np.vstack([px_array, py_array])
-
-            Hx = self.model.calculate_entropy(px)
-            Hy = self.model.calculate_entropy(py)
-            Hxy = self.model.calculate_joint_entropy(P_XY)
-
-            # H(Y|X) = H(X,Y) - H(X)
-            # H(X|Y) = H(X,Y) - H(Y)
-            Hy_given_x = Hxy - Hx
-            Hx_given_y = Hxy - Hy
 
             self.view.cond_result_text.delete("1.0", tk.END)
             self.view.cond_result_text.insert(tk.END, "ΥΠΟ-ΣΥΝΘΗΚΗ ΕΝΤΡΟΠΙΑ\n")
-
-            self.view.cond_result_text.insert(tk.END, f"Px = {px}\n")
-            self.view.cond_result_text.insert(tk.END, f"Py = {py}\n\n")
+            self.view.cond_result_text.insert(tk.END, self._format_marginals(P_XY))
             self.view.cond_result_text.insert(
-                tk.END, f"H(Y|X) = H(X,Y) - H(X) = {Hy_given_x:.4f} bits\n"
+                tk.END, f"H(Y|X) = H(X,Y) - H(X) = {stats['H_Y_given_X']:.4f} bits\n"
             )
             self.view.cond_result_text.insert(
-                tk.END, f"H(X|Y) = H(X,Y) - H(Y) = {Hx_given_y:.4f} bits\n"
+                tk.END, f"H(X|Y) = H(X,Y) - H(Y) = {stats['H_X_given_Y']:.4f} bits\n"
             )
 
-        except ValueError:
-            messagebox.showerror("Σφάλμα", "Παρακαλώ εισάγετε έγκυρες πιθανότητες!")
+        except ValueError as e:
+            messagebox.showerror("Σφάλμα", str(e) or "Παρακαλώ εισάγετε έγκυρες πιθανότητες!")
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
+
+    def handle_calc_rolling_entropy(self):
+        """Χρονοσειρά εντροπίας κυλιόμενου παραθύρου για ένα αρχείο (στο παρασκήνιο)"""
+        try:
+            window = int(self.view.window_entry.get())
+            step = int(self.view.step_entry.get())
+            if window <= 0 or step <= 0:
+                raise ValueError("Το παράθυρο και το βήμα πρέπει να είναι θετικοί ακέραιοι!")
+        except ValueError as e:
+            messagebox.showerror("Σφάλμα", str(e))
+            return
+
+        path = filedialog.askopenfilename(title="Επιλογή αρχείου")
+        if not path:
+            return
+
+        def task(progress):
+            return self.model.calculate_rolling_entropy(path, window, step, progress=progress)
+
+        self.executor.submit('entropy_rolling', task, status=self.view.rolling_status,
+                             on_done=lambda result: self._display_rolling_entropy(path, window, *result),
+                             on_error=lambda e: messagebox.showerror("Σφάλμα", str(e)))
+
+    def _display_rolling_entropy(self, path, window, positions, entropies):
+        self.view.update_rolling_plot(positions, entropies, window)
+
+        self.view.rolling_result_text.delete("1.0", tk.END)
+        self.view.rolling_result_text.insert(tk.END, f"{path}\n")
+        self.view.rolling_result_text.insert(tk.END, f"Παράθυρα: {entropies.size:,}\n")
+        self.view.rolling_result_text.insert(
+            tk.END, f"H: ελάχιστη {entropies.min():.4f}, μέση {entropies.mean():.4f}, "
+                    f"μέγιστη {entropies.max():.4f} bits/byte\n")
+        peak = int(np.argmax(entropies))
+        self.view.rolling_result_text.insert(
+            tk.END, f"Μέγιστη εντροπία στο παράθυρο που τελειώνει στο byte {positions[peak]:,}\n")
+
+    def handle_calc_block_entropy_text(self):
+        text = self.view.block_text_input.get("1.0", tk.END).rstrip("\n")
+        if not text:
+            messagebox.showerror("Σφάλμα", "Εισάγετε κείμενο!")
+            return
+        self._submit_block_entropy(text, "Κείμενο")
+
+    def handle_calc_block_entropy_file(self):
+        path = filedialog.askopenfilename(title="Επιλογή αρχείου")
+        if path:
+            self._submit_block_entropy(pathlib.Path(path), path)
+
+    def _submit_block_entropy(self, source, description):
+        """Εντροπίες μπλοκ H(Xⁿ), n = 1..k, στο παρασκήνιο"""
+        try:
+            k = int(self.view.block_k_entry.get())
+            if k <= 0:
+                raise ValueError("Το k πρέπει να είναι θετικός ακέραιος!")
+        except ValueError as e:
+            messagebox.showerror("Σφάλμα", str(e))
+            return
+
+        def task(progress):
+            return self.model.calculate_block_entropies(source, k, progress=progress)
+
+        self.executor.submit('entropy_block', task, status=self.view.block_status,
+                             on_done=lambda stats: self._display_block_entropies(description, stats),
+                             on_error=lambda e: messagebox.showerror("Σφάλμα", str(e)))
+
+    def _display_block_entropies(self, description, stats):
+        self.view.block_result_text.delete("1.0", tk.END)
+        self.view.block_result_text.insert(tk.END, "ΕΝΤΡΟΠΙΑ ΜΠΛΟΚ\n")
+        self.view.block_result_text.insert(tk.END, f"{description}\n")
+        self.view.block_result_text.insert(tk.END, f"Σύμβολα: {stats['symbols']:,}, "
+                                                   f"αλφάβητο: {stats['alphabet_size']}\n\n")
+        self.view.block_result_text.insert(tk.END, f"{'n':>3} {'H(Xⁿ)':>10} {'H(Xⁿ)-H(Xⁿ⁻¹)':>15} "
+                                                   f"{'H(Xⁿ)/n':>9} {'n-grams':>10}\n")
+        for n, H, h, per_symbol, distinct, approximate in zip(
+                stats['n'], stats['block_entropies'], stats['conditional_entropies'],
+                stats['per_symbol'], stats['distinct'], stats['approximate']):
+            mark = " ≈" if approximate else ""
+            self.view.block_result_text.insert(
+                tk.END, f"{n:>3} {H:>10.4f} {h:>15.4f} {per_symbol:>9.4f} {distinct:>10,}{mark}\n")
+        if stats['approximate'].any():
+            self.view.block_result_text.insert(tk.END, "\n≈: hashed μετρήσεις (πολλά διαφορετικά n-grams), "
+                                                       "η εντροπία υποεκτιμάται ελαφρά\n")
+
+    def handle_calc_profile(self):
+        try:
+            p = [float(x) for x in self.view.profile_entry.get().split()]
+
+            if not self.model.check_sum(p):
+                messagebox.showerror("Σφάλμα", "Οι πιθανότητες δεν αθροίζουν σε 1.")
+                return
+
+            profile = self.model.entropy_profile(p)
+
+            self.view.profile_result_text.delete("1.0", tk.END)
+            self.view.profile_result_text.insert(tk.END, "--- Προφίλ Εντροπίας ---\n")
+            self.view.profile_result_text.insert(tk.END, f"Shannon H      = {profile['shannon']:.4f} bits\n")
+            self.view.profile_result_text.insert(tk.END, f"Perplexity 2^H = {profile['perplexity']:.4f}\n")
+            self.view.profile_result_text.insert(tk.END, f"Hartley H_0    = {profile['hartley']:.4f} bits\n")
+            self.view.profile_result_text.insert(tk.END, f"Collision H_2  = {profile['collision']:.4f} bits\n")
+            self.view.profile_result_text.insert(tk.END, f"Min-entropy H_∞ = {profile['min_entropy']:.4f} bits\n")
+            self.view.profile_result_text.insert(tk.END, f"Tsallis S_2    = {profile['tsallis_2']:.4f}\n")
+
+            self.view.update_profile_plot(profile)
+
+        except ValueError as e:
+            messagebox.showerror("Σφάλμα", str(e) or "Παρακαλώ εισάγετε έγκυρες πιθανότητες!")
         except Exception as e:
             messagebox.showerror("Error", str(e))
@@ -1,26 +1,512 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
+from scipy.special import rel_entr, xlogy
+from .joint_histogram import JointHistogram, SAMPLE_CHUNK_ROWS, iter_sample_chunks
+from .sparse_distribution import SparseDistribution, compare_distributions
+from .rolling_entropy import RollingEntropy
+from .block_entropy import BlockEntropyCounter, BLOCK_CHUNK_SYMBOLS
+from .count_entropy import CountEntropy, count_entropy
+from .pairwise import pairwise_divergences
+
+# Μέγεθος τμήματος (bytes) για την ανάγνωση αρχείων/ροών στην calculate_file_entropy.
+# Μικρά τμήματα κρατούν τον προσωρινό πίνακα του np.bincount στην cache του επεξεργαστή.
+FILE_CHUNK_BYTES = 2 ** 20
+
+# Λέξεις (bits ανά σύμβολο) που υποστηρίζει η calculate_file_entropy και οι αντίστοιχοι τύποι
+FILE_SYMBOL_DTYPES = {8: np.dtype(np.uint8), 16: np.dtype('<u2')}
+
+ENTROPY_ESTIMATORS = ('plugin', 'miller_madow', 'jackknife', 'chao_shen')
+
+# Τιμές του α για το προφίλ Rényi/Tsallis της entropy_profile (η καμπύλη α του Entropy tab)
+PROFILE_ALPHAS = np.linspace(0.0, 10.0, 201)
+
+# Μέγιστο πλήθος στοιχείων (αντίγραφα × σύμβολα) ενός μπλοκ bootstrap στη μνήμη
+BOOTSTRAP_BLOCK_ELEMENTS = 2 ** 22
+
+
+def _plugin_entropy(counts, axis=-1):
+    """Εντροπία maximum-likelihood ln N - Σ n ln n / N (σε nats) ανά κατανομή του axis"""
+    N = counts.sum(axis=axis)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.log(N) - xlogy(counts, counts).sum(axis=axis) / N
+
+
+def _miller_madow_entropy(counts, axis=-1):
+    """Plug-in + (K - 1) / 2N, με K το πλήθος των συμβόλων που εμφανίστηκαν"""
+    K = np.count_nonzero(counts, axis=axis)
+    return _plugin_entropy(counts, axis) + (K - 1) / (2 * counts.sum(axis=axis))
+
+
+def _jackknife_entropy(counts, axis=-1):
+    """
+    Jackknife: N·H - (N-1)/N · Σ_i n_i H_{-i}. Όλα τα δείγματα ενός συμβόλου δίνουν την ίδια
+    εκτίμηση H_{-i} χωρίς αυτό, οπότε αρκεί ένας υπολογισμός ανά σύμβολο και όχι ανά δείγμα.
+    Με N = 1 δεν υπάρχει δείγμα χωρίς την παρατήρηση, οπότε δίνεται η plug-in τιμή (0).
+    """
+    counts = np.moveaxis(counts, axis, -1)
+    N = counts.sum(axis=-1, keepdims=True)
+    S = xlogy(counts, counts).sum(axis=-1, keepdims=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        H = np.log(N) - S / N
+        H_leave_one_out = np.log(N - 1) - (S - xlogy(counts, counts) + xlogy(counts - 1, counts - 1)) / (N - 1)
+    H_leave_one_out = np.where(counts > 0, H_leave_one_out, 0.0)
+    N, H = N[..., 0], H[..., 0]
+    with np.errstate(invalid='ignore'):
+        jackknife = N * H - (N - 1) / N * (counts * H_leave_one_out).sum(axis=-1)
+    return np.where(N < 2, H, jackknife)
+
+
+def _chao_shen_entropy(counts, axis=-1):
+    """
+    Chao–Shen: πιθανότητες διορθωμένες κατά την κάλυψη C = 1 - f1/N (f1 = σύμβολα με μία
+    εμφάνιση) και στάθμιση Horvitz–Thompson 1 / (1 - (1 - C·p)^N) για τα σύμβολα που λείπουν.
+    """
+    counts = np.moveaxis(counts, axis, -1)
+    N = counts.sum(axis=-1, keepdims=True)
+    f1 = np.count_nonzero(counts == 1, axis=-1)[..., None]
+    f1 = np.where(f1 == N, N - 1, f1)  # όλα singletons: αποφυγή C = 0
+    pa = (1 - f1 / N) * counts / N
+    with np.errstate(divide='ignore', invalid='ignore'):
+        terms = -xlogy(pa, pa) / (1 - (1 - pa) ** N)
+    return np.where(counts > 0, terms, 0.0).sum(axis=-1)
+
+
+_ESTIMATOR_FUNCTIONS = {
+    'plugin': _plugin_entropy,
+    'miller_madow': _miller_madow_entropy,
+    'jackknife': _jackknife_entropy,
+    'chao_shen': _chao_shen_entropy,
+}
+
+
+def _bootstrap_entropies(counts, n_boot, method, seed):
+    """
+    n_boot εκτιμήσεις εντροπίας (σε bits) από πολυωνυμικές επαναδειγματοληψίες του ιστογράμματος.
+    Κάθε μπλοκ αντιγράφων παράγεται με μία κλήση multinomial σε όλο το διάνυσμα πλήθους.
+    """
+    rng = np.random.default_rng(seed)
+    counts = counts[counts > 0]
+    N = int(counts.sum())
+    estimator = _ESTIMATOR_FUNCTIONS[method]
+    block = max(BOOTSTRAP_BLOCK_ELEMENTS // counts.size, 1)
+    estimates = np.empty(n_boot)
+    for start in range(0, n_boot, block):
+        stop = min(start + block, n_boot)
+        replicates = rng.multinomial(N, counts / N, size=stop - start)
+        estimates[start:stop] = estimator(replicates, axis=-1) / np.log(2)
+    return estimates
+
 
 class EntropyModel:
     """Περιέχει όλες της συναρτήσεις του Entropy tab για τους απαραίτητους υπολογισμούς"""
-    def calculate_entropy(self, p):
-        p = np.array(p)[np.array(p) > 0]
-        return -np.sum(p * np.log2(p))
+    def calculate_entropy(self, p, axis=-1):
+        """
+        H(X) = -Σ p log2 p κατά μήκος του axis (0·log0 = 0).
+        Δέχεται N-D πίνακα με μία κατανομή ανά γραμμή και επιστρέφει όλες τις εντροπίες
+        με μία διανυσματική κλήση. axis=None αντιμετωπίζει όλο τον πίνακα ως μία κατανομή.
+        """
+        p = np.asarray(p, dtype=float)
+        return -np.sum(xlogy(p, p), axis=axis) / np.log(2) + 0.0  # + 0.0: 0 αντί για -0 στις ντετερμινιστικές
+
+    def entropy_profile(self, p, alphas=PROFILE_ALPHAS, axis=-1):
+        """
+        Όλα τα μέτρα εντροπίας μιας κατανομής (ή πολλών, κατά μήκος του axis) με ένα πέρασμα:
+        τα ln p υπολογίζονται μία φορά και κάθε α χρειάζεται μόνο το Σ p^α = Σ exp(α ln p).
+
+        Επιστρέφει dict με Shannon, perplexity 2^H, Hartley H_0, collision H_2, min-entropy H_∞
+        (όλα σε bits), Tsallis S_2 = 1 - Σ p² και, για κάθε α του alphas, Rényi H_α (bits) και
+        Tsallis S_α (nats).
+        Τα α = 1 (όριο Shannon) και α = inf (min-entropy) υποστηρίζονται.
+        """
+        p = np.moveaxis(np.asarray(p, dtype=float), axis, -1)
+        alphas = np.atleast_1d(np.asarray(alphas, dtype=float))
+        if np.any(alphas < 0):
+            raise ValueError("Οι τιμές του α πρέπει να είναι μη αρνητικές")
+        if np.any(p < 0):
+            raise ValueError("Οι πιθανότητες πρέπει να είναι μη αρνητικές")
+
+        support = p > 0
+        with np.errstate(divide='ignore'):
+            log_p = np.where(support, np.log(np.where(support, p, 1.0)), -np.inf)
+        shannon = -np.sum(xlogy(p, p), axis=-1)   # nats
+        max_p = p.max(axis=-1)
+        support_size = np.count_nonzero(support, axis=-1)
+        hartley = np.log(support_size)
+        square_sum = np.sum(p * p, axis=-1)   # Σ p², κοινό για collision H_2 και Tsallis S_2
+        collision = -np.log(square_sum)
+
+        renyi = np.empty(p.shape[:-1] + alphas.shape)
+        tsallis = np.empty_like(renyi)
+        for i, alpha in enumerate(alphas):
+            if alpha == 1:
+                renyi[..., i] = tsallis[..., i] = shannon
+            elif np.isinf(alpha):
+                renyi[..., i] = -np.log(max_p)
+                tsallis[..., i] = 0.0
+            else:
+                # Σ p^0 = μέγεθος φορέα. Για α > 0, exp(α·(-inf)) = 0 εκτός φορέα.
+                power_sum = support_size if alpha == 0 else np.sum(np.exp(alpha * log_p), axis=-1)
+                renyi[..., i] = np.log(power_sum) / (1 - alpha)
+                tsallis[..., i] = (1 - power_sum) / (alpha - 1)
+
+        ln2 = np.log(2)
+        return {
+            'shannon': shannon / ln2 + 0.0,
+            'perplexity': np.exp(shannon),
+            'hartley': hartley / ln2 + 0.0,
+            'collision': collision / ln2 + 0.0,
+            'min_entropy': -np.log(max_p) / ln2 + 0.0,
+            'tsallis_2': 1 - square_sum + 0.0,
+            'alphas': alphas,
+            'renyi': renyi / ln2 + 0.0,
+            'tsallis': tsallis + 0.0,
+        }
 
     def calculate_information(self, p):
-        return -np.log2(p)
+        """Αυτοπληροφορία -log2 p για κάθε στοιχείο (inf για p = 0)"""
+        with np.errstate(divide='ignore'):
+            return -np.log2(p)
+
+    def calculate_kl_divergence(self, P, Q, axis=-1):
+        """
+        D(P‖Q) = Σ P log2(P/Q) κατά μήκος του axis, με τη σημασιολογία της rel_entr:
+        όροι με P = 0 είναι 0 και D = ∞ όταν Q = 0 < P. Τα P, Q γίνονται broadcast.
+        """
+        P, Q = np.asarray(P, dtype=float), np.asarray(Q, dtype=float)
+        return np.sum(rel_entr(P, Q), axis=axis) / np.log(2)
+
+    def calculate_joint_entropy(self, P_XY, axis=(-2, -1)):
+        """H(X,Y) για κάθε πίνακα P(X,Y) που ορίζουν οι άξονες axis (προεπιλογή: οι δύο τελευταίοι)"""
+        P = np.asarray(P_XY, dtype=float)
+        return -np.sum(xlogy(P, P), axis=axis) / np.log(2) + 0.0
+
+    def calculate_conditional_entropy(self, P_XY, axis=(-2, -1)):
+        """
+        H(X|Y) = -Σ p(x,y) log2 p(x,y)/p(y) για κάθε πίνακα P(X,Y).
+        axis = (άξονας του X, άξονας του Y). Το p(y) προκύπτει αθροίζοντας στον άξονα του X.
+        Για 2-D πίνακα αρκεί ο άξονας του X ως ακέραιος (ο άλλος είναι του Y).
+        """
+        P_XY = np.asarray(P_XY, dtype=float)
+        requested, axis = axis, [int(a) for a in np.atleast_1d(axis)]
+        if len(axis) == 1 and P_XY.ndim == 2:
+            axis.append(axis[0] + 1 if axis[0] in (0, -2) else axis[0] - 1)
+        if len(axis) != 2 or any(not -P_XY.ndim <= a < P_XY.ndim for a in axis) or \
+                axis[0] % P_XY.ndim == axis[1] % P_XY.ndim:
+            raise ValueError(f"Μη έγκυροι άξονες (X, Y) {requested} για πίνακα {P_XY.ndim} διαστάσεων")
+        axis = tuple(axis)
+        P_Y = P_XY.sum(axis=axis[0], keepdims=True)
+        return -np.sum(xlogy(P_XY, P_XY) - xlogy(P_XY, P_Y), axis=axis) / np.log(2) + 0.0
+
+    def compare_sparse_distributions(self, P, Q):
+        """
+        Όλα τα μεγέθη σύγκρισης (D(P‖Q), D(Q‖P), cross-entropy, JS) για αραιές κατανομές.
+        Τα P, Q μπορεί να είναι SparseDistribution ή dict σύμβολο -> πιθανότητα/πλήθος,
+        χωρίς να χρειάζεται κοινό ή ίσου μήκους αλφάβητο.
+        """
+        P, Q = (D if isinstance(D, SparseDistribution) else SparseDistribution.from_dict(D) for D in (P, Q))
+        stats = compare_distributions(P, Q)
+        stats['H_P'] = P.entropy()
+        stats['H_Q'] = Q.entropy()
+        return stats
+
+    def calculate_divergence_matrix(self, P, Q=None, measure='js', out=None, max_workers=0, progress=None):
+        """
+        Πίνακας αποκλίσεων για όλα τα ζεύγη γραμμών των P, Q ('kl', 'symmetric_kl', 'js' ή
+        'hellinger'). Αν το out είναι διαδρομή αρχείου, το αποτέλεσμα γράφεται σε .npy
+        memory map ώστε να μη χρειάζεται να χωρά στη μνήμη.
+        """
+        if isinstance(out, (str, os.PathLike)):
+            n_cols = len(Q) if Q is not None else len(P)
+            out = np.lib.format.open_memmap(out, mode='w+', dtype=np.float64, shape=(len(P), n_cols))
+        return pairwise_divergences(P, Q, measure, out=out, max_workers=max_workers, progress=progress)
+
+    def build_joint_histogram(self, x, y, chunk_rows=SAMPLE_CHUNK_ROWS, histogram=None):
+        """
+        Κοινό ιστόγραμμα από τα ζεύγη παρατηρήσεων (x[i], y[i]), σε τμήματα των chunk_rows
+        ώστε οι προσωρινοί πίνακες να έχουν σταθερό μέγεθος. Αν δοθεί histogram,
+        οι μετρήσεις προστίθενται σε αυτό (συσσώρευση από πολλές πηγές).
+        """
+        x, y = np.asarray(x).ravel(), np.asarray(y).ravel()
+        if x.size != y.size:
+            raise ValueError(f"Τα X και Y πρέπει να έχουν ίδιο πλήθος δειγμάτων ({x.size} ≠ {y.size})")
+        histogram = histogram if histogram is not None else JointHistogram()
+        for start in range(0, x.size, chunk_rows):
+            histogram.update(x[start:start + chunk_rows], y[start:start + chunk_rows])
+        return histogram
+
+    def calculate_sample_information(self, x, y):
+        """H(X), H(Y), H(X,Y), H(X|Y), H(Y|X) και I(X;Y) από ζεύγη παρατηρήσεων"""
+        return self.information_from_joint_counts(self.build_joint_histogram(x, y).counts)
+
+    def calculate_sample_file_information(self, path, chunk_rows=SAMPLE_CHUNK_ROWS, progress=None):
+        """Όπως η calculate_sample_information, για ζεύγη (X, Y) που διαβάζονται τμηματικά από αρχείο"""
+        histogram = JointHistogram()
+        for x, y, fraction in iter_sample_chunks(path, chunk_rows):
+            histogram.update(x, y)
+            if progress is not None:
+                progress(fraction, f"{histogram.n:,} δείγματα")
+        if histogram.n == 0:
+            raise ValueError("Το αρχείο δεν περιέχει δείγματα")
+        stats = self.information_from_joint_counts(histogram.counts)
+        stats['histogram'] = histogram
+        return stats
+
+    def information_from_joint_counts(self, counts):
+        """Όλα τα μεγέθη πληροφορίας από έναν πίνακα πλήθους counts[x, y] (ένα μόνο πέρασμα δεδομένων)"""
+        counts = np.asarray(counts)
+        n = counts.sum()
+        if n == 0:
+            raise ValueError("Δεν υπάρχουν δείγματα για τον υπολογισμό")
+        P_XY = counts / n
+        H_XY = float(self.calculate_joint_entropy(P_XY))
+        H_X = float(self.calculate_entropy(P_XY.sum(axis=1)))
+        H_Y = float(self.calculate_entropy(P_XY.sum(axis=0)))
+        H_X_given_Y = float(self.calculate_conditional_entropy(P_XY))
+        return {
+            'n': int(n),
+            'H_X': H_X,
+            'H_Y': H_Y,
+            'H_XY': H_XY,
+            'H_X_given_Y': H_X_given_Y,
+            'H_Y_given_X': max(H_XY - H_X, 0.0),
+            'I_XY': max(H_X - H_X_given_Y, 0.0),
+        }
+
+    def calculate_file_entropy(self, source, symbol_bits=8, chunk_bytes=FILE_CHUNK_BYTES, progress=None):
+        """
+        Εμπειρική εντροπία αρχείου ή ροής bytes σε σταθερή μνήμη.
+
+        Το source μπορεί να είναι διαδρομή αρχείου (διαβάζεται με memory map), αντικείμενο
+        αρχείου με readinto/read (διαβάζεται σε τμήματα των chunk_bytes) ή bytes-like.
+        Τα σύμβολα είναι λέξεις των symbol_bits (8 ή 16, little-endian) και μετρώνται με
+        np.bincount σε όψη uint8/uint16 κάθε τμήματος. Ένα τελευταίο μισό σύμβολο
+        (περιττό πλήθος bytes με 16 bits) δεν μετράται και αναφέρεται στο 'trailing_bytes'.
+        Το progress(fraction, message) καλείται μετά από κάθε τμήμα.
+
+        Επιστρέφει dict με H(X) ('entropy'), ιστόγραμμα ('counts'), πιθανότητες,
+        αυτοπληροφορία ανά σύμβολο ('self_information', inf για σύμβολα που δεν εμφανίστηκαν)
+        και στατιστικά ταχύτητας ('seconds', 'mb_per_s').
+        """
+        if symbol_bits not in FILE_SYMBOL_DTYPES:
+            raise ValueError(f"Υποστηρίζονται σύμβολα των {' ή '.join(map(str, FILE_SYMBOL_DTYPES))} bits")
+        dtype = FILE_SYMBOL_DTYPES[symbol_bits]
+        chunk_bytes = max(chunk_bytes - chunk_bytes % dtype.itemsize, dtype.itemsize)
+
+        counts = np.zeros(2 ** symbol_bits, dtype=np.int64)
+        total_bytes = 0
+        start = time.perf_counter()
+        chunks, total_size = self._byte_chunks(source, chunk_bytes, dtype.itemsize)
+        for chunk, consumed in chunks:
+            counts += np.bincount(chunk.view(dtype), minlength=counts.size)
+            total_bytes += consumed
+            if progress is not None:
+                elapsed = time.perf_counter() - start
+                speed = total_bytes / 2 ** 20 / elapsed if elapsed > 0 else 0.0
+                progress(total_bytes / total_size if total_size else None,
+                         f"{total_bytes / 2 ** 20:.1f} MB ({speed:.0f} MB/s)")
+        seconds = time.perf_counter() - start
+
+        stats = self.entropy_from_counts(counts)
+        n_symbols = int(counts.sum())
+        stats.update({
+            'symbol_bits': symbol_bits,
+            'symbols': n_symbols,
+            'bytes': total_bytes,
+            'trailing_bytes': total_bytes - n_symbols * dtype.itemsize,
+            'seconds': seconds,
+            'mb_per_s': total_bytes / 2 ** 20 / seconds if seconds > 0 else float('inf'),
+        })
+        return stats
+
+    def calculate_rolling_entropy(self, source, window, step=1, chunk_bytes=FILE_CHUNK_BYTES, progress=None):
+        """
+        Εντροπία (bits/byte) κυλιόμενου παραθύρου window bytes πάνω σε αρχείο, ροή ή bytes-like,
+        όπως στην calculate_file_entropy. Επιστρέφει (θέσεις, εντροπίες) για κάθε step-οστό
+        παράθυρο, όπου θέση είναι το byte στο οποίο τελειώνει το παράθυρο. Τα πρώτα window-1
+        παράθυρα είναι μικρότερα και παραλείπονται.
+        """
+        if window <= 0 or step <= 0:
+            raise ValueError("Το μέγεθος του παραθύρου και το βήμα πρέπει να είναι θετικοί ακέραιοι")
+        rolling = RollingEntropy(window)
+        positions, entropies = [], []
+        offset = 0
+        chunks, total_size = self._byte_chunks(source, chunk_bytes, 1)
+        for chunk, consumed in chunks:
+            values = rolling.extend(chunk)
+            first = (step - 1 - offset) % step  # πρώτη θέση με (offset + i + 1) πολλαπλάσιο του step
+            if first < window - 1 - offset:
+                first += -(-(window - 1 - offset - first) // step) * step
+            keep = np.arange(first, values.size, step)
+            positions.append(offset + keep)
+            entropies.append(values[keep])
+            offset += consumed
+            if progress is not None:
+                progress(offset / total_size if total_size else None, f"{offset / 2 ** 20:.1f} MB")
+        if offset < window:
+            raise ValueError(f"Τα δεδομένα ({offset} bytes) είναι λιγότερα από ένα παράθυρο ({window} bytes)")
+        return np.concatenate(positions), np.concatenate(entropies)
+
+    def calculate_block_entropies(self, source, k, chunk_symbols=BLOCK_CHUNK_SYMBOLS, progress=None):
+        """
+        Εντροπίες μπλοκ H(Xⁿ) για n = 1..k και εκτιμήσεις του ρυθμού εντροπίας H(Xⁿ) - H(Xⁿ⁻¹).
+
+        Το source μπορεί να είναι κείμενο (str, σύμβολα οι χαρακτήρες), πίνακας συμβόλων ή
+        αρχείο (os.PathLike), ροή ή bytes (σύμβολα τα bytes). Η καταμέτρηση γίνεται σε
+        τμήματα των chunk_symbols με τον BlockEntropyCounter.
+        """
+        if k <= 0:
+            raise ValueError("Το μέγιστο μήκος μπλοκ k πρέπει να είναι θετικός ακέραιος")
+        if isinstance(source, str):
+            source = np.frombuffer(source.encode('utf-32-le'), dtype='<u4')
+        if isinstance(source, (list, tuple, np.ndarray)):
+            alphabet, codes = np.unique(np.asarray(source).ravel(), return_inverse=True)
+            if codes.size == 0:
+                raise ValueError("Δεν υπάρχουν σύμβολα για τον υπολογισμό")
+            counter = BlockEntropyCounter(k, alphabet.size)
+            for start in range(0, codes.size, chunk_symbols):
+                counter.update(codes[start:start + chunk_symbols])
+                if progress is not None:
+                    progress(min(start + chunk_symbols, codes.size) / codes.size, f"{counter.symbols:,} σύμβολα")
+        else:
+            counter = BlockEntropyCounter(k, 256)
+            chunks, total_size = self._byte_chunks(source, chunk_symbols, 1)
+            for chunk, consumed in chunks:
+                counter.update(chunk)
+                if progress is not None:
+                    progress(counter.symbols / total_size if total_size else None,
+                             f"{counter.symbols / 2 ** 20:.1f} MB")
+        return counter.block_entropies()
+
+    def calculate_count_entropy(self, counts, axis=-1):
+        """
+        H = log2 N - (1/N) Σ n log2 n απευθείας από ακέραια πλήθη (ένα ιστόγραμμα ανά axis),
+        χωρίς μετατροπή σε πιθανότητες: τα n log2 n έρχονται από κοινό πίνακα τιμών.
+        """
+        return count_entropy(counts, axis)
+
+    def count_entropy_tracker(self, counts=None, size=None):
+        """CountEntropy για ιστογράμματα που αλλάζουν λίγο κάθε φορά (update/add/remove σε O(αλλαγών))"""
+        return CountEntropy(counts, size)
+
+    def entropy_from_counts(self, counts):
+        """H(X), πιθανότητες και αυτοπληροφορία -log2 p(x) από ιστόγραμμα πλήθους εμφανίσεων"""
+        counts = np.asarray(counts)
+        n = counts.sum()
+        if n == 0:
+            raise ValueError("Δεν υπάρχουν σύμβολα για τον υπολογισμό της εντροπίας")
+        p = counts / n
+        return {
+            'entropy': float(self.calculate_count_entropy(counts) if np.issubdtype(counts.dtype, np.integer)
+                             else self.calculate_entropy(p)),
+            'counts': counts,
+            'probabilities': p,
+            'self_information': self.calculate_information(p),
+        }
+
+    def estimate_entropy(self, counts, method='miller_madow', axis=-1):
+        """
+        Εκτίμηση της εντροπίας (bits) από πλήθη εμφανίσεων, με διόρθωση της μεροληψίας
+        του plug-in εκτιμητή στα μικρά δείγματα. method: 'plugin', 'miller_madow',
+        'jackknife' ή 'chao_shen'. Όπως η calculate_entropy, δέχεται N-D πίνακα πλήθους
+        με ένα ιστόγραμμα κατά μήκος του axis.
+        """
+        if method not in ENTROPY_ESTIMATORS:
+            raise ValueError(f"Άγνωστος εκτιμητής '{method}', διαθέσιμοι: {', '.join(ENTROPY_ESTIMATORS)}")
+        counts = np.asarray(counts, dtype=float)
+        if np.any(counts < 0) or np.any(counts != np.round(counts)):
+            raise ValueError("Τα πλήθη εμφανίσεων πρέπει να είναι μη αρνητικοί ακέραιοι")
+        if np.any(counts.sum(axis=axis) == 0):
+            raise ValueError("Δεν υπάρχουν σύμβολα για τον υπολογισμό της εντροπίας")
+        return _ESTIMATOR_FUNCTIONS[method](counts, axis) / np.log(2) + 0.0
+
+    def bootstrap_entropy(self, counts, method='miller_madow', n_boot=10000, confidence=0.95,
+                          seed=None, max_workers=0):
+        """
+        Διάστημα εμπιστοσύνης bootstrap για την εκτίμηση της estimate_entropy. Χρησιμοποιείται
+        το basic bootstrap [2Ĥ - q_high, 2Ĥ - q_low], που (σε αντίθεση με τα percentiles)
+        αντισταθμίζει τη μεροληψία των αντιγράφων προς μικρότερες εντροπίες.
+
+        Τα αντίγραφα παράγονται με πολυωνυμική δειγματοληψία πάνω στο ιστόγραμμα (όχι στα
+        αρχικά δεδομένα). Με max_workers != 0 μοιράζονται σε process pool (None = όλοι οι
+        πυρήνες), με ανεξάρτητους σπόρους από το np.random.SeedSequence(seed).
+        Επιστρέφει dict με 'estimate', 'lower', 'upper', 'std' και όλα τα 'replicates'.
+        """
+        if not 0 < confidence < 1:
+            raise ValueError("Το επίπεδο εμπιστοσύνης πρέπει να ανήκει στο (0, 1)")
+        if n_boot <= 0:
+            raise ValueError("Το πλήθος των επαναλήψεων πρέπει να είναι θετικό")
+        counts = np.asarray(counts, dtype=np.int64).ravel()
+        estimate = float(self.estimate_entropy(counts, method))
+
+        if max_workers == 0:
+            replicates = _bootstrap_entropies(counts, n_boot, method, seed)
+        else:
+            workers = max_workers or os.cpu_count() or 1
+            with ProcessPoolExecutor(workers) as pool:
+                sizes = [len(part) for part in np.array_split(np.arange(n_boot), workers) if len(part)]
+                seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+                replicates = np.concatenate(list(pool.map(
+                    _bootstrap_entropies, [counts] * len(sizes), sizes, [method] * len(sizes), seeds)))
+
+        alpha = (1 - confidence) / 2
+        q_low, q_high = np.quantile(replicates, [alpha, 1 - alpha])
+        return {
+            'estimate': estimate,
+            'lower': max(2 * estimate - float(q_high), 0.0),
+            'upper': 2 * estimate - float(q_low),
+            'std': float(replicates.std(ddof=1)) if n_boot > 1 else 0.0,
+            'confidence': confidence,
+            'method': method,
+            'replicates': replicates,
+        }
 
-    def calculate_kl_divergence(self, P, Q):
-        P, Q = map(np.array, (P, Q))
-        return np.sum(P * np.log2(P / Q))
+    def _byte_chunks(self, source, chunk_bytes, itemsize):
+        """
+        Επιστρέφει (γεννήτρια από (uint8 τμήμα, bytes που καταναλώθηκαν), συνολικό μέγεθος ή None).
+        Κάθε τμήμα έχει μήκος πολλαπλάσιο του itemsize και ισχύει μόνο μέχρι το επόμενο.
+        """
+        if isinstance(source, (str, os.PathLike)):
+            size = os.path.getsize(source)
+            return self._memmap_chunks(source, size, chunk_bytes, itemsize), size
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            data = np.frombuffer(source, dtype=np.uint8)
+            return self._memmap_chunks(data, data.size, chunk_bytes, itemsize), data.size
+        return self._stream_chunks(source, chunk_bytes, itemsize), None
 
-    def calculate_joint_entropy(self, P_XY):
-        P = np.array(P_XY)
-        return -np.sum(P * np.log2(P))
+    @staticmethod
+    def _memmap_chunks(source, size, chunk_bytes, itemsize):
+        if size == 0:
+            return
+        data = source if isinstance(source, np.ndarray) else np.memmap(source, dtype=np.uint8, mode='r')
+        usable = size - size % itemsize
+        for offset in range(0, usable, chunk_bytes):
+            yield data[offset:min(offset + chunk_bytes, usable)], min(chunk_bytes, usable - offset)
+        if usable < size:
+            yield data[:0], size - usable
 
-    def calculate_conditional_entropy(self, P_XY):
-        P_XY = np.array(P_XY)
-        P_Y = P_XY.sum(axis=0)
-        return -np.sum(P_XY * np.log2(P_XY / P_Y))
+    @staticmethod
+    def _stream_chunks(stream, chunk_bytes, itemsize):
+        buffer = bytearray(chunk_bytes)
+        view = memoryview(buffer)
+        filled = 0
+        while True:
+            if hasattr(stream, 'readinto'):
+                n = stream.readinto(view[filled:])
+            else:
+                data = stream.read(chunk_bytes - filled)
+                n = len(data)
+                view[filled:filled + n] = data
+            if not n:
+                break
+            filled += n
+            usable = filled - filled % itemsize
+            yield np.frombuffer(buffer, dtype=np.uint8, count=usable), usable
+            view[:filled - usable] = view[usable:filled]
+            filled -= usable
+        if filled:
+            yield np.frombuffer(buffer, dtype=np.uint8, count=0), filled
 
     def check_sum(self, p):
         """Ελέγχει αν το άθροισμα των πιθανοτήτων είναι 1.0"""
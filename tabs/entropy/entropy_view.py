@@ -1,7 +1,13 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
 from app_theme.dark_theme import ModernDarkTheme
 from tabs.common.shared_ui import SharedUI
+from .entropy_model import FILE_SYMBOL_DTYPES
+
+# Τα Px και Py μόνα τους δεν ορίζουν την κοινή κατανομή, οπότε εισάγεται ο πίνακας P(X,Y)
+JOINT_TABLE_LABEL = "Πίνακας P(X,Y)\n(γραμμή ανά x, στήλη ανά y):"
 
 class EntropyView(SharedUI):
     """Δημιουργεί και διαχειρίζεται όλο το GUI για την καρτέλα Entropy"""
@@ -23,6 +29,9 @@ class EntropyView(SharedUI):
         self._create_joint_subtab()
         self._create_mutual_info_subtab()
         self._create_conditional_subtab()
+        self._create_rolling_subtab()
+        self._create_block_subtab()
+        self._create_profile_subtab()
 
     # ──────────────────────────────────────────────────────────────────
     # Subtab 1: Εντροπία H(X)
@@ -40,11 +49,30 @@ class EntropyView(SharedUI):
         self.calc_entropy_btn = self._button(f, "Υπολογισμός Εντροπίας" ,color=ModernDarkTheme.BG_BLUISH)
         self.calc_entropy_btn.grid(row=0, column=2, padx=6, pady=4)
 
+        file_frame = tk.Frame(f, bg=ModernDarkTheme.BG_FRAME)
+        file_frame.grid(row=1, column=0, columnspan=3, sticky="w")
+
+        self.calc_file_entropy_btn = self._button(file_frame, "Εντροπία Αρχείου...", color=ModernDarkTheme.BG_LIGHT_ORANGE)
+        self.calc_file_entropy_btn.grid(row=0, column=0, padx=6, pady=4)
+
+        tk.Label(file_frame, text="Σύμβολο:", bg=ModernDarkTheme.BG_FRAME, fg=ModernDarkTheme.WHITE_TEXT,
+                 font=("Consolas", 11)).grid(row=0, column=1, padx=6, pady=4)
+        self.symbol_bits_combo = ttk.Combobox(file_frame, values=[f"{bits} bits" for bits in FILE_SYMBOL_DTYPES],
+                                              width=8, state="readonly")
+        self.symbol_bits_combo.current(0)
+        self.symbol_bits_combo.grid(row=0, column=2, padx=6, pady=4)
+
+        self.file_entropy_status = self._task_status(file_frame)
+        self.file_entropy_status.grid(row=0, column=3, padx=6, pady=4, sticky="w")
+
         self.result_text = self._scrolled(f, 18)
-        self.result_text.grid(row=1, column=0, columnspan=3, padx=6, pady=6, sticky="nsew")
+        self.result_text.grid(row=2, column=0, columnspan=3, padx=6, pady=6, sticky="nsew")
 
         f.grid_columnconfigure(1, weight=1)
-        f.grid_rowconfigure(1, weight=1)
+        f.grid_rowconfigure(2, weight=1)
+
+    def get_symbol_bits(self):
+        return int(self.symbol_bits_combo.get().split()[0])
 
     # ──────────────────────────────────────────────────────────────────
     # Subtab 2: KL Απόκλιση D_KL(Q||P)
@@ -80,15 +108,9 @@ class EntropyView(SharedUI):
         f = tk.Frame(self.notebook, bg=ModernDarkTheme.BG_FRAME)
         self.notebook.add(f, text="Συνδετική Εντροπία H(XY)")
 
-        self._label(f, "Πιθανότητες Px (με κενό):", 0, 0)
-
-        self.px_entry = self._entry(f, width=30, default="0.5 0.3 0.2")
-        self.px_entry.grid(row=0, column=1, padx=6, pady=4, sticky="ew")
-
-        self._label(f, "Πιθανότητες Py (με κενό):", 1, 0)
-
-        self.py_entry = self._entry(f, width=30, default="0.6 0.25 0.15")
-        self.py_entry.grid(row=1, column=1, padx=6, pady=4, sticky="ew")
+        self._label(f, JOINT_TABLE_LABEL, 0, 0)
+        self.joint_table_text = self._scrolled(f, 4, default="0.25 0.10 0.05\n0.05 0.20 0.10\n0.05 0.05 0.15")
+        self.joint_table_text.grid(row=0, column=1, rowspan=2, padx=6, pady=4, sticky="ew")
 
         self.calc_joint_btn = self._button(f, "Υπολογισμός Συνδετικής Εντροπίας" ,color=ModernDarkTheme.BG_LIGHT_ORANGE)
         self.calc_joint_btn.grid(row=0, column=2, rowspan=2, padx=6, pady=4)
@@ -108,22 +130,27 @@ class EntropyView(SharedUI):
         f = tk.Frame(self.notebook, bg=ModernDarkTheme.BG_FRAME)
         self.notebook.add(f, text="Διαπληροφορία I(X;Y)")
 
-        self._label(f, "Πιθανότητες Px (με κενό):", 0, 0)
-        self.mi_px_entry = self._entry(f, width=30, default="0.2 0.8")
-        self.mi_px_entry.grid(row=0, column=1, padx=6, pady=4, sticky="ew")
-
-        self._label(f, "Πιθανότητες Py (με κενό):", 1, 0)
-        self.mi_py_entry = self._entry(f, width=30, default="0.3 0.7")
-        self.mi_py_entry.grid(row=1, column=1, padx=6, pady=4, sticky="ew")
+        self._label(f, JOINT_TABLE_LABEL, 0, 0)
+        self.mi_table_text = self._scrolled(f, 4, default="0.10 0.10\n0.20 0.60")
+        self.mi_table_text.grid(row=0, column=1, rowspan=2, padx=6, pady=4, sticky="ew")
 
         self.calc_mi_btn = self._button(f,"Υπολογισμός Διαπληροφορίας",color=ModernDarkTheme.BG_LIGHT_ORANGE)  # <── NEW BUTTON
         self.calc_mi_btn.grid(row=0, column=2, rowspan=2, padx=6, pady=4)
 
+        samples_frame = tk.Frame(f, bg=ModernDarkTheme.BG_FRAME)
+        samples_frame.grid(row=2, column=0, columnspan=3, sticky="w")
+
+        self.calc_mi_samples_btn = self._button(samples_frame, "Από δείγματα (X,Y)...", color=ModernDarkTheme.BG_BLUISH)
+        self.calc_mi_samples_btn.grid(row=0, column=0, padx=6, pady=4)
+
+        self.mi_samples_status = self._task_status(samples_frame)
+        self.mi_samples_status.grid(row=0, column=1, padx=6, pady=4, sticky="w")
+
         self.mi_result_text = self._scrolled(f, 14)
-        self.mi_result_text.grid(row=2, column=0, columnspan=3, padx=6, pady=6, sticky="nsew")
+        self.mi_result_text.grid(row=3, column=0, columnspan=3, padx=6, pady=6, sticky="nsew")
 
         f.grid_columnconfigure(1, weight=1)
-        f.grid_rowconfigure(2, weight=1)
+        f.grid_rowconfigure(3, weight=1)
 
 
     # ──────────────────────────────────────────────────────────────────
@@ -134,13 +161,9 @@ class EntropyView(SharedUI):
         f = tk.Frame(self.notebook, bg=ModernDarkTheme.BG_FRAME)
         self.notebook.add(f, text="Υπο-Συνθήκη Εντροπία")
 
-        self._label(f, "Πιθανότητες Px (με κενό):", 0, 0)
-        self.cond_px_entry = self._entry(f, width=30, default="0.5 0.3 0.2")
-        self.cond_px_entry.grid(row=0, column=1, padx=6, pady=4, sticky="ew")
-
-        self._label(f, "Πιθανότητες Py (με κενό):", 1, 0)
-        self.cond_py_entry = self._entry(f, width=30, default="0.6 0.25 0.15")
-        self.cond_py_entry.grid(row=1, column=1, padx=6, pady=4, sticky="ew")
+        self._label(f, JOINT_TABLE_LABEL, 0, 0)
+        self.cond_table_text = self._scrolled(f, 4, default="0.25 0.10 0.05\n0.05 0.20 0.10\n0.05 0.05 0.15")
+        self.cond_table_text.grid(row=0, column=1, rowspan=2, padx=6, pady=4, sticky="ew")
 
         self.calc_cond_btn = self._button(f,"Υπολογισμός H(Y|X), H(X|Y)",color=ModernDarkTheme.BG_LIGHT_ORANGE)
         self.calc_cond_btn.grid(row=0, column=2, rowspan=2, padx=6, pady=4)
@@ -150,3 +173,143 @@ class EntropyView(SharedUI):
 
         f.grid_columnconfigure(1, weight=1)
         f.grid_rowconfigure(2, weight=1)
+
+
+    # ──────────────────────────────────────────────────────────────────
+    # Subtab 6: Κυλιόμενη Εντροπία
+    # ──────────────────────────────────────────────────────────────────
+
+    def _create_rolling_subtab(self):
+        f = tk.Frame(self.notebook, bg=ModernDarkTheme.BG_FRAME)
+        self.notebook.add(f, text="Κυλιόμενη Εντροπία")
+
+        self._label(f, "Παράθυρο (bytes):", 0, 0)
+        self.window_entry = self._entry(f, width=12, default="4096")
+        self.window_entry.grid(row=0, column=1, padx=6, pady=4, sticky="w")
+
+        self._label(f, "Βήμα (bytes):", 1, 0)
+        self.step_entry = self._entry(f, width=12, default="256")
+        self.step_entry.grid(row=1, column=1, padx=6, pady=4, sticky="w")
+
+        self.calc_rolling_btn = self._button(f, "Επιλογή Αρχείου...", color=ModernDarkTheme.BG_BLUISH)
+        self.calc_rolling_btn.grid(row=0, column=2, rowspan=2, padx=6, pady=4)
+
+        self.rolling_status = self._task_status(f)
+        self.rolling_status.grid(row=2, column=0, columnspan=3, padx=6, pady=2, sticky="w")
+
+        self.rolling_fig = Figure(figsize=(6, 3), dpi=90, facecolor=ModernDarkTheme.BG_FRAME)
+        self.rolling_ax = self.rolling_fig.add_subplot(111, facecolor=ModernDarkTheme.BG_FRAME)
+        self.rolling_ax.tick_params(axis='x', colors=ModernDarkTheme.WHITE_TEXT)
+        self.rolling_ax.tick_params(axis='y', colors=ModernDarkTheme.WHITE_TEXT)
+        for spine in self.rolling_ax.spines.values():
+            spine.set_color(ModernDarkTheme.WHITE_TEXT)
+
+        self.rolling_canvas = FigureCanvasTkAgg(self.rolling_fig, f)
+        self.rolling_canvas.get_tk_widget().grid(row=3, column=0, columnspan=3, padx=6, pady=6, sticky="nsew")
+
+        self.rolling_result_text = self._scrolled(f, 5)
+        self.rolling_result_text.grid(row=4, column=0, columnspan=3, padx=6, pady=6, sticky="ew")
+
+        f.grid_columnconfigure(1, weight=1)
+        f.grid_rowconfigure(3, weight=1)
+
+    def update_rolling_plot(self, positions, entropies, window):
+        ax = self.rolling_ax
+        ax.clear()
+
+        ax.set_facecolor(ModernDarkTheme.BG_FRAME)
+        ax.plot(positions, entropies, color=ModernDarkTheme.BG_BLUISH, lw=1, label=f'H (παράθυρο {window} bytes)')
+        ax.axhline(8, color=ModernDarkTheme.BG_LIGHT_ORANGE, ls="--", lw=1, label='8 bits (τυχαία bytes)')
+        ax.set_ylim(0, 8.2)
+
+        ax.set_xlabel("Θέση στο αρχείο (bytes)", color=ModernDarkTheme.WHITE_TEXT, fontsize=10)
+        ax.set_ylabel("Εντροπία (bits/byte)", color=ModernDarkTheme.WHITE_TEXT, fontsize=10)
+        ax.set_title("Κυλιόμενη Εντροπία", color=ModernDarkTheme.WHITE_TEXT, fontsize=12)
+
+        ax.legend(facecolor=ModernDarkTheme.BG_FRAME, edgecolor=ModernDarkTheme.WHITE_TEXT, labelcolor=ModernDarkTheme.WHITE_TEXT)
+        ax.grid(True, alpha=0.2, color=ModernDarkTheme.WHITE_TEXT)
+        self.rolling_canvas.draw()
+
+    # ──────────────────────────────────────────────────────────────────
+    # Subtab 7: Εντροπία Μπλοκ H(Xⁿ)
+    # ──────────────────────────────────────────────────────────────────
+
+    def _create_block_subtab(self):
+        f = tk.Frame(self.notebook, bg=ModernDarkTheme.BG_FRAME)
+        self.notebook.add(f, text="Εντροπία Μπλοκ H(Xⁿ)")
+
+        self._label(f, "Μέγιστο μήκος μπλοκ k:", 0, 0)
+        self.block_k_entry = self._entry(f, width=8, default="8")
+        self.block_k_entry.grid(row=0, column=1, padx=6, pady=4, sticky="w")
+
+        self._label(f, "Κείμενο:", 1, 0)
+        self.block_text_input = self._scrolled(f, 4)
+        self.block_text_input.grid(row=1, column=1, columnspan=2, padx=6, pady=4, sticky="ew")
+
+        buttons = tk.Frame(f, bg=ModernDarkTheme.BG_FRAME)
+        buttons.grid(row=2, column=0, columnspan=3, sticky="w")
+
+        self.calc_block_text_btn = self._button(buttons, "Από Κείμενο", color=ModernDarkTheme.BG_BLUISH)
+        self.calc_block_text_btn.grid(row=0, column=0, padx=6, pady=4)
+
+        self.calc_block_file_btn = self._button(buttons, "Από Αρχείο...", color=ModernDarkTheme.BG_LIGHT_ORANGE)
+        self.calc_block_file_btn.grid(row=0, column=1, padx=6, pady=4)
+
+        self.block_status = self._task_status(buttons)
+        self.block_status.grid(row=0, column=2, padx=6, pady=4, sticky="w")
+
+        self.block_result_text = self._scrolled(f, 12)
+        self.block_result_text.grid(row=3, column=0, columnspan=3, padx=6, pady=6, sticky="nsew")
+
+        f.grid_columnconfigure(1, weight=1)
+        f.grid_rowconfigure(3, weight=1)
+
+    # ──────────────────────────────────────────────────────────────────
+    # Subtab 8: Προφίλ Εντροπίας (Rényi / Tsallis)
+    # ──────────────────────────────────────────────────────────────────
+
+    def _create_profile_subtab(self):
+        f = tk.Frame(self.notebook, bg=ModernDarkTheme.BG_FRAME)
+        self.notebook.add(f, text="Προφίλ Εντροπίας")
+
+        self._label(f, "Πιθανότητες (με κενό):", 0, 0)
+        self.profile_entry = self._entry(f, width=40, default="0.5 0.3 0.2")
+        self.profile_entry.grid(row=0, column=1, padx=6, pady=4, sticky="ew")
+
+        self.calc_profile_btn = self._button(f, "Υπολογισμός Προφίλ", color=ModernDarkTheme.BG_BLUISH)
+        self.calc_profile_btn.grid(row=0, column=2, padx=6, pady=4)
+
+        self.profile_fig = Figure(figsize=(6, 3), dpi=90, facecolor=ModernDarkTheme.BG_FRAME)
+        self.profile_ax = self.profile_fig.add_subplot(111, facecolor=ModernDarkTheme.BG_FRAME)
+        self.profile_ax.tick_params(axis='x', colors=ModernDarkTheme.WHITE_TEXT)
+        self.profile_ax.tick_params(axis='y', colors=ModernDarkTheme.WHITE_TEXT)
+        for spine in self.profile_ax.spines.values():
+            spine.set_color(ModernDarkTheme.WHITE_TEXT)
+
+        self.profile_canvas = FigureCanvasTkAgg(self.profile_fig, f)
+        self.profile_canvas.get_tk_widget().grid(row=1, column=0, columnspan=3, padx=6, pady=6, sticky="nsew")
+
+        self.profile_result_text = self._scrolled(f, 8)
+        self.profile_result_text.grid(row=2, column=0, columnspan=3, padx=6, pady=6, sticky="ew")
+
+        f.grid_columnconfigure(1, weight=1)
+        f.grid_rowconfigure(1, weight=1)
+
+    def update_profile_plot(self, profile):
+        ax = self.profile_ax
+        ax.clear()
+
+        ax.set_facecolor(ModernDarkTheme.BG_FRAME)
+        ax.plot(profile['alphas'], profile['renyi'], color=ModernDarkTheme.BG_BLUISH, lw=2, label='Rényi H_α')
+        ax.axhline(profile['min_entropy'], color=ModernDarkTheme.BG_LIGHT_ORANGE, ls="--", lw=1.5,
+                   label=f"H_∞ = {profile['min_entropy']:.4f}")
+        ax.plot([0, 1, 2], [profile['hartley'], profile['shannon'], profile['collision']], "o",
+                color=ModernDarkTheme.BG_LIGHT_ORANGE, label='H_0, H_1 (Shannon), H_2')
+
+        ax.set_xlabel("α", color=ModernDarkTheme.WHITE_TEXT, fontsize=10)
+        ax.set_ylabel("Εντροπία (bits)", color=ModernDarkTheme.WHITE_TEXT, fontsize=10)
+        ax.set_title("Καμπύλη Rényi H_α", color=ModernDarkTheme.WHITE_TEXT, fontsize=12)
+
+        ax.legend(facecolor=ModernDarkTheme.BG_FRAME, edgecolor=ModernDarkTheme.WHITE_TEXT, labelcolor=ModernDarkTheme.WHITE_TEXT)
+        ax.grid(True, alpha=0.2, color=ModernDarkTheme.WHITE_TEXT)
+        self.profile_canvas.draw()
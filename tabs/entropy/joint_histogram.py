@@ -0,0 +1,125 @@
+"""Κοινό ιστόγραμμα P(X,Y) από ζεύγη παρατηρήσεων, με συσσώρευση σε τμήματα"""
+import os
+import numpy as np
+
+# Γραμμές ανά τμήμα κατά την ανάγνωση δειγμάτων από αρχείο
+SAMPLE_CHUNK_ROWS = 2 ** 20
+
+# Ακέραια δείγματα με εύρος τιμών ως αυτό κωδικοποιούνται με bincount αντί για ταξινόμηση
+DIRECT_CODE_RANGE = 2 ** 20
+
+
+class JointHistogram:
+    """
+    Πίνακας πλήθους εμφανίσεων counts[i, j] των ζευγών (x_values[i], y_values[j]).
+
+    Κάθε update(x, y) κωδικοποιεί τις τιμές σε ακέραιους με np.unique(return_inverse=True)
+    (ή απευθείας, για ακέραια δείγματα μικρού εύρους) και μετρά όλα τα ζεύγη με ένα np.bincount πάνω στο x·|Y| + y. Τα αλφάβητα μεγαλώνουν
+    όσο εμφανίζονται νέες τιμές, οπότε ιστογράμματα από διαφορετικά τμήματα (ή διεργασίες)
+    ενώνονται με merge().
+    """
+
+    def __init__(self):
+        self.x_values = None
+        self.y_values = None
+        self.counts = np.zeros((0, 0), dtype=np.int64)
+
+    @property
+    def n(self):
+        return int(self.counts.sum())
+
+    def update(self, x, y):
+        x, y = np.asarray(x).ravel(), np.asarray(y).ravel()
+        if x.size != y.size:
+            raise ValueError(f"Τα X και Y πρέπει να έχουν ίδιο πλήθος δειγμάτων ({x.size} ≠ {y.size})")
+        if x.size == 0:
+            return self
+        x_values, x_codes = self._encode(x)
+        y_values, y_codes = self._encode(y)
+        counts = np.bincount(x_codes * y_values.size + y_codes, minlength=x_values.size * y_values.size)
+        return self._add(x_values, y_values, counts.reshape(x_values.size, y_values.size))
+
+    def merge(self, other):
+        """Προσθέτει τις μετρήσεις ενός άλλου JointHistogram (π.χ. από άλλο τμήμα δεδομένων)"""
+        if other.x_values is not None:
+            self._add(other.x_values, other.y_values, other.counts)
+        return self
+
+    def probabilities(self):
+        n = self.n
+        if n == 0:
+            raise ValueError("Το ιστόγραμμα είναι κενό")
+        return self.counts / n
+
+    def _add(self, x_values, y_values, counts):
+        if self.x_values is None:
+            self.x_values, self.y_values, self.counts = x_values, y_values, counts.astype(np.int64)
+            return self
+        self.x_values, self.counts = self._expand(self.x_values, x_values, self.counts, axis=0)
+        self.y_values, self.counts = self._expand(self.y_values, y_values, self.counts, axis=1)
+        rows = np.searchsorted(self.x_values, x_values)
+        cols = np.searchsorted(self.y_values, y_values)
+        self.counts[np.ix_(rows, cols)] += counts
+        return self
+
+    @staticmethod
+    def _encode(values):
+        """(ταξινομημένες διακριτές τιμές, κωδικός κάθε δείγματος) όπως το np.unique(return_inverse=True)"""
+        if np.issubdtype(values.dtype, np.integer):
+            low, high = int(values.min()), int(values.max())
+            if high - low < DIRECT_CODE_RANGE:
+                offsets = values.astype(np.intp) - low
+                present = np.bincount(offsets, minlength=high - low + 1) > 0
+                lookup = np.cumsum(present) - 1
+                return np.flatnonzero(present).astype(values.dtype) + values.dtype.type(low), lookup[offsets]
+        return np.unique(values, return_inverse=True)
+
+    @staticmethod
+    def _expand(values, new_values, counts, axis):
+        """Ενώνει τα (ταξινομημένα) αλφάβητα και μετακινεί τις γραμμές/στήλες του counts"""
+        merged = np.union1d(values, new_values)
+        if merged.size == values.size:
+            return values, counts
+        shape = list(counts.shape)
+        shape[axis] = merged.size
+        expanded = np.zeros(shape, dtype=counts.dtype)
+        index = [slice(None), slice(None)]
+        index[axis] = np.searchsorted(merged, values)
+        expanded[tuple(index)] = counts
+        return merged, expanded
+
+
+def iter_sample_chunks(path, chunk_rows=SAMPLE_CHUNK_ROWS):
+    """
+    Διαβάζει ζεύγη (X, Y) από αρχείο σε τμήματα των chunk_rows γραμμών και επιστρέφει
+    (x, y, κλάσμα του αρχείου που διαβάστηκε). Υποστηρίζονται .npy με σχήμα (n, 2)
+    (memory map), .npz με πίνακες 'x' και 'y' και κείμενο/CSV με δύο στήλες ανά γραμμή.
+    """
+    lower = path.lower()
+    if lower.endswith(".npy"):
+        data = np.load(path, mmap_mode='r', allow_pickle=False)
+        if data.ndim != 2 or data.shape[1] != 2:
+            raise ValueError(f"Αναμενόταν πίνακας σχήματος (n, 2), δόθηκε {data.shape}")
+        for start in range(0, data.shape[0], chunk_rows):
+            chunk = np.asarray(data[start:start + chunk_rows])
+            yield chunk[:, 0], chunk[:, 1], min(start + chunk_rows, data.shape[0]) / data.shape[0]
+    elif lower.endswith(".npz"):
+        with np.load(path, allow_pickle=False) as data:
+            x, y = data['x'], data['y']
+        for start in range(0, x.size, chunk_rows):
+            yield x[start:start + chunk_rows], y[start:start + chunk_rows], min(start + chunk_rows, x.size) / x.size
+    else:
+        size = os.path.getsize(path)
+        with open(path, encoding="utf-8") as f:
+            while True:
+                raw = [f.readline() for _ in range(chunk_rows)]
+                if not raw[0]:
+                    break
+                lines = [line for line in raw if line.strip()]
+                if not lines:
+                    continue
+                pairs = [line.replace(",", " ").replace(";", " ").split() for line in lines]
+                if any(len(pair) != 2 for pair in pairs):
+                    raise ValueError("Κάθε γραμμή πρέπει να περιέχει ακριβώς δύο τιμές (X, Y)")
+                pairs = np.array(pairs)
+                yield pairs[:, 0], pairs[:, 1], f.tell() / size if size else 1.0
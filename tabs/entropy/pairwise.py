@@ -0,0 +1,138 @@
+"""Πίνακες αποκλίσεων N×M μεταξύ όλων των ζευγών από δύο σύνολα κατανομών"""
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from scipy.special import xlogy
+
+DIVERGENCE_MEASURES = ('kl', 'symmetric_kl', 'js', 'hellinger')
+
+# Μέγιστο πλήθος στοιχείων των ενδιάμεσων πινάκων ανά tile: το μπλοκ γραμμές × στήλες,
+# οι γραμμές των log p / √p / μασκών (γραμμές + στήλες) × σύμβολα, ή γραμμές × στήλες × σύμβολα για το JS
+TILE_ELEMENTS = 2 ** 22
+
+_worker_data = {}
+
+
+class _Distributions:
+    """
+    Οι κατανομές (γραμμές) με το Σ p log p κάθε γραμμής. Τα log p, √p και οι μάσκες φορέα
+    υπολογίζονται μόνο για τις γραμμές κάθε tile, ώστε η μνήμη να μην εξαρτάται από το N.
+    """
+
+    def __init__(self, P, measure):
+        self.p = P
+        self.plogp = None if measure == 'hellinger' else xlogy(P, P).sum(axis=1)
+
+    def log(self, rows):
+        """log p στις γραμμές rows, 0 εκτός φορέα: οι όροι εκεί ελέγχονται χωριστά"""
+        p = self.p[rows]
+        return np.log(np.where(p > 0, p, 1.0))
+
+    def support(self, rows):
+        return (self.p[rows] > 0).astype(np.float64)
+
+    def sqrt(self, rows):
+        return np.sqrt(self.p[rows])
+
+
+def _kl_block(A, B, rows, cols):
+    """D(A_i‖B_j) σε nats: Σ a log a - A·log Bᵀ, άπειρο όπου a > 0 και b = 0"""
+    block = A.plogp[rows, None] - A.p[rows] @ B.log(cols).T
+    missing = A.support(rows) @ (1.0 - B.support(cols)).T
+    block[missing > 0] = np.inf
+    return block
+
+
+def _block(measure, A, B, rows, cols):
+    if measure == 'kl':
+        block = _kl_block(A, B, rows, cols)
+    elif measure == 'symmetric_kl':
+        block = _kl_block(A, B, rows, cols) + _kl_block(B, A, cols, rows).T
+    elif measure == 'hellinger':
+        return np.sqrt(np.clip(1 - A.sqrt(rows) @ B.sqrt(cols).T, 0.0, None))
+    else:
+        # JS = H(M) - (H(A) + H(B)) / 2, με M = (A + B) / 2 για κάθε ζεύγος (broadcast στο tile)
+        M = (A.p[rows, None, :] + B.p[None, cols, :]) / 2
+        block = (A.plogp[rows, None] + B.plogp[None, cols]) / 2 - xlogy(M, M).sum(axis=2)
+        np.clip(block, 0.0, None, out=block)
+    return block / np.log(2)
+
+
+def _init_worker(measure, P, Q):
+    _worker_data['args'] = (measure, _Distributions(P, measure),
+                            _Distributions(Q, measure) if Q is not None else None)
+
+
+def _worker_block(rows, cols):
+    measure, A, B = _worker_data['args']
+    return rows, cols, _block(measure, A, B if B is not None else A, rows, cols)
+
+
+def tile_shape(n_rows, n_cols, n_symbols, measure, tile_elements=TILE_ELEMENTS):
+    """(γραμμές, στήλες) κάθε tile ώστε τα ενδιάμεσα να μην ξεπερνούν τα tile_elements στοιχεία"""
+    n_symbols = max(n_symbols, 1)
+    if measure == 'js':
+        # M έχει γραμμές × στήλες × σύμβολα στοιχεία
+        budget = max(tile_elements // n_symbols, 1)
+        cols = min(n_cols, max(int(np.sqrt(budget)), 1))
+        return min(n_rows, max(budget // cols, 1)), cols
+    # μπλοκ γραμμές × στήλες και γραμμές log p / √p / μασκών (γραμμές + στήλες) × σύμβολα
+    side = max(min(int(np.sqrt(tile_elements)), tile_elements // (2 * n_symbols)), 1)
+    cols = min(n_cols, side)
+    rows = min(n_rows, max(min(tile_elements // cols, tile_elements // n_symbols - cols), 1))
+    return rows, cols
+
+
+def pairwise_divergences(P, Q=None, measure='js', out=None, tile_elements=TILE_ELEMENTS,
+                         max_workers=0, progress=None):
+    """
+    Πίνακας D[i, j] = απόκλιση(P_i, Q_j) (bits, εκτός της απόστασης Hellinger) για όλα τα ζεύγη
+    γραμμών των P (N×K) και Q (M×K, προεπιλογή Q = P).
+
+    Ο υπολογισμός γίνεται σε tiles περιορισμένης μνήμης: τα KL, συμμετρικό KL και Hellinger
+    ανάγονται σε γινόμενα πινάκων (P·log Qᵀ, √P·√Qᵀ), το JS σε broadcast μέσα στο tile.
+    Τα αποτελέσματα γράφονται στο out (ndarray ή np.memmap N×M, π.χ. από open_memmap),
+    διαφορετικά δημιουργείται νέος πίνακας. Με max_workers != 0 τα tiles μοιράζονται σε
+    process pool (None = όλοι οι πυρήνες). progress(fraction, message) μετά από κάθε tile.
+    """
+    if measure not in DIVERGENCE_MEASURES:
+        raise ValueError(f"Άγνωστο μέτρο '{measure}', διαθέσιμα: {', '.join(DIVERGENCE_MEASURES)}")
+    P = np.asarray(P, dtype=np.float64)
+    Q = None if Q is None else np.asarray(Q, dtype=np.float64)
+    for D in (P, Q):
+        if D is None:
+            continue
+        if D.ndim != 2:
+            raise ValueError(f"Αναμενόταν 2-D πίνακας κατανομών (μία ανά γραμμή), δόθηκε σχήμα {D.shape}")
+        if np.any(D < 0) or not np.allclose(D.sum(axis=1), 1.0, atol=1e-6):
+            raise ValueError("Κάθε γραμμή πρέπει να είναι κατανομή πιθανότητας (μη αρνητική, άθροισμα 1)")
+    if Q is not None and Q.shape[1] != P.shape[1]:
+        raise ValueError(f"Διαφορετικό αλφάβητο: {P.shape[1]} και {Q.shape[1]} σύμβολα")
+
+    n_rows, n_cols = P.shape[0], (Q if Q is not None else P).shape[0]
+    if out is None:
+        out = np.empty((n_rows, n_cols))
+    elif out.shape != (n_rows, n_cols):
+        raise ValueError(f"Ο πίνακας εξόδου έχει σχήμα {out.shape} αντί για {(n_rows, n_cols)}")
+
+    rows_per_tile, cols_per_tile = tile_shape(n_rows, n_cols, P.shape[1], measure, tile_elements)
+    tiles = [(slice(i, min(i + rows_per_tile, n_rows)), slice(j, min(j + cols_per_tile, n_cols)))
+             for i in range(0, n_rows, rows_per_tile) for j in range(0, n_cols, cols_per_tile)]
+
+    def store(done, rows, cols, block):
+        out[rows, cols] = block
+        if progress is not None:
+            progress(done / len(tiles), f"Tile {done}/{len(tiles)}")
+
+    if max_workers == 0:
+        A = _Distributions(P, measure)
+        B = _Distributions(Q, measure) if Q is not None else A
+        for done, (rows, cols) in enumerate(tiles, 1):
+            store(done, rows, cols, _block(measure, A, B, rows, cols))
+    else:
+        with ProcessPoolExecutor(max_workers, initializer=_init_worker, initargs=(measure, P, Q)) as pool:
+            for done, (rows, cols, block) in enumerate(pool.map(_worker_block, *zip(*tiles)), 1):
+                store(done, rows, cols, block)
+
+    if isinstance(out, np.memmap):
+        out.flush()
+    return out
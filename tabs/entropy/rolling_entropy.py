@@ -0,0 +1,131 @@
+"""Εντροπία κυλιόμενου παραθύρου πάνω σε ροή συμβόλων"""
+import numpy as np
+from .count_entropy import nlogn_values
+
+
+def rolling_entropy(symbols, window, nlogn=None):
+    """
+    Εντροπία (bits/symbol) του παραθύρου που τελειώνει σε κάθε θέση t: symbols[max(0, t-window+1) : t+1].
+    Τα πρώτα window-1 παράθυρα είναι μικρότερα (μεγαλώνουν από την αρχή της ακολουθίας).
+
+    Διανυσματικό πέρασμα σε όλον τον πίνακα: με S = Σ n·log2 n, H = log2 w - S / w και κάθε βήμα
+    αλλάζει το S μόνο κατά f(k+1) - f(k) για το σύμβολο που μπαίνει και f(m-1) - f(m) για αυτό που
+    βγαίνει. Τα πλήθη k, m (εμφανίσεις του ίδιου συμβόλου μέσα στο παράθυρο) βρίσκονται για όλες
+    τις θέσεις με searchsorted στα ταξινομημένα κλειδιά σύμβολο·N + θέση και το S με cumsum.
+    """
+    symbols = np.asarray(symbols).ravel()
+    if window <= 0:
+        raise ValueError("Το μέγεθος του παραθύρου πρέπει να είναι θετικό")
+    N = symbols.size
+    if N == 0:
+        return np.zeros(0)
+    if nlogn is None or nlogn.size <= window:
+        nlogn = nlogn_values(window + 1)
+    if symbols.min() < 0:
+        raise ValueError("Τα σύμβολα πρέπει να είναι μη αρνητικοί ακέραιοι")
+
+    # Ταξινόμηση ανά (σύμβολο, θέση): τα ερωτήματα του searchsorted είναι κι αυτά ταξινομημένα,
+    # οπότε οι δυαδικές αναζητήσεις μένουν στην cache
+    order = np.argsort(symbols, kind='stable')
+    sorted_keys = symbols[order].astype(np.int64) * N + order
+    index = np.arange(N, dtype=np.int64)
+
+    # Σύμβολο που μπαίνει στη θέση t: k εμφανίσεις του στο [max(t-window+1, 0), t-1]
+    k = index - np.searchsorted(sorted_keys, sorted_keys - np.minimum(order, window - 1))
+    delta = np.empty(N)
+    delta[order] = nlogn[k + 1] - nlogn[k]
+
+    # Σύμβολο της θέσης t που βγαίνει στη θέση t+window: m εμφανίσεις του στο [t, t+window-1]
+    leaving = order < N - window
+    if np.any(leaving):
+        m = np.searchsorted(sorted_keys, sorted_keys[leaving] + window) - index[leaving]
+        delta[order[leaving] + window] += nlogn[m - 1] - nlogn[m]
+
+    S = np.cumsum(delta)
+    length = np.minimum(np.arange(1, N + 1), window)
+    return np.log2(length) - S / length + 0.0
+
+
+class RollingEntropy:
+    """
+    Εντροπία των τελευταίων `window` συμβόλων μιας ροής, με O(1) ενημέρωση ανά σύμβολο.
+
+    Διατηρεί τα πλήθη εμφανίσεων, έναν κυκλικό buffer του παραθύρου και το άθροισμα
+    S = Σ n·log2 n (από πίνακα τιμών, χωρίς λογαρίθμους ανά βήμα). Το push() ενημερώνει
+    για ένα σύμβολο, το extend() επεξεργάζεται ολόκληρο πίνακα διανυσματικά με την
+    rolling_entropy. Τα σύμβολα είναι ακέραιοι στο [0, alphabet_size).
+    """
+
+    # Κάθε τόσα push() το S υπολογίζεται ξανά από τα πλήθη, ώστε να μη συσσωρεύονται σφάλματα στρογγυλοποίησης
+    RESYNC_INTERVAL = 2 ** 20
+
+    def __init__(self, window, alphabet_size=256):
+        if window <= 0:
+            raise ValueError("Το μέγεθος του παραθύρου πρέπει να είναι θετικό")
+        self.window = window
+        self.alphabet_size = alphabet_size
+        self._nlogn = nlogn_values(window + 1)
+        self.counts = np.zeros(alphabet_size, dtype=np.int64)
+        self._buffer = np.zeros(window, dtype=np.min_scalar_type(alphabet_size - 1))
+        self._start = 0       # θέση του παλαιότερου συμβόλου στον buffer
+        self._length = 0      # σύμβολα στο παράθυρο (≤ window)
+        self._sum_nlogn = 0.0
+        self._since_resync = 0
+
+    @property
+    def entropy(self):
+        if self._length == 0:
+            return 0.0
+        return float(np.log2(self._length) - self._sum_nlogn / self._length) + 0.0
+
+    def push(self, symbol):
+        """Προσθέτει ένα σύμβολο (αφαιρώντας το παλαιότερο αν το παράθυρο είναι γεμάτο) και επιστρέφει την εντροπία"""
+        if not 0 <= symbol < self.alphabet_size:
+            raise ValueError(f"Το σύμβολο {symbol} είναι εκτός του αλφαβήτου [0, {self.alphabet_size})")
+        table, counts = self._nlogn, self.counts
+        if self._length == self.window:
+            old = self._buffer[self._start]
+            n = counts[old]
+            self._sum_nlogn += table[n - 1] - table[n]
+            counts[old] = n - 1
+            self._buffer[self._start] = symbol
+            self._start = (self._start + 1) % self.window
+        else:
+            self._buffer[(self._start + self._length) % self.window] = symbol
+            self._length += 1
+        n = counts[symbol]
+        self._sum_nlogn += table[n + 1] - table[n]
+        counts[symbol] = n + 1
+
+        self._since_resync += 1
+        if self._since_resync >= self.RESYNC_INTERVAL:
+            self._resync()
+        return self.entropy
+
+    def extend(self, symbols):
+        """Προσθέτει όλα τα σύμβολα και επιστρέφει την εντροπία μετά από το καθένα (διανυσματικά)"""
+        symbols = np.asarray(symbols).ravel()
+        if symbols.size == 0:
+            return np.zeros(0)
+        if symbols.min() < 0 or symbols.max() >= self.alphabet_size:
+            raise ValueError(f"Τα σύμβολα πρέπει να ανήκουν στο [0, {self.alphabet_size})")
+        history = self.window_symbols()
+        # Ο τύπος του buffer είναι ο μικρότερος που χωρά το αλφάβητο (γρήγορη radix ταξινόμηση)
+        data = np.concatenate([history, symbols.astype(self._buffer.dtype)])
+        entropies = rolling_entropy(data, self.window, self._nlogn)[history.size:]
+
+        tail = data[-self.window:]
+        self._buffer[:tail.size] = tail
+        self._start = 0
+        self._length = tail.size
+        self._resync()
+        return entropies
+
+    def window_symbols(self):
+        """Τα σύμβολα του τρέχοντος παραθύρου, από το παλαιότερο στο νεότερο"""
+        return np.roll(self._buffer, -self._start)[:self._length]
+
+    def _resync(self):
+        self.counts = np.bincount(self.window_symbols(), minlength=self.alphabet_size).astype(np.int64)
+        self._sum_nlogn = float(self._nlogn[self.counts].sum())
+        self._since_resync = 0
@@ -0,0 +1,102 @@
+"""Αραιές κατανομές πιθανότητας πάνω σε πολύ μεγάλα αλφάβητα"""
+import numpy as np
+from scipy.special import rel_entr, xlogy
+
+
+class SparseDistribution:
+    """
+    Κατανομή που αποθηκεύει μόνο τα σύμβολα με μη μηδενική πιθανότητα: ταξινομημένα,
+    μοναδικά κλειδιά (keys) και πίνακας float64 με τις πιθανότητές τους (values).
+    Τα κλειδιά μπορεί να είναι ακέραιοι ή strings, αρκεί να συγκρίνονται μεταξύ τους.
+    """
+
+    def __init__(self, keys, values, normalize=True):
+        keys = np.asarray(keys).ravel()
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if keys.size != values.size:
+            raise ValueError(f"Διαφορετικό πλήθος κλειδιών ({keys.size}) και τιμών ({values.size})")
+        if np.any(values < 0) or not np.all(np.isfinite(values)):
+            raise ValueError("Οι πιθανότητες πρέπει να είναι μη αρνητικοί πεπερασμένοι αριθμοί")
+        if keys.size > 1 and not np.all(keys[1:] > keys[:-1]):
+            keys, inverse = np.unique(keys, return_inverse=True)
+            values = np.bincount(inverse, weights=values, minlength=keys.size)
+        nonzero = values > 0
+        if not np.all(nonzero):
+            keys, values = keys[nonzero], values[nonzero]
+        if normalize:
+            total = values.sum()
+            if total == 0:
+                raise ValueError("Η κατανομή δεν έχει μάζα πιθανότητας")
+            values = values / total
+        self.keys = keys
+        self.values = values
+
+    @classmethod
+    def from_dict(cls, mapping, normalize=True):
+        """Από dict σύμβολο -> πιθανότητα ή πλήθος εμφανίσεων"""
+        return cls(list(mapping.keys()), list(mapping.values()), normalize)
+
+    @classmethod
+    def from_samples(cls, samples):
+        """Εμπειρική κατανομή ενός πίνακα παρατηρήσεων"""
+        keys, counts = np.unique(np.asarray(samples).ravel(), return_counts=True)
+        return cls(keys, counts)
+
+    def __len__(self):
+        return self.keys.size
+
+    def to_dict(self):
+        return dict(zip(self.keys.tolist(), self.values.tolist()))
+
+    def entropy(self):
+        return float(-xlogy(self.values, self.values).sum() / np.log(2)) + 0.0
+
+
+def align_supports(P, Q):
+    """
+    Merge join των δύο ταξινομημένων λιστών κλειδιών. Επιστρέφει (keys, p, q) πάνω στην ένωση
+    των φορέων, με 0 στα σύμβολα που λείπουν από τη μία κατανομή. Η σταθερή ταξινόμηση
+    της συνένωσης δύο ήδη ταξινομημένων ακολουθιών είναι μια γραμμική συγχώνευση.
+    """
+    keys = np.concatenate([P.keys, Q.keys])
+    order = np.argsort(keys, kind='stable')
+    keys = keys[order]
+    from_q = order >= P.keys.size
+    values = np.concatenate([P.values, Q.values])[order]
+
+    # Ένα κοινό σύμβολο εμφανίζεται δύο φορές στη σειρά: πρώτα από το P, μετά από το Q
+    starts = np.ones(keys.size, dtype=bool)
+    starts[1:] = keys[1:] != keys[:-1]
+    position = np.cumsum(starts) - 1
+    p = np.zeros(position[-1] + 1 if keys.size else 0)
+    q = np.zeros_like(p)
+    p[position[~from_q]] = values[~from_q]
+    q[position[from_q]] = values[from_q]
+    return keys[starts], p, q
+
+
+def compare_distributions(P, Q):
+    """
+    D(P‖Q), D(Q‖P), διασταυρούμενες εντροπίες και Jensen–Shannon (σε bits) με ένα πέρασμα
+    πάνω στην ένωση των φορέων. Σύμβολα που υπάρχουν μόνο στο P κάνουν τα D(P‖Q) και H(P,Q)
+    άπειρα (και αντίστοιχα για το Q). Το πλήθος και η μάζα τους επιστρέφονται χωριστά.
+    Η απόκλιση JS είναι πάντα πεπερασμένη.
+    """
+    _, p, q = align_supports(P, Q)
+    only_p = q == 0
+    only_q = p == 0
+    m = (p + q) / 2
+    ln2 = np.log(2)
+    return {
+        'support': p.size,
+        'common': int(p.size - only_p.sum() - only_q.sum()),
+        'only_in_p': int(only_p.sum()),
+        'only_in_q': int(only_q.sum()),
+        'mass_only_in_p': float(p[only_p].sum()),
+        'mass_only_in_q': float(q[only_q].sum()),
+        'kl_pq': float(rel_entr(p, q).sum() / ln2),
+        'kl_qp': float(rel_entr(q, p).sum() / ln2),
+        'cross_entropy_pq': float(-xlogy(p, q).sum() / ln2) if not only_p.any() else np.inf,
+        'cross_entropy_qp': float(-xlogy(q, p).sum() / ln2) if not only_q.any() else np.inf,
+        'js': float((rel_entr(p, m).sum() + rel_entr(q, m).sum()) / (2 * ln2)),
+    }
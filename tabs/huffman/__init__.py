@@ -1,5 +1,7 @@
 from .huffman_model import HuffmanModel
 from .huffman_view import HuffmanView
 from .huffman_controller import HuffmanController
+from .canonical import CanonicalCode
+from .bitstream import HuffmanEncoder, TableDecoder
 
-__all__ = ['HuffmanModel', 'HuffmanView', 'HuffmanController']
+__all__ = ['HuffmanModel', 'HuffmanView', 'HuffmanController', 'CanonicalCode', 'HuffmanEncoder', 'TableDecoder']
@@ -0,0 +1,300 @@
+"""Bit-packed encoding and table-driven decoding with canonical Huffman codes"""
+import struct
+import numpy as np
+from .canonical import CanonicalCode, huffman_code_lengths, length_limited_code_lengths
+
+HEADER_MAGIC = b'HUF1'
+SYMBOL_KINDS = {'bytes': 0, 'text': 1}
+SYMBOL_DTYPES = {'bytes': np.uint8, 'text': np.dtype('<u4')}
+
+# Bits looked up per decoding step (at most 25); longer codewords are resolved from the canonical limits
+DECODE_TABLE_BITS = 11
+MAX_TABLE_BITS = 25
+
+# Encoder and decoder handle each codeword inside one 64-bit word at any bit offset (0-7)
+MAX_DECODE_CODE_LENGTH = 57
+
+# Symbols encoded per vectorized step
+ENCODE_CHUNK_SYMBOLS = 2 ** 16
+
+# Compressed bytes decoded per vectorized step (small enough for the intermediates to stay in cache)
+DECODE_CHUNK_BYTES = 2 ** 13
+
+# The sequential part of decoding advances 2^DECODE_JUMP_LEVELS codewords per step
+DECODE_JUMP_LEVELS = 3
+
+_HEADER = struct.Struct('<4sBBQI')   # magic, symbol kind, max length, symbols in stream, alphabet size
+
+
+def symbol_values(data):
+    """(values, kind): unicode code points of a str, or the bytes of a bytes-like object"""
+    if isinstance(data, str):
+        return np.frombuffer(data.encode('utf-32-le'), dtype='<u4'), 'text'
+    return np.frombuffer(data, dtype=np.uint8), 'bytes'
+
+
+def values_to_data(values, kind):
+    if kind == 'text':
+        return values.astype('<u4').tobytes().decode('utf-32-le')
+    return values.astype(np.uint8).tobytes()
+
+
+def count_symbols(values, counts=None):
+    """Adds the occurrences of every symbol value to a dense counts array (bincount over the values)"""
+    added = np.bincount(values)
+    if counts is None:
+        return added
+    if added.size > counts.size:
+        added[:counts.size] += counts
+        return added
+    counts[:added.size] += added
+    return counts
+
+
+def code_from_counts(alphabet, counts, max_length=None):
+    """
+    Canonical Huffman code of a sorted alphabet (ties broken by symbol value), with codewords
+    of at most max_length bits if given. An unrestricted code longer than the encoder and
+    decoder support is replaced by the optimal code limited to MAX_DECODE_CODE_LENGTH bits.
+    """
+    if max_length is None:
+        lengths = huffman_code_lengths(counts)
+        if lengths.max() > MAX_DECODE_CODE_LENGTH:
+            lengths = length_limited_code_lengths(counts, MAX_DECODE_CODE_LENGTH)
+    else:
+        lengths = length_limited_code_lengths(counts, max_length)
+    return CanonicalCode(np.asarray(alphabet).tolist(), lengths)
+
+
+def write_header(code, kind, n_symbols):
+    """
+    Header: magic, symbol kind, longest codeword, number of encoded symbols, alphabet size,
+    then the number of codewords of each length 1..max (uint32) and the symbols in canonical
+    order. That is enough to rebuild every codeword.
+    """
+    symbols = np.asarray(code.symbols)[code.order].astype(SYMBOL_DTYPES[kind])
+    counts = code.length_counts[1:].astype('<u4')
+    fixed = _HEADER.pack(HEADER_MAGIC, SYMBOL_KINDS[kind], code.max_length, n_symbols, len(code.symbols))
+    return fixed + counts.tobytes() + symbols.tobytes()
+
+
+def read_header(blob):
+    """(code, kind, n_symbols, payload_offset) from a stream written with write_header"""
+    if len(blob) < _HEADER.size:
+        raise ValueError("Τα δεδομένα είναι πολύ μικρά για επικεφαλίδα κώδικα Huffman")
+    magic, kind_id, max_length, n_symbols, alphabet = _HEADER.unpack_from(blob)
+    kinds = {v: k for k, v in SYMBOL_KINDS.items()}
+    if magic != HEADER_MAGIC or kind_id not in kinds:
+        raise ValueError("Μη έγκυρη επικεφαλίδα κώδικα Huffman")
+    kind = kinds[kind_id]
+    offset = _HEADER.size
+    counts = np.frombuffer(blob, dtype='<u4', count=max_length, offset=offset)
+    offset += counts.nbytes
+    counts = counts.astype(np.int64)
+    dtype = np.dtype(SYMBOL_DTYPES[kind])
+    symbols = np.frombuffer(blob, dtype=dtype, count=alphabet, offset=offset)
+    offset += symbols.nbytes
+    if counts.sum() != alphabet:
+        raise ValueError("Μη έγκυρη επικεφαλίδα κώδικα Huffman")
+    lengths = np.repeat(np.arange(1, max_length + 1), counts)
+    return CanonicalCode(symbols.tolist(), lengths), kind, n_symbols, offset
+
+
+class HuffmanEncoder:
+    """
+    Packs codewords into bytes, chunk by chunk. encode() returns the complete bytes
+    produced so far and keeps the last partial byte; flush() pads it with zero bits.
+    """
+
+    def __init__(self, code):
+        if code.max_length > MAX_DECODE_CODE_LENGTH:
+            raise ValueError(f"Κωδικές λέξεις μεγαλύτερες από {MAX_DECODE_CODE_LENGTH} bits δεν υποστηρίζονται")
+        # Dense lookup from symbol value to its position in code.symbols (-1: not in the code)
+        alphabet = np.asarray(code.symbols, dtype=np.int64)
+        self._index = np.full(alphabet.max() + 1, -1, dtype=np.int32)
+        self._index[alphabet] = np.arange(alphabet.size)
+        self._codes = code.codes
+        self._lengths = code.lengths
+        self._span = (code.max_length + 7 + 7) // 8
+        self._pending = 0         # last partial byte (its bits are left-aligned)
+        self._pending_bits = 0
+        self.bits = 0
+
+    def encode(self, values, chunk_symbols=ENCODE_CHUNK_SYMBOLS):
+        values = np.asarray(values).ravel()
+        if values.size == 0:
+            return b''
+        if values.max() >= self._index.size:
+            raise ValueError("Υπάρχουν σύμβολα που δεν ανήκουν στον κώδικα")
+        index = self._index[values]
+        if index.min() < 0:
+            raise ValueError("Υπάρχουν σύμβολα που δεν ανήκουν στον κώδικα")
+        return b''.join(self._pack(index[start:start + chunk_symbols])
+                        for start in range(0, index.size, chunk_symbols))
+
+    def flush(self):
+        tail = bytes([self._pending]) if self._pending_bits else b''
+        self._pending = self._pending_bits = 0
+        return tail
+
+    def _pack(self, index):
+        codes, lengths = self._codes[index], self._lengths[index]
+        ends = np.cumsum(lengths) + self._pending_bits
+        starts = ends - lengths
+        # Each codeword, left-aligned at its bit offset within a 64-bit word, touches at most
+        # `span` bytes; codewords never share bits, so adding the bytes is the same as OR-ing them
+        word = codes << (64 - lengths - (starts & 7)).astype(np.uint64)
+        first_byte = starts >> 3
+        total = int(ends[-1])
+        packed = np.zeros(total // 8 + 1)
+        packed[0] = self._pending
+        for k in range(self._span):
+            byte = (word >> np.uint64(56 - 8 * k)) & np.uint64(0xFF)
+            packed += np.bincount(first_byte + k, weights=byte, minlength=packed.size)[:packed.size]
+        packed = packed.astype(np.uint8)
+        self._pending, self._pending_bits = int(packed[-1]), total % 8
+        self.bits += int(lengths.sum())
+        return packed[:-1].tobytes()
+
+
+class TableDecoder:
+    """
+    Decodes a packed bit stream with a 2^table_bits lookup table: the next table_bits bits
+    give the symbol and its codeword length in one step. Codewords longer than the table
+    are resolved by comparing against the canonical limit of each length.
+
+    Each chunk of the stream is decoded vectorized at every bit offset at once (symbol and
+    length of the codeword starting there); only the walk from one codeword to the next
+    (offset += length) is sequential.
+    """
+
+    def __init__(self, code, table_bits=DECODE_TABLE_BITS):
+        if code.max_length > MAX_DECODE_CODE_LENGTH:
+            raise ValueError(f"Κωδικές λέξεις μεγαλύτερες από {MAX_DECODE_CODE_LENGTH} bits δεν υποστηρίζονται")
+        if not 1 <= table_bits <= MAX_TABLE_BITS:
+            raise ValueError(f"Τα bits του πίνακα αποκωδικοποίησης πρέπει να είναι από 1 έως {MAX_TABLE_BITS}")
+        self.table_bits = min(table_bits, code.max_length)
+        self.max_length = code.max_length
+        self.symbols = np.asarray(code.symbols)[code.order]
+        lengths = code.lengths[code.order]
+        codes = code.codes[code.order]
+
+        # Canonical codewords in this order are increasing when left-aligned, so the short
+        # ones fill the beginning of the table contiguously
+        short = lengths <= self.table_bits
+        spans = np.left_shift(1, self.table_bits - lengths[short])
+        size = 1 << self.table_bits
+        self.table_symbol = np.zeros(size, dtype=np.int32)
+        self.table_length = np.zeros(size, dtype=np.int32)   # 0: longer codeword (or invalid prefix)
+        self.table_symbol[:spans.sum()] = np.repeat(np.flatnonzero(short), spans)
+        self.table_length[:spans.sum()] = np.repeat(lengths[short], spans)
+
+        counts = code.length_counts
+        self._first = code.first_codes
+        self._start = np.cumsum(counts) - counts     # canonical index of the first codeword of each length
+        # Left-aligned limits (first + count) << (64 - l) for the lengths before the longest
+        self._limits = np.array([(int(self._first[l]) + int(counts[l])) << (64 - l)
+                                 for l in range(1, self.max_length)], dtype=np.uint64)
+
+    def decode(self, payload, n_symbols, chunk_bytes=DECODE_CHUNK_BYTES):
+        """The n_symbols symbol values encoded at the start of payload"""
+        out = np.empty(n_symbols, dtype=self.symbols.dtype)
+        produced = 0
+        for values in self.iter_decode(payload, n_symbols, chunk_bytes):
+            out[produced:produced + values.size] = values
+            produced += values.size
+        return out
+
+    def iter_decode(self, payload, n_symbols, chunk_bytes=DECODE_CHUNK_BYTES):
+        """
+        Yields the decoded symbol values chunk by chunk. payload may be any buffer or a
+        np.memmap; only about chunk_bytes of it are read per step.
+        """
+        payload = np.frombuffer(payload, dtype=np.uint8) if not isinstance(payload, np.ndarray) else payload
+        produced = 0
+        offset = 0   # bit offset of the next codeword
+        while produced < n_symbols:
+            first_byte = offset // 8
+            if first_byte >= payload.size:
+                raise ValueError("Η ροή bits τελείωσε πριν αποκωδικοποιηθούν όλα τα σύμβολα")
+            size = min(chunk_bytes, payload.size - first_byte)
+            data = np.zeros(size + 8, dtype=np.uint8)
+            tail = payload[first_byte:first_byte + size + 8]
+            data[:tail.size] = tail
+            # Big-endian 64-bit word starting at every byte of the chunk
+            words = np.ndarray(shape=(size,), dtype='>u8', buffer=data, strides=(1,))
+            symbol, length = self._decode_offsets(words)
+            positions = self._walk(length, offset - 8 * first_byte)[:n_symbols - produced]
+
+            found = symbol[positions]
+            if found.min() < 0:
+                raise ValueError("Μη έγκυρη κωδική λέξη στη ροή bits")
+            produced += found.size
+            offset = 8 * first_byte + int(positions[-1] + length[positions[-1]])
+            yield self.symbols[found]
+
+    def _decode_offsets(self, words):
+        """(canonical index, length) of the codeword starting at every bit offset of the words' bytes"""
+        # The table index at bit offset 8·i + r comes from the top 32 bits of byte i's word shifted left by r
+        high = (words >> np.uint64(32)).astype(np.uint32)
+        window = (high[:, None] << np.arange(8, dtype=np.uint32)).ravel()
+        top = window >> np.uint32(32 - self.table_bits)
+        symbol = self.table_symbol[top]
+        length = self.table_length[top]
+
+        long = np.flatnonzero(length == 0)
+        if long.size:
+            w = words[long >> 3].astype(np.uint64) << (long & 7).astype(np.uint64)
+            l = np.searchsorted(self._limits, w, side='right') + 1
+            value = (w >> (64 - l).astype(np.uint64)).astype(np.int64)
+            index = self._start[l] + value - self._first[l].astype(np.int64)
+            valid = index < self.symbols.size
+            symbol[long] = np.where(valid, index, -1)
+            length[long] = np.where(valid, l, 1)
+        return symbol, length
+
+    @staticmethod
+    def _walk(length, offset, levels=DECODE_JUMP_LEVELS):
+        """
+        Offsets of the successive codewords from `offset` to the end of the chunk. Jump tables
+        over 2^k codewords (k ≤ levels) let the sequential walk take 2^levels codewords per
+        step; the offsets in between are filled back in with one gather per level.
+        """
+        n = length.size
+        jumps = [np.minimum(np.arange(n, dtype=np.int32) + length, n)]
+        jumps[0] = np.append(jumps[0], n)        # offset n (past the chunk) jumps to itself
+        for _ in range(levels):
+            jumps.append(jumps[-1][jumps[-1]])
+
+        far = jumps[-1]
+        hops = []
+        p = offset
+        while p < n:
+            hops.append(p)
+            p = far.item(p)
+        positions = np.array(hops, dtype=np.intp)
+        for jump in reversed(jumps[:-1]):
+            positions = np.stack([positions, jump[positions]], axis=1).ravel()
+        return positions[positions < n]
+
+
+def huffman_encode(data, max_length=None):
+    """
+    Header plus bit-packed payload of a str or bytes with its own canonical Huffman code
+    (length-limited to max_length bits if given, e.g. ≤ the decoder's table bits)
+    """
+    values, kind = symbol_values(data)
+    if values.size == 0:
+        raise ValueError("Δεν υπάρχουν σύμβολα για κωδικοποίηση")
+    counts = count_symbols(values)
+    alphabet = np.flatnonzero(counts)
+    code = code_from_counts(alphabet, counts[alphabet], max_length)
+    encoder = HuffmanEncoder(code)
+    return write_header(code, kind, values.size) + encoder.encode(values) + encoder.flush()
+
+
+def huffman_decode(blob, table_bits=DECODE_TABLE_BITS):
+    """Inverse of huffman_encode"""
+    code, kind, n_symbols, offset = read_header(blob)
+    values = TableDecoder(code, table_bits).decode(memoryview(blob)[offset:], n_symbols)
+    return values_to_data(values, kind)
@@ -0,0 +1,186 @@
+"""Canonical Huffman codes built from code lengths only"""
+import numpy as np
+
+# Longest codeword that fits the uint64 code values
+MAX_CODE_LENGTH = 64
+
+
+def huffman_code_lengths(weights):
+    """
+    Optimal (Huffman) codeword length of every symbol, in input order.
+
+    Two-queue construction: after one sort of the weights, the leaves form one sorted
+    queue and the merged nodes are created in non-decreasing weight order, so they form
+    a second sorted queue. The merges run in vectorized rounds: every node not heavier
+    than T = (sum of the two lightest nodes) is lighter than any node merged from now on,
+    so all of them (an even number) are paired in sorted order at once. The smallest weight
+    at least doubles every two rounds, so integer counts need O(log N) rounds. Only the
+    parent of every node is recorded; the depths then come from pointer jumping.
+    A single symbol gets a 1-bit code.
+    """
+    weights = np.asarray(weights).ravel()
+    n = weights.size
+    if n == 0:
+        raise ValueError("Δεν υπάρχουν σύμβολα για την κατασκευή κώδικα")
+    if np.any(weights < 0) or not np.all(np.isfinite(weights)):
+        raise ValueError("Τα βάρη των συμβόλων πρέπει να είναι μη αρνητικοί πεπερασμένοι αριθμοί")
+    if n == 1:
+        return np.ones(1, dtype=np.int64)
+
+    order = np.argsort(weights, kind='stable')
+    leaves = weights[order].astype(np.result_type(weights.dtype, np.int64))
+    merged = np.empty(n - 1, dtype=leaves.dtype)
+    parent = np.empty(2 * n - 1, dtype=np.intp)   # nodes 0..n-1 are the sorted leaves, n.. the merged nodes
+    i = j = k = 0                                 # heads of the two queues, merged nodes so far
+    while k < n - 1:
+        lightest = sorted(leaves[i:i + 2].tolist() + merged[j:min(j + 2, k)].tolist())
+        threshold = lightest[0] + lightest[1]
+        from_leaves = int(np.searchsorted(leaves, threshold, side='right')) - i
+        from_merged = int(np.searchsorted(merged[j:k], threshold, side='right'))
+        if (from_leaves + from_merged) % 2:
+            # the heaviest of the round waits for the next one
+            if from_merged == 0 or (from_leaves > 0 and leaves[i + from_leaves - 1] > merged[j + from_merged - 1]):
+                from_leaves -= 1
+            else:
+                from_merged -= 1
+
+        values = np.concatenate([leaves[i:i + from_leaves], merged[j:j + from_merged]])
+        nodes = np.concatenate([np.arange(i, i + from_leaves), np.arange(n + j, n + j + from_merged)])
+        run = np.argsort(values, kind='stable')   # linear merge of two sorted runs
+        values, nodes = values[run], nodes[run]
+        pairs = values.size // 2
+        merged[k:k + pairs] = values[0::2] + values[1::2]
+        parent[nodes[0::2]] = parent[nodes[1::2]] = n + k + np.arange(pairs)
+        i, j, k = i + from_leaves, j + from_merged, k + pairs
+
+    # depth = number of edges to the root, doubling the ancestor jump at each step
+    root = 2 * n - 2
+    ancestor = parent
+    ancestor[root] = root
+    depth = np.ones(2 * n - 1, dtype=np.int64)
+    depth[root] = 0
+    while np.any(ancestor[:n] != root):
+        depth += depth[ancestor]
+        ancestor = ancestor[ancestor]
+
+    lengths = np.empty(n, dtype=np.int64)
+    lengths[order] = depth[:n]
+    return lengths
+
+
+def length_limited_code_lengths(weights, max_length):
+    """
+    Optimal codeword lengths under the constraint length ≤ max_length (package-merge), in input order.
+
+    Level max_length holds the sorted leaves; every shallower level merges the leaves with the
+    packages (sums of adjacent pairs) of the level below. The 2n-2 lightest items of level 1 are
+    selected; at each level the selected leaves are a prefix of the sorted leaves and every
+    selected package selects two items of the level below, so a symbol's length is the number
+    of levels where it is selected. O(n·max_length) with one vectorized merge per level.
+    """
+    weights = np.asarray(weights).ravel()
+    n = weights.size
+    if n == 0:
+        raise ValueError("Δεν υπάρχουν σύμβολα για την κατασκευή κώδικα")
+    if np.any(weights < 0) or not np.all(np.isfinite(weights)):
+        raise ValueError("Τα βάρη των συμβόλων πρέπει να είναι μη αρνητικοί πεπερασμένοι αριθμοί")
+    if max_length < 1 or n > 2 ** max_length:
+        raise ValueError(f"{n} σύμβολα δεν χωρούν σε κωδικές λέξεις έως {max_length} bits")
+    if n == 1:
+        return np.ones(1, dtype=np.int64)
+
+    order = np.argsort(weights, kind='stable')
+    leaves = weights[order].astype(np.result_type(weights.dtype, np.int64))
+
+    # is_leaf[k]: which items of level max_length - k are leaves (ties: leaves first)
+    items = leaves
+    is_leaf = [np.ones(n, dtype=bool)]
+    for _ in range(max_length - 1):
+        packages = items[0:items.size - 1:2] + items[1::2]
+        merged = np.concatenate([leaves, packages])
+        run = np.argsort(merged, kind='stable')   # linear merge of two sorted runs
+        items = merged[run]
+        is_leaf.append(run < n)
+
+    lengths_sorted = np.zeros(n, dtype=np.int64)
+    selected = 2 * n - 2
+    for leaf in reversed(is_leaf):
+        leaf_count = int(np.count_nonzero(leaf[:selected]))
+        lengths_sorted[:leaf_count] += 1
+        selected = 2 * (selected - leaf_count)
+
+    lengths = np.empty(n, dtype=np.int64)
+    lengths[order] = lengths_sorted
+    return lengths
+
+
+class CanonicalCode:
+    """
+    Canonical prefix code defined only by the codeword length of each symbol.
+
+    Symbols are ordered by (length, position in `symbols`); the first codeword of each
+    length is the previous length's last codeword plus one, shifted left by the length
+    difference, and codewords of equal length are consecutive integers. The lengths are
+    therefore a complete description of the code.
+    """
+
+    def __init__(self, symbols, lengths):
+        self.symbols = list(symbols)
+        self.lengths = np.asarray(lengths, dtype=np.int64).ravel()
+        if self.lengths.size != len(self.symbols):
+            raise ValueError(f"Διαφορετικό πλήθος συμβόλων ({len(self.symbols)}) και μηκών ({self.lengths.size})")
+        if self.lengths.size == 0:
+            raise ValueError("Δεν υπάρχουν σύμβολα για την κατασκευή κώδικα")
+        if self.lengths.min() < 1 or self.lengths.max() > MAX_CODE_LENGTH:
+            raise ValueError(f"Τα μήκη των κωδικών λέξεων πρέπει να είναι από 1 έως {MAX_CODE_LENGTH} bits")
+        if self.kraft_sum() > 1:
+            raise ValueError("Τα μήκη παραβιάζουν την ανισότητα Kraft: δεν υπάρχει προθεματικός κώδικας")
+
+        # Canonical order and the count of codewords per length
+        self.order = np.argsort(self.lengths, kind='stable')
+        self.length_counts = np.bincount(self.lengths, minlength=self.max_length + 1)
+
+        first = np.zeros(self.max_length + 1, dtype=np.uint64)
+        code = 0
+        for length in range(1, self.max_length + 1):
+            code = (code + int(self.length_counts[length - 1])) << 1
+            first[length] = code
+        self.first_codes = first
+
+        sorted_lengths = self.lengths[self.order]
+        start_of_length = np.cumsum(self.length_counts) - self.length_counts
+        rank = np.arange(sorted_lengths.size) - start_of_length[sorted_lengths]
+        self.codes = np.empty(sorted_lengths.size, dtype=np.uint64)
+        self.codes[self.order] = first[sorted_lengths] + rank.astype(np.uint64)
+
+    @classmethod
+    def from_weights(cls, symbols, weights, max_length=None):
+        """
+        Huffman code of the symbols for the given weights (counts or probabilities), or the
+        optimal code with codewords of at most max_length bits (package-merge)
+        """
+        if max_length is None:
+            return cls(symbols, huffman_code_lengths(weights))
+        return cls(symbols, length_limited_code_lengths(weights, max_length))
+
+    @property
+    def max_length(self):
+        return int(self.lengths.max())
+
+    @property
+    def description(self):
+        """Codeword length per symbol: everything needed to rebuild the code"""
+        return dict(zip(self.symbols, self.lengths.tolist()))
+
+    def kraft_sum(self):
+        return float(np.sum(np.ldexp(1.0, -self.lengths)))
+
+    def average_length(self, weights):
+        """L = Σ p(x)l(x) for weights in the order of `symbols` (normalized here)"""
+        weights = np.asarray(weights, dtype=np.float64).ravel()
+        return float(weights @ self.lengths / weights.sum())
+
+    def to_dict(self):
+        """Symbol -> codeword as a string of '0'/'1'"""
+        return {symbol: format(code, f'0{length}b')
+                for symbol, code, length in zip(self.symbols, self.codes.tolist(), self.lengths.tolist())}
@@ -0,0 +1,82 @@
+"""Prefix-freeness and unique decodability of large codebooks"""
+from bisect import bisect_left
+from collections import deque
+
+_END = ''   # trie key that marks the end of a codeword (never a code symbol)
+
+
+class CodewordTrie:
+    """
+    Trie of the codewords as nested dicts, one level per code symbol, for walks along a word,
+    plus the sorted codewords, where all extensions of a prefix form one contiguous range.
+    """
+
+    def __init__(self, codewords):
+        self.words = sorted(codewords)
+        self.root = {}
+        for word in self.words:
+            node = self.root
+            for symbol in word:
+                node = node.setdefault(symbol, {})
+            node[_END] = True
+
+    def prefix_lengths(self, word):
+        """Lengths k ≥ 1 for which word[:k] is a codeword (one walk down the trie)"""
+        node = self.root
+        for k, symbol in enumerate(word, 1):
+            node = node.get(symbol)
+            if node is None:
+                return
+            if _END in node:
+                yield k
+
+    def extensions(self, prefix):
+        """Non-empty suffixes w for which prefix + w is a codeword"""
+        # Words starting with prefix lie in [prefix, prefix with its last symbol incremented)
+        start = bisect_left(self.words, prefix)
+        stop = bisect_left(self.words, prefix[:-1] + chr(ord(prefix[-1]) + 1), start)
+        n = len(prefix)
+        return [word[n:] for word in self.words[start:stop] if len(word) > n]
+
+
+def is_prefix_free(codewords):
+    """
+    No codeword is a prefix of another. After sorting, a codeword that is a prefix of some other
+    word is also a prefix of its immediate successor, so only adjacent pairs need comparing.
+    """
+    words = sorted(codewords)
+    return not any(b.startswith(a) for a, b in zip(words, words[1:]))
+
+
+def is_uniquely_decodable(codewords):
+    """
+    Sardinas–Patterson test. Dangling suffixes start from the pairs where one codeword is a
+    prefix of another; a suffix d produces new ones from the codewords that are prefixes of d
+    (trie walk along d) and from the codewords that extend d (trie subtree under d). The code
+    is uniquely decodable unless some dangling suffix is itself a codeword. Every dangling
+    suffix is a suffix of a codeword, so the search is finite; each is expanded only once.
+    """
+    words = list(codewords)
+    if len(set(words)) != len(words) or '' in words:
+        return False
+    trie = CodewordTrie(words)
+
+    dangling = set()
+    queue = deque()
+    for word in words:
+        for k in trie.prefix_lengths(word):
+            if k < len(word) and word[k:] not in dangling:
+                dangling.add(word[k:])
+                queue.append(word[k:])
+
+    while queue:
+        suffix = queue.popleft()
+        found = [suffix[k:] for k in trie.prefix_lengths(suffix)]
+        if '' in found:
+            return False   # the dangling suffix is a codeword: two parsings of one string
+        found.extend(trie.extensions(suffix))
+        for new in found:
+            if new not in dangling:
+                dangling.add(new)
+                queue.append(new)
+    return True
@@ -0,0 +1,125 @@
+"""Two-pass Huffman compression of files larger than memory"""
+import os
+import time
+import numpy as np
+from .bitstream import (DECODE_CHUNK_BYTES, DECODE_TABLE_BITS, HuffmanEncoder, TableDecoder,
+                        code_from_counts, read_header, values_to_data, write_header)
+
+# Bytes read (and encoded) per step; the memory in use stays proportional to this
+FILE_CHUNK_BYTES = 2 ** 20
+
+
+def _open_partial(destination):
+    """Temporary file next to destination; _finish renames it, so a failed run never leaves a truncated file"""
+    return open(f"{destination}.tmp", 'wb')
+
+
+def _finish(out, destination, succeeded):
+    out.close()
+    if succeeded:
+        os.replace(out.name, destination)
+    else:
+        os.unlink(out.name)
+
+
+def _progress_report(progress, done, total, start, fraction_from, fraction_to, message):
+    if progress is None:
+        return
+    elapsed = time.perf_counter() - start
+    speed = done / 2 ** 20 / elapsed if elapsed > 0 else 0.0
+    progress(fraction_from + (fraction_to - fraction_from) * done / total,
+             f"{message}: {done / 2 ** 20:.1f}/{total / 2 ** 20:.1f} MB ({speed:.0f} MB/s)")
+
+
+def compress_file(source, destination, chunk_bytes=FILE_CHUNK_BYTES, max_length=None, progress=None):
+    """
+    Compresses the bytes of the file `source` into `destination` in two passes over a memory map:
+    pass one counts the byte values, pass two encodes chunk by chunk with the canonical Huffman
+    code of those counts (limited to max_length bits if given) and appends each chunk's packed
+    bits to the output file.
+    progress(fraction, message) is called after every chunk of both passes. The output is written
+    to destination + '.tmp' and renamed only on success, so an error or a cancellation raised by
+    progress() leaves no truncated destination behind.
+
+    Returns a dict with sizes, compression ratio, entropy and average codeword length (bits/byte),
+    the byte counts and the timing.
+    """
+    size = os.path.getsize(source)
+    if size == 0:
+        raise ValueError("Το αρχείο είναι κενό")
+    data = np.memmap(source, dtype=np.uint8, mode='r')
+    start = time.perf_counter()
+
+    counts = np.zeros(256, dtype=np.int64)
+    for offset in range(0, size, chunk_bytes):
+        counts += np.bincount(data[offset:offset + chunk_bytes], minlength=256)
+        _progress_report(progress, min(offset + chunk_bytes, size), size, start, 0.0, 0.5,
+                         "Πέρασμα 1/2 (καταμέτρηση)")
+
+    alphabet = np.flatnonzero(counts)
+    code = code_from_counts(alphabet, counts[alphabet], max_length)
+    encoder = HuffmanEncoder(code)
+    header = write_header(code, 'bytes', size)
+    written = len(header)
+    second_pass = time.perf_counter()
+    out = _open_partial(destination)
+    try:
+        out.write(header)
+        for offset in range(0, size, chunk_bytes):
+            written += out.write(encoder.encode(data[offset:offset + chunk_bytes]))
+            _progress_report(progress, min(offset + chunk_bytes, size), size, second_pass, 0.5, 1.0,
+                             "Πέρασμα 2/2 (κωδικοποίηση)")
+        written += out.write(encoder.flush())
+    except BaseException:
+        # also on OperationCancelled from progress()
+        _finish(out, destination, succeeded=False)
+        raise
+    _finish(out, destination, succeeded=True)
+    seconds = time.perf_counter() - start
+
+    p = counts[alphabet] / size
+    return {
+        'input_bytes': size,
+        'output_bytes': written,
+        'header_bytes': len(header),
+        'ratio': written / size,
+        'entropy': float(-np.sum(p * np.log2(p))) + 0.0,
+        'average_length': encoder.bits / size,
+        'max_length': code.max_length,
+        'alphabet': alphabet.size,
+        'counts': counts,
+        'seconds': seconds,
+        'mb_per_s': size / 2 ** 20 / seconds if seconds > 0 else float('inf'),
+    }
+
+
+def decompress_file(source, destination, chunk_bytes=DECODE_CHUNK_BYTES, table_bits=DECODE_TABLE_BITS,
+                    progress=None):
+    """
+    Inverse of compress_file (or of huffman_encode saved to a file), chunk by chunk over a memory map;
+    like compress_file it writes a temporary file and renames it to destination only on success
+    """
+    blob = np.memmap(source, dtype=np.uint8, mode='r')
+    code, kind, n_symbols, offset = read_header(blob)
+    decoder = TableDecoder(code, table_bits)
+    start = time.perf_counter()
+    produced = 0
+    out = _open_partial(destination)
+    try:
+        for values in decoder.iter_decode(blob[offset:], n_symbols, chunk_bytes):
+            data = values_to_data(values, kind)
+            out.write(data.encode('utf-8') if kind == 'text' else data)
+            produced += values.size
+            if progress is not None:
+                progress(produced / n_symbols, f"Αποκωδικοποίηση: {produced:,}/{n_symbols:,} σύμβολα")
+    except BaseException:
+        _finish(out, destination, succeeded=False)
+        raise
+    _finish(out, destination, succeeded=True)
+    seconds = time.perf_counter() - start
+    return {
+        'symbols': n_symbols,
+        'input_bytes': blob.size,
+        'output_bytes': os.path.getsize(destination),
+        'seconds': seconds,
+    }
@@ -1,17 +1,20 @@
 """Controller: Handles user interactions for Huffman tab"""
+import os
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import filedialog, messagebox
 import numpy as np
 import networkx as nx
 from app_theme.dark_theme import ModernDarkTheme
+from tabs.common.background import BackgroundExecutor
 
 
 class HuffmanController:
     """Coordinates between HuffmanModel and HuffmanView"""
 
-    def __init__(self, model, view):
+    def __init__(self, model, view, executor=None):
         self.model = model
         self.view = view
+        self.executor = executor or BackgroundExecutor(view.frame)
         self._bind_commands()
 
     def _bind_commands(self):
@@ -19,6 +22,10 @@ class HuffmanController:
         self.view.analyze_btn.config(command=self.handle_analyze_with_probs)
         self.view.tree_btn.config(command=self.handle_build_tree_visual)
         self.view.analyze_text_btn.config(command=self.handle_analyze_text_huffman)
+        self.view.encode_text_btn.config(command=self.handle_benchmark_text_huffman)
+        self.view.compress_file_btn.config(command=self.handle_compress_file)
+        self.view.decompress_file_btn.config(command=self.handle_decompress_file)
+        self.view.length_limit_btn.config(command=self.handle_length_limit_penalty)
 
     def handle_analyze_with_probs(self):
         """Your original analyze function"""
@@ -39,11 +46,13 @@ class HuffmanController:
             shannon_h = self.model.calculate_entropy_from_dictionary(prob_dict)
             non_sing = self.model.is_non_singular(code_dict)
             instant = self.model.is_instantaneous(code_dict)
+            unique = instant or self.model.is_uniquely_decodable(code_dict)
             kraft_sum, kraft_ok = self.model.kraft_inequality(code_dict)
 
             self.view.res5.delete("1.0", tk.END)
             self.view.res5.insert(tk.END, "--- Αποτελέσματα ---\n")
             self.view.res5.insert(tk.END, f"Ευκρινής (Non-singular): {non_sing}\n")
+            self.view.res5.insert(tk.END, f"Μοναδικά αποκωδικοποιήσιμος (Sardinas–Patterson): {unique}\n")
             self.view.res5.insert(tk.END, f"Στιγμιαία αποκωδικοποιήσιμος (Prefix-free): {instant}\n")
             self.view.res5.insert(tk.END, f"Kraft Sum: {kraft_sum:.6f}\n")
             self.view.res5.insert(tk.END, f"Ικανοποιεί την ανισότητα Kraft : {kraft_ok}\n\n")
@@ -100,24 +109,35 @@ class HuffmanController:
             messagebox.showerror("Error", str(e))
 
     def handle_analyze_text_huffman(self):
-        """Generate Huffman codes from text"""
-        try:
-            text = self.view.text_input.get("1.0", tk.END).strip()
-            if not text:
-                messagebox.showerror("Σφάλμα", "Εισάγετε κείμενο!")
-                return
-
-            codes, probs, freq = self.model.generate_huffman_codes(text)
+        """Generate Huffman codes from text (in the background executor)"""
+        text = self.view.text_input.get("1.0", tk.END).strip()
+        if not text:
+            messagebox.showerror("Σφάλμα", "Εισάγετε κείμενο!")
+            return
 
+        def task(progress):
+            progress(None, "Κατασκευή κωδίκων Huffman...")
+            code, probs, freq = self.model.generate_canonical_code(text)
+            codes = code.to_dict()
+            progress(None, "Υπολογισμός εντροπίας...")
             H = self.model.calculate_entropy_from_dictionary(probs)
-            L = sum(probs[c] * len(codes[c]) for c in codes)
+            L = self.model.calculate_avrg_length(codes, probs)
+            return codes, freq, H, L, code.length_counts
 
+        self.executor.submit('huffman_text', task, status=self.view.text_status,
+                             on_done=lambda result: self._display_text_huffman(text, *result),
+                             on_error=lambda e: messagebox.showerror("Σφάλμα", str(e)))
+
+    def _display_text_huffman(self, text, codes, freq, H, L, length_counts):
+        try:
             self.view.text_result.delete("1.0", tk.END)
             self.view.text_result.insert(tk.END, "Ανάλυση Huffman\n")
             self.view.text_result.insert(tk.END, f"Χαρακτήρες: {len(text)}\n")
             self.view.text_result.insert(tk.END, f"Μοναδικοί: {len(freq)}\n\n")
             self.view.text_result.insert(tk.END, f"Εντροπία H: {H:.4f} bits\n")
             self.view.text_result.insert(tk.END, f"Μέσο Μήκος L: {L:.4f} bits\n")
+            per_length = ", ".join(f"{length}:{count}" for length, count in enumerate(length_counts) if count)
+            self.view.text_result.insert(tk.END, f"Κανονικός κώδικας, λέξεις ανά μήκος (bits:πλήθος): {per_length}\n")
             self.view.text_result.insert(tk.END, "Κώδικες Huffman:\n")
 
             for char, code in sorted(codes.items(), key=lambda x: len(x[1])):
@@ -126,3 +146,146 @@ class HuffmanController:
 
         except Exception as e:
             messagebox.showerror("Σφάλμα", str(e))
+
+    def handle_benchmark_text_huffman(self):
+        """Encode the text into a packed bit stream, decode it back and measure the throughput"""
+        text = self.view.text_input.get("1.0", tk.END).strip()
+        if not text:
+            messagebox.showerror("Σφάλμα", "Εισάγετε κείμενο!")
+            return
+        try:
+            max_length = self.view.get_max_length()
+        except ValueError:
+            messagebox.showerror("Σφάλμα", "Το L_max πρέπει να είναι ακέραιος!")
+            return
+
+        def task(progress):
+            progress(None, "Κωδικοποίηση και αποκωδικοποίηση...")
+            return self.model.benchmark_huffman(text, max_length=max_length)
+
+        self.executor.submit('huffman_text', task, status=self.view.text_status,
+                             on_done=self._display_huffman_benchmark,
+                             on_error=lambda e: messagebox.showerror("Σφάλμα", str(e)))
+
+    def _display_huffman_benchmark(self, stats):
+        out = self.view.text_result
+        out.delete("1.0", tk.END)
+        out.insert(tk.END, "Κωδικοποίηση Huffman σε bits\n")
+        out.insert(tk.END, f"Σύμβολα: {stats['symbols']} (αλφάβητο {stats['alphabet']}, "
+                           f"μέγιστο μήκος {stats['max_length']} bits)\n")
+        out.insert(tk.END, f"Είσοδος: {stats['input_bytes']} bytes (UTF-8)\n")
+        out.insert(tk.END, f"Συμπιεσμένο: {stats['compressed_bytes']} bytes "
+                           f"(επικεφαλίδα {stats['header_bytes']} bytes)\n")
+        out.insert(tk.END, f"Λόγος συμπίεσης: {stats['ratio']:.4f}\n\n")
+        out.insert(tk.END, f"Bits ανά σύμβολο: {stats['bits_per_symbol']:.4f}\n")
+        out.insert(tk.END, f"Εντροπία H: {stats['entropy']:.4f} bits\n\n")
+        out.insert(tk.END, f"Κωδικοποίηση: {stats['encode_mb_s']:.2f} MB/s\n")
+        out.insert(tk.END, f"Αποκωδικοποίηση: {stats['decode_mb_s']:.2f} MB/s\n")
+        out.insert(tk.END, f"Σωστή ανάκτηση κειμένου: {'Ναι' if stats['round_trip'] else 'Όχι'}\n")
+
+    def handle_compress_file(self):
+        """Two-pass Huffman compression of a file (any size) in the background"""
+        source = filedialog.askopenfilename(title="Αρχείο προς συμπίεση")
+        if not source:
+            return
+        destination = filedialog.asksaveasfilename(title="Αποθήκευση συμπιεσμένου αρχείου",
+                                                   initialfile=os.path.basename(source) + ".huf",
+                                                   defaultextension=".huf")
+        if not destination:
+            return
+        try:
+            max_length = self.view.get_max_length()
+        except ValueError:
+            messagebox.showerror("Σφάλμα", "Το L_max πρέπει να είναι ακέραιος!")
+            return
+
+        def task(progress):
+            return self.model.compress_file(source, destination, max_length=max_length, progress=progress)
+
+        self._submit_file_task(task, lambda stats: self._display_file_compression(source, destination, stats))
+
+    def _display_file_compression(self, source, destination, stats):
+        out = self.view.text_result
+        out.delete("1.0", tk.END)
+        out.insert(tk.END, "Συμπίεση αρχείου Huffman\n")
+        out.insert(tk.END, f"{source}\n→ {destination}\n\n")
+        out.insert(tk.END, f"Αρχικό μέγεθος: {stats['input_bytes']:,} bytes\n")
+        out.insert(tk.END, f"Συμπιεσμένο: {stats['output_bytes']:,} bytes (επικεφαλίδα {stats['header_bytes']} bytes)\n")
+        out.insert(tk.END, f"Λόγος συμπίεσης: {stats['ratio']:.4f}\n\n")
+        out.insert(tk.END, f"Εντροπία H: {stats['entropy']:.4f} bits/byte\n")
+        out.insert(tk.END, f"Μέσο Μήκος L: {stats['average_length']:.4f} bits/byte\n")
+        out.insert(tk.END, f"Διαφορετικά bytes: {stats['alphabet']}, μέγιστο μήκος κώδικα {stats['max_length']} bits\n")
+        out.insert(tk.END, f"Χρόνος: {stats['seconds']:.2f} s ({stats['mb_per_s']:.1f} MB/s)\n")
+
+    def handle_decompress_file(self):
+        source = filedialog.askopenfilename(title="Συμπιεσμένο αρχείο", filetypes=[("Huffman", "*.huf"), ("Όλα", "*")])
+        if not source:
+            return
+        destination = filedialog.asksaveasfilename(title="Αποθήκευση αποσυμπιεσμένου αρχείου",
+                                                   initialfile=os.path.basename(os.path.splitext(source)[0]))
+        if not destination:
+            return
+
+        def task(progress):
+            return self.model.decompress_file(source, destination, progress=progress)
+
+        def show(stats):
+            self.view.text_result.delete("1.0", tk.END)
+            self.view.text_result.insert(tk.END, f"Αποσυμπίεση: {source}\n→ {destination}\n")
+            self.view.text_result.insert(tk.END, f"{stats['input_bytes']:,} → {stats['output_bytes']:,} bytes "
+                                                 f"σε {stats['seconds']:.2f} s\n")
+
+        self._submit_file_task(task, show)
+
+    def _submit_file_task(self, task, on_done):
+        """
+        Runs a file compression/decompression with its own status bar. The file buttons stay
+        disabled until it finishes, fails or is cancelled, so one file task never replaces another.
+        """
+        def finished(callback):
+            def handler(*args):
+                self.view.set_file_buttons_enabled(True)
+                if callback is not None:
+                    callback(*args)
+            return handler
+
+        self.view.set_file_buttons_enabled(False)
+        self.executor.submit('huffman_file', task, status=self.view.file_status,
+                             on_done=finished(on_done),
+                             on_error=finished(lambda e: messagebox.showerror("Σφάλμα", str(e))),
+                             on_cancel=finished(None))
+
+    def handle_length_limit_penalty(self):
+        """Average length of the L_max-limited code (package-merge) against Huffman and the entropy"""
+        text = self.view.text_input.get("1.0", tk.END).strip()
+        if not text:
+            messagebox.showerror("Σφάλμα", "Εισάγετε κείμενο!")
+            return
+        try:
+            max_length = self.view.get_max_length()
+        except ValueError:
+            max_length = None
+        if max_length is None:
+            messagebox.showerror("Σφάλμα", "Εισάγετε ακέραιο L_max!")
+            return
+
+        def task(progress):
+            progress(None, "Package-merge...")
+            return self.model.length_limit_penalty(text, max_length)
+
+        self.executor.submit('huffman_text', task, status=self.view.text_status,
+                             on_done=self._display_length_limit_penalty,
+                             on_error=lambda e: messagebox.showerror("Σφάλμα", str(e)))
+
+    def _display_length_limit_penalty(self, stats):
+        out = self.view.text_result
+        out.delete("1.0", tk.END)
+        out.insert(tk.END, f"Κώδικας με L_max = {stats['max_length']} bits (package-merge)\n\n")
+        out.insert(tk.END, f"Εντροπία H: {stats['entropy']:.4f} bits\n")
+        out.insert(tk.END, f"Huffman: L = {stats['huffman_length']:.4f} bits "
+                           f"(μέγιστο μήκος {stats['huffman_max_length']})\n")
+        out.insert(tk.END, f"Περιορισμένος: L = {stats['limited_length']:.4f} bits "
+                           f"(μέγιστο μήκος {stats['limited_max_length']})\n\n")
+        out.insert(tk.END, f"Επιβάρυνση έναντι Huffman: {stats['penalty_vs_huffman']:.4f} bits/symbol "
+                           f"({100 * stats['relative_penalty']:.3f}%)\n")
+        out.insert(tk.END, f"Επιβάρυνση έναντι εντροπίας: {stats['penalty_vs_entropy']:.4f} bits/symbol\n")
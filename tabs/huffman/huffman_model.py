@@ -1,7 +1,11 @@
 """Model: Huffman coding and code analysis logic"""
+import time
 import numpy as np
 from collections import Counter
-import heapq
+from .canonical import CanonicalCode, huffman_code_lengths, length_limited_code_lengths
+from .code_properties import is_prefix_free, is_uniquely_decodable
+from .bitstream import DECODE_TABLE_BITS, huffman_decode, huffman_encode, read_header
+from .file_compressor import FILE_CHUNK_BYTES, compress_file, decompress_file
 
 
 class HuffmanModel:
@@ -22,13 +26,12 @@ class HuffmanModel:
         return len(set(code_dict.values())) == len(code_dict)
 
     def is_instantaneous(self, code_dict):
-        """Check if code is prefix-free"""
-        codes = list(code_dict.values())
-        for i in range(len(codes)):
-            for j in range(len(codes)):
-                if i != j and codes[i].startswith(codes[j]):
-                    return False
-        return True
+        """Check if code is prefix-free (sorted codewords, adjacent pairs only)"""
+        return is_prefix_free(code_dict.values())
+
+    def is_uniquely_decodable(self, code_dict):
+        """Sardinas–Patterson test with a trie over the codewords"""
+        return is_uniquely_decodable(code_dict.values())
 
     def kraft_inequality(self, code_dict):
         """Check Kraft inequality"""
@@ -37,23 +40,103 @@ class HuffmanModel:
         return kraft_sum, kraft_sum <= 1
 
     def generate_huffman_codes(self, text):
-        """Generate Huffman codes from text"""
+        """Generate Huffman codes from text (canonical codewords, see generate_canonical_code)"""
+        code, probs, freq = self.generate_canonical_code(text)
+        return code.to_dict(), probs, freq
+
+    def generate_canonical_code(self, text, max_length=None):
+        """
+        Canonical Huffman code of the symbols of text (a string or any sequence of hashable symbols).
+        Returns (code, probs, freq): code is a CanonicalCode whose description gives the
+        codeword length of every symbol; the lengths are computed in linear time after one sort.
+        With max_length, the optimal code whose codewords have at most max_length bits (package-merge).
+        """
         freq = Counter(text)
         total = len(text)
+        if total == 0:
+            raise ValueError("Δεν υπάρχουν σύμβολα για την κατασκευή κώδικα")
 
-        heap = [[count, [char, ""]] for char, count in freq.items()]
-        heapq.heapify(heap)
+        code = CanonicalCode.from_weights(list(freq.keys()), np.fromiter(freq.values(), dtype=np.int64, count=len(freq)),
+                                          max_length)
+        probs = {c: freq[c] / total for c in freq}
 
-        while len(heap) > 1:
-            lo = heapq.heappop(heap)
-            hi = heapq.heappop(heap)
-            for pair in lo[1:]:
-                pair[1] = '0' + pair[1]
-            for pair in hi[1:]:
-                pair[1] = '1' + pair[1]
-            heapq.heappush(heap, [lo[0] + hi[0]] + lo[1:] + hi[1:])
+        return code, probs, freq
 
-        codes = {char: code for char, code in heap[0][1:]}
-        probs = {c: freq[c] / total for c in freq}
+    def length_limit_penalty(self, text, max_length):
+        """
+        Average codeword length of the length-limited code (package-merge) against the
+        unrestricted Huffman code and the entropy, in bits/symbol. The penalties are the
+        extra bits per symbol the L_max constraint costs.
+        """
+        freq = Counter(text)
+        if not freq:
+            raise ValueError("Δεν υπάρχουν σύμβολα για την κατασκευή κώδικα")
+        counts = np.fromiter(freq.values(), dtype=np.int64, count=len(freq))
+        p = counts / counts.sum()
+        huffman = huffman_code_lengths(counts)
+        limited = length_limited_code_lengths(counts, max_length)
+        H = float(-np.sum(p * np.log2(p))) + 0.0
+        L_huffman = float(p @ huffman)
+        L_limited = float(p @ limited)
+        return {
+            'max_length': max_length,
+            'entropy': H,
+            'huffman_length': L_huffman,
+            'huffman_max_length': int(huffman.max()),
+            'limited_length': L_limited,
+            'limited_max_length': int(limited.max()),
+            'penalty_vs_huffman': L_limited - L_huffman,
+            'relative_penalty': (L_limited - L_huffman) / L_huffman,
+            'penalty_vs_entropy': L_limited - H,
+        }
+
+    def encode_huffman(self, data, max_length=None):
+        """Bit-packed Huffman encoding of a str or bytes (canonical-code header + payload)"""
+        return huffman_encode(data, max_length)
+
+    def decode_huffman(self, blob, table_bits=DECODE_TABLE_BITS):
+        """Decodes the output of encode_huffman with table_bits-bit lookup tables"""
+        return huffman_decode(blob, table_bits)
+
+    def compress_file(self, source, destination, chunk_bytes=FILE_CHUNK_BYTES, max_length=None, progress=None):
+        """Two-pass (count, encode) compression of a file of any size, see file_compressor.compress_file"""
+        return compress_file(source, destination, chunk_bytes, max_length, progress=progress)
+
+    def decompress_file(self, source, destination, progress=None):
+        return decompress_file(source, destination, progress=progress)
+
+    def benchmark_huffman(self, data, repeat=3, table_bits=DECODE_TABLE_BITS, max_length=None):
+        """
+        Encodes and decodes data (best time of `repeat` runs, codewords of at most max_length
+        bits if given) and checks the round trip.
+        Returns sizes, compression ratio, bits per symbol against the entropy and the
+        encode/decode throughput in MB/s of input (UTF-8 bytes for text).
+        """
+        input_bytes = len(data.encode('utf-8')) if isinstance(data, str) else len(data)
+        encode_time = decode_time = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            blob = self.encode_huffman(data, max_length)
+            encode_time = min(encode_time, time.perf_counter() - start)
+            start = time.perf_counter()
+            decoded = self.decode_huffman(blob, table_bits)
+            decode_time = min(decode_time, time.perf_counter() - start)
 
-        return codes, probs, freq
+        code, _, n_symbols, header_bytes = read_header(blob)
+        payload_bits = (len(blob) - header_bytes) * 8
+        freq = Counter(data)
+        probs = {c: freq[c] / n_symbols for c in freq}
+        return {
+            'symbols': n_symbols,
+            'alphabet': len(code.symbols),
+            'max_length': code.max_length,
+            'input_bytes': input_bytes,
+            'compressed_bytes': len(blob),
+            'header_bytes': header_bytes,
+            'ratio': len(blob) / input_bytes,
+            'bits_per_symbol': payload_bits / n_symbols,
+            'entropy': self.calculate_entropy_from_dictionary(probs),
+            'encode_mb_s': input_bytes / encode_time / 1e6,
+            'decode_mb_s': input_bytes / decode_time / 1e6,
+            'round_trip': decoded == data,
+        }
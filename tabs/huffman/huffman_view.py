@@ -118,12 +118,53 @@ class HuffmanView(SharedUI):
         self.text_input.pack(padx=20, pady=5, fill=tk.BOTH)
 
         # CHANGED: Replaced tk.Button with self._button
-        self.analyze_text_btn = self._button(f, "Ανάλυση & Δημιουργία Huffman",color=ModernDarkTheme.BG_BLUISH)
-        self.analyze_text_btn.pack(pady=10)
+        text_buttons = tk.Frame(f, bg=ModernDarkTheme.BG_FRAME)
+        text_buttons.pack(pady=10)
+
+        self.analyze_text_btn = self._button(text_buttons, "Ανάλυση & Δημιουργία Huffman",color=ModernDarkTheme.BG_BLUISH)
+        self.analyze_text_btn.grid(row=0, column=0, padx=6)
+
+        self.encode_text_btn = self._button(text_buttons, "Κωδικοποίηση bits & Ταχύτητα",
+                                            color=ModernDarkTheme.BG_LIGHT_ORANGE)
+        self.encode_text_btn.grid(row=0, column=1, padx=6)
+
+        self.compress_file_btn = self._button(text_buttons, "Συμπίεση αρχείου...", color=ModernDarkTheme.BG_BLUISH)
+        self.compress_file_btn.grid(row=0, column=2, padx=6)
+
+        self.decompress_file_btn = self._button(text_buttons, "Αποσυμπίεση αρχείου...",
+                                                color=ModernDarkTheme.BG_LIGHT_ORANGE)
+        self.decompress_file_btn.grid(row=0, column=3, padx=6)
+
+        # Μέγιστο μήκος κωδικής λέξης (κενό: απεριόριστο Huffman) για κωδικοποίηση, συμπίεση και σύγκριση
+        limit_frame = tk.Frame(f, bg=ModernDarkTheme.BG_FRAME)
+        limit_frame.pack(pady=2)
+        self._label(limit_frame, "L_max (bits):", 0, 0)
+        self.max_length_entry = self._entry(limit_frame, width=6, default="")
+        self.max_length_entry.grid(row=0, column=1, padx=6)
+        self.length_limit_btn = self._button(limit_frame, "Κόστος περιορισμού μήκους", color=ModernDarkTheme.BG_BLUISH)
+        self.length_limit_btn.grid(row=0, column=2, padx=6)
+
+        self.text_status = self._task_status(f)
+        self.text_status.pack(pady=2)
+
+        # Συμπίεση/αποσυμπίεση αρχείων: δική τους γραμμή κατάστασης, ώστε να μην ακυρώνονται από τις υπόλοιπες εργασίες
+        self.file_status = self._task_status(f)
+        self.file_status.pack(pady=2)
 
         self.text_result = self._scrolled(f, 18)
         self.text_result.pack(padx=20, pady=10, fill=tk.BOTH, expand=True)
 
+    def get_max_length(self):
+        """L_max από το πεδίο εισαγωγής ή None αν είναι κενό"""
+        value = self.max_length_entry.get().strip()
+        return int(value) if value else None
+
+    def set_file_buttons_enabled(self, enabled):
+        """Όσο τρέχει συμπίεση ή αποσυμπίεση αρχείου, τα κουμπιά αρχείων απενεργοποιούνται"""
+        state = tk.NORMAL if enabled else tk.DISABLED
+        self.compress_file_btn.config(state=state)
+        self.decompress_file_btn.config(state=state)
+
     def build_tree_graph(self, code_dict):
         """Build tree"""
         tree = nx.DiGraph()
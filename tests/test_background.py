@@ -0,0 +1,66 @@
+"""Shutdown of the background executor and saving the capacity cache while a worker writes to it"""
+import threading
+import time
+
+import numpy as np
+
+from tabs.channel.capacity_cache import CapacityCache
+from tabs.common.background import BackgroundExecutor
+
+
+class NoTk:
+    """Stands in for the Tk root: results are never polled in these tests"""
+
+    def after(self, ms, callback):
+        pass
+
+
+def test_shutdown_waits_for_the_running_task():
+    executor = BackgroundExecutor(NoTk())
+    started, finished = threading.Event(), threading.Event()
+
+    def task(progress):
+        started.set()
+        time.sleep(0.2)   # a step that does not call progress(), like a cvxpy solve
+        finished.set()
+
+    executor.submit('solve', task, lane='channel', cancellable=False)
+    assert started.wait(5)
+    assert executor.shutdown(wait=True, timeout=5)
+    assert finished.is_set()
+
+
+def test_shutdown_wait_is_bounded_by_the_timeout():
+    executor = BackgroundExecutor(NoTk())
+    started, release = threading.Event(), threading.Event()
+
+    def task(progress):
+        started.set()
+        release.wait(5)
+
+    executor.submit('solve', task, lane='channel')
+    assert started.wait(5)
+    assert not executor.shutdown(wait=True, timeout=0.05)
+    release.set()
+
+
+def test_save_while_a_worker_fills_the_cache(tmp_path):
+    cache = CapacityCache(max_entries=50, path=tmp_path / 'cache.npz')
+    stop = threading.Event()
+
+    def fill():
+        i = 0
+        while not stop.is_set():
+            cache.put(cache.make_key(i), (np.full(100, i / 7), i))
+            i += 1
+
+    worker = threading.Thread(target=fill)
+    worker.start()
+    try:
+        for _ in range(20):
+            cache.save()
+    finally:
+        stop.set()
+        worker.join()
+    loaded = CapacityCache(path=tmp_path / 'cache.npz')
+    assert 0 < loaded.stats()['entries'] <= 50
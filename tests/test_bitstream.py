@@ -0,0 +1,104 @@
+"""Round trips of the bit-packed Huffman encoder and the table-driven decoder"""
+import numpy as np
+import pytest
+
+from tabs.huffman.bitstream import (DECODE_TABLE_BITS, MAX_DECODE_CODE_LENGTH, HuffmanEncoder, TableDecoder,
+                                    code_from_counts, huffman_decode, huffman_encode, read_header)
+
+
+def fibonacci_bytes(n_symbols, seed=0):
+    """Shuffled bytes whose counts are Fibonacci numbers, so the Huffman code is as deep as possible"""
+    counts = [1, 1]
+    while len(counts) < n_symbols:
+        counts.append(counts[-1] + counts[-2])
+    data = np.repeat(np.arange(n_symbols, dtype=np.uint8), counts)
+    np.random.default_rng(seed).shuffle(data)
+    return data.tobytes()
+
+
+def encode_with(code, values, chunk_symbols, pieces):
+    """Payload of values encoded in `pieces` encode() calls of chunk_symbols symbols per step"""
+    encoder = HuffmanEncoder(code)
+    parts = [encoder.encode(part, chunk_symbols) for part in np.array_split(values, pieces)]
+    return b''.join(parts) + encoder.flush()
+
+
+def test_single_symbol():
+    blob = huffman_encode(b'a' * 1000)
+    code, _, n_symbols, _ = read_header(blob)
+    assert code.max_length == 1 and n_symbols == 1000
+    assert huffman_decode(blob) == b'a' * 1000
+    assert huffman_decode(huffman_encode('ω')) == 'ω'
+
+
+def test_non_ascii_text():
+    text = "Θεωρία Πληροφορίας — Shannon 1948 ✓ 日本語 😀\n" * 50
+    assert huffman_decode(huffman_encode(text)) == text
+
+
+def test_random_bytes_use_all_256_values():
+    data = np.random.default_rng(1).integers(0, 256, 100_000, dtype=np.uint8).tobytes()
+    blob = huffman_encode(data)
+    assert len(read_header(blob)[0].symbols) == 256
+    assert huffman_decode(blob) == data
+
+
+def test_codes_longer_than_the_table():
+    data = fibonacci_bytes(28)
+    blob = huffman_encode(data)
+    assert read_header(blob)[0].max_length == 27 > DECODE_TABLE_BITS
+    assert huffman_decode(blob) == data
+
+
+@pytest.mark.parametrize('table_bits', range(8, 13))
+def test_table_bits(table_bits):
+    data = fibonacci_bytes(20) + bytes(range(256))
+    assert huffman_decode(huffman_encode(data), table_bits) == data
+
+
+@pytest.mark.parametrize('max_length', [8, 11, 16])
+def test_length_limited_codes(max_length):
+    data = fibonacci_bytes(24)
+    blob = huffman_encode(data, max_length)
+    assert read_header(blob)[0].max_length <= max_length
+    assert huffman_decode(blob) == data
+
+
+@pytest.mark.parametrize('chunk_bytes', [1, 2, 3, 5, 8, 13])
+def test_codewords_split_across_decode_chunks(chunk_bytes):
+    values = np.frombuffer(fibonacci_bytes(22, seed=2)[:20_000], dtype=np.uint8)
+    counts = np.bincount(values)
+    alphabet = np.flatnonzero(counts)
+    code = code_from_counts(alphabet, counts[alphabet])
+    assert code.max_length > 8   # long codewords as well as short ones straddle the chunk ends
+    payload = encode_with(code, values, 1 << 16, 1)
+    decoded = TableDecoder(code, 8).decode(payload, values.size, chunk_bytes)
+    np.testing.assert_array_equal(decoded, values)
+
+
+@pytest.mark.parametrize('chunk_symbols, pieces', [(1, 1), (7, 3), (1000, 13), (1 << 16, 5)])
+def test_encoder_carries_partial_bytes(chunk_symbols, pieces):
+    values = np.random.default_rng(3).integers(0, 50, 5_000)
+    counts = np.bincount(values)
+    alphabet = np.flatnonzero(counts)
+    code = code_from_counts(alphabet, counts[alphabet])
+    payload = encode_with(code, values, chunk_symbols, pieces)
+    assert payload == encode_with(code, values, 1 << 16, 1)
+    np.testing.assert_array_equal(TableDecoder(code).decode(payload, values.size), values)
+
+
+def test_deep_codes_fall_back_to_the_decoder_limit():
+    counts = [1, 1]
+    while len(counts) < 80:
+        counts.append(counts[-1] + counts[-2])
+    code = code_from_counts(np.arange(80), np.array(counts, dtype=np.int64))
+    assert code.max_length == MAX_DECODE_CODE_LENGTH
+    values = np.concatenate([np.arange(80), np.random.default_rng(4).integers(60, 80, 2_000)])
+    payload = encode_with(code, values, 1 << 16, 2)
+    np.testing.assert_array_equal(TableDecoder(code).decode(payload, values.size, 5), values)
+
+
+def test_truncated_stream_is_rejected():
+    blob = huffman_encode(fibonacci_bytes(12))
+    with pytest.raises(ValueError):
+        huffman_decode(blob[:len(blob) // 2])
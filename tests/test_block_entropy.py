@@ -0,0 +1,56 @@
+"""Chunked n-gram counting of the block entropies against a brute-force Counter"""
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from tabs.entropy.block_entropy import BlockEntropyCounter
+
+
+def brute_force(symbols, k):
+    """H(Xⁿ) and the number of distinct n-grams for n = 1..k from Counter over tuples"""
+    entropies, distinct = [], []
+    for n in range(1, k + 1):
+        counts = np.array(list(Counter(tuple(symbols[i:i + n]) for i in range(len(symbols) - n + 1)).values()))
+        p = counts / counts.sum()
+        entropies.append(float(-(p * np.log2(p)).sum()))
+        distinct.append(counts.size)
+    return np.array(entropies), np.array(distinct)
+
+
+def counted(symbols, k, alphabet_size, chunk, **kwargs):
+    counter = BlockEntropyCounter(k, alphabet_size, **kwargs)
+    for start in range(0, len(symbols), chunk):
+        counter.update(symbols[start:start + chunk])
+    return counter.block_entropies()
+
+
+@pytest.mark.parametrize('alphabet_size, k', [(2, 12), (5, 6), (256, 4), (3000, 3)])
+@pytest.mark.parametrize('chunk', [1, 7, 500, 100_000])
+def test_exact_counts_match_brute_force(alphabet_size, k, chunk):
+    rng = np.random.default_rng(alphabet_size + chunk)
+    symbols = np.minimum(rng.geometric(0.3, 3000) - 1, alphabet_size - 1)
+    result = counted(symbols, k, alphabet_size, chunk)
+    entropies, distinct = brute_force(symbols.tolist(), k)
+    assert not result['approximate'].any()
+    np.testing.assert_allclose(result['block_entropies'], entropies, atol=1e-10)
+    np.testing.assert_array_equal(result['distinct'], distinct)
+
+
+def test_overflow_switches_only_the_large_blocks_to_hashed_counts():
+    rng = np.random.default_rng(0)
+    symbols = rng.integers(0, 256, 5000)
+    result = counted(symbols, 5, 256, 700, max_distinct=3000, hash_buckets=2 ** 20)
+    entropies, distinct = brute_force(symbols.tolist(), 5)
+    # 2-grams are counted densely, 3-grams exceed 3000 distinct keys part way through the data
+    assert result['approximate'].tolist() == [False, False, True, True, True]
+    np.testing.assert_allclose(result['block_entropies'][:2], entropies[:2], atol=1e-10)
+    np.testing.assert_allclose(result['block_entropies'][2:], entropies[2:], atol=0.01)
+    assert np.all(result['distinct'] <= distinct)
+
+
+def test_sequence_shorter_than_k():
+    result = counted(np.array([1, 0, 1]), 5, 2, 2)
+    entropies, _ = brute_force([1, 0, 1], 3)
+    np.testing.assert_allclose(result['block_entropies'][:3], entropies, atol=1e-12)
+    assert np.isnan(result['block_entropies'][3:]).all()
@@ -0,0 +1,95 @@
+"""Optimality of Huffman and package-merge code lengths against brute-force references"""
+import heapq
+import itertools
+
+import numpy as np
+import pytest
+
+from tabs.huffman.canonical import CanonicalCode, huffman_code_lengths, length_limited_code_lengths
+from tabs.huffman.code_properties import is_prefix_free
+
+
+def heap_huffman_cost(weights):
+    """Σ w·l of a Huffman code: the sum of all merged node weights (textbook heap construction)"""
+    heap = [float(w) for w in weights]
+    heapq.heapify(heap)
+    cost = 0.0
+    while len(heap) > 1:
+        merged = heapq.heappop(heap) + heapq.heappop(heap)
+        cost += merged
+        heapq.heappush(heap, merged)
+    return cost
+
+
+def exhaustive_cost(weights, max_length):
+    """Minimal Σ w·l over every length vector with lengths ≤ max_length that satisfies Kraft"""
+    n = len(weights)
+    lengths = np.array(list(itertools.product(range(1, max_length + 1), repeat=n)))
+    feasible = np.ldexp(1.0, -lengths).sum(axis=1) <= 1 + 1e-12
+    return float((lengths[feasible] @ np.asarray(weights, dtype=np.float64)).min())
+
+
+def random_weights(rng, n):
+    kind = rng.integers(4)
+    if kind == 0:
+        return rng.integers(0, 4, n)                       # many ties and zeros
+    if kind == 1:
+        return rng.geometric(0.2, n) ** 3                  # skewed counts
+    if kind == 2:
+        return rng.random(n)                               # probabilities as floats
+    return np.sort(rng.integers(1, 1000, n))[::-1].copy()  # already sorted, descending
+
+
+@pytest.mark.parametrize('seed', range(40))
+def test_huffman_lengths_are_optimal(seed):
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(2, 300))
+    weights = random_weights(rng, n)
+    lengths = huffman_code_lengths(weights)
+    assert np.ldexp(1.0, -lengths).sum() == pytest.approx(1.0)   # a full binary tree
+    assert lengths @ weights.astype(np.float64) == pytest.approx(heap_huffman_cost(weights), rel=1e-12)
+
+
+@pytest.mark.parametrize('n', range(2, 7))
+def test_huffman_lengths_match_exhaustive_search(n):
+    rng = np.random.default_rng(n)
+    for _ in range(10):
+        weights = random_weights(rng, n)
+        lengths = huffman_code_lengths(weights)
+        assert lengths @ weights.astype(np.float64) == pytest.approx(exhaustive_cost(weights, n - 1), abs=1e-9)
+
+
+@pytest.mark.parametrize('n', range(2, 7))
+def test_package_merge_matches_exhaustive_search(n):
+    rng = np.random.default_rng(100 + n)
+    for _ in range(8):
+        weights = random_weights(rng, n)
+        for max_length in range(int(np.ceil(np.log2(n))), n):
+            lengths = length_limited_code_lengths(weights, max_length)
+            assert lengths.max() <= max_length
+            assert np.ldexp(1.0, -lengths).sum() <= 1
+            assert lengths @ weights.astype(np.float64) == \
+                pytest.approx(exhaustive_cost(weights, max_length), abs=1e-9)
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_package_merge_without_a_binding_limit_is_huffman(seed):
+    rng = np.random.default_rng(200 + seed)
+    weights = random_weights(rng, int(rng.integers(2, 200)))
+    huffman = huffman_code_lengths(weights)
+    limited = length_limited_code_lengths(weights, int(huffman.max()))
+    assert limited @ weights.astype(np.float64) == pytest.approx(huffman @ weights.astype(np.float64))
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_canonical_codewords_are_prefix_free_and_ordered(seed):
+    rng = np.random.default_rng(300 + seed)
+    n = int(rng.integers(1, 100))
+    code = CanonicalCode.from_weights(range(n), random_weights(rng, n))
+    words = code.to_dict()
+    assert is_prefix_free(words.values())
+    assert [len(words[s]) for s in range(n)] == code.lengths.tolist()
+    # canonical order: by (length, symbol position), consecutive values within one length
+    canonical = [words[s] for s in code.order]
+    assert all((len(a), a) < (len(b), b) for a, b in zip(canonical, canonical[1:]))
+    assert CanonicalCode(range(n), code.lengths).to_dict() == words
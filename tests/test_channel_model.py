@@ -0,0 +1,95 @@
+"""Channel capacity: matrix convention and the two solver backends"""
+import numpy as np
+import pytest
+
+from tabs.channel.channel_model import ChannelModel
+
+
+def column_stochastic(n_outputs, n_inputs, seed):
+    P = np.random.default_rng(seed).random((n_outputs, n_inputs))
+    return P / P.sum(axis=0)
+
+
+@pytest.mark.parametrize('shape', [(2, 2), (3, 4), (5, 2)])
+def test_matrix_accepted_by_the_tab_solves_with_both_methods(shape):
+    model = ChannelModel(cache=False)
+    P = np.round(column_stochastic(*shape, seed=sum(shape)), 2)
+    P[-1] = 1 - P[:-1].sum(axis=0)   # columns sum to 1 exactly after rounding, as typed into the grid
+    bad, unnormalized, _ = model.find_invalid_columns(P)
+    assert bad.size == 0 and unnormalized.size == 0
+
+    m = P.shape[1]
+    C_cvxpy, _ = model.calculate_uniform_channel_capacity(m, P, method='cvxpy')
+    assert model.last_solve_info['warning'] is None
+    C_ba, _ = model.calculate_uniform_channel_capacity(m, P, method='blahut_arimoto')
+    assert model.last_solve_info['converged']
+    assert C_ba == pytest.approx(C_cvxpy, abs=1e-5)
+
+
+def test_row_stochastic_matrix_is_flagged_by_the_tab_and_rejected_by_blahut_arimoto():
+    model = ChannelModel(cache=False)
+    P = column_stochastic(3, 2, seed=1).T   # rows sum to 1, columns do not
+    _, unnormalized, column_sums = model.find_invalid_columns(P)
+    np.testing.assert_array_equal(unnormalized, np.flatnonzero(~np.isclose(column_sums, 1, atol=0.01)))
+    assert unnormalized.size
+    with pytest.raises(ValueError, match="columns do not sum to 1"):
+        model.calculate_uniform_channel_capacity(3, P, method='blahut_arimoto')
+
+
+def mutual_information(P, x):
+    """I(X;Y) in bits for input distribution x and channel columns P[:, j] = P(Y|X=j)"""
+    q = P @ x
+    terms = np.where(P > 0, P * np.log2(np.where(P > 0, P, 1) / np.where(q[:, None] > 0, q[:, None], 1)), 0)
+    return float(x @ terms.sum(axis=0))
+
+
+def sparse_column_stochastic(n_outputs, n_inputs, seed):
+    rng = np.random.default_rng(seed)
+    P = rng.random((n_outputs, n_inputs)) * (rng.random((n_outputs, n_inputs)) < 0.6)
+    P[rng.integers(n_outputs, size=n_inputs), np.arange(n_inputs)] += 0.1   # no empty column
+    return P / P.sum(axis=0)
+
+
+@pytest.mark.parametrize('seed', range(6))
+def test_blahut_arimoto_bounds_bracket_the_two_input_capacity(seed):
+    """Brute force over a fine grid of input distributions (x, 1 - x)"""
+    model = ChannelModel(cache=False)
+    P = sparse_column_stochastic(4, 2, seed)
+    grid = np.linspace(0, 1, 20001)
+    brute = max(mutual_information(P, np.array([t, 1 - t])) for t in grid)
+
+    capacity, x = model.calculate_uniform_channel_capacity(2, P, method='blahut_arimoto', tol=1e-8)
+    info = model.last_solve_info
+    assert info['converged']
+    assert info['lower_bound'] - 1e-12 <= brute + 1e-9 and brute <= info['upper_bound'] + 1e-12
+    assert capacity == pytest.approx(mutual_information(P, x), abs=1e-12)
+    assert capacity == pytest.approx(brute, abs=1e-7)
+
+
+@pytest.mark.parametrize('shape, seed', [((2, 2), 0), ((3, 3), 1), ((6, 4), 2), ((3, 7), 3), ((10, 10), 4)])
+def test_blahut_arimoto_bounds_are_ordered_and_agree_with_cvxpy(shape, seed):
+    model = ChannelModel(cache=False)
+    P = sparse_column_stochastic(*shape, seed)
+    m = shape[1]
+    C_cvxpy, x_cvxpy = model.calculate_uniform_channel_capacity(m, P, method='cvxpy')
+    C_ba, x_ba = model.calculate_uniform_channel_capacity(m, P, method='blahut_arimoto', tol=1e-8)
+    info = model.last_solve_info
+
+    history = np.array(info['bounds_history'])
+    assert np.all(history[:, 0] <= history[:, 1] + 1e-12)
+    assert np.all(np.diff(history[:, 0]) >= -1e-12)         # rejected accelerated steps are rolled back
+    # every lower bound is achieved by some input, every upper bound holds for every input
+    assert info['lower_bound'] <= info['upper_bound'] < info['lower_bound'] + 1e-8
+    assert info['lower_bound'] == pytest.approx(mutual_information(P, x_ba), abs=1e-12)
+    assert mutual_information(P, np.clip(x_cvxpy, 0, None) / np.clip(x_cvxpy, 0, None).sum()) \
+        <= info['upper_bound'] + 1e-6
+    assert C_cvxpy == pytest.approx(C_ba, abs=1e-5)
+
+
+@pytest.mark.parametrize('e', [0.0, 0.05, 0.3, 0.5])
+def test_blahut_arimoto_matches_the_binary_symmetric_channel(e):
+    model = ChannelModel(cache=False)
+    P = np.array([[1 - e, e], [e, 1 - e]])
+    capacity, x = model.calculate_uniform_channel_capacity(2, P, method='blahut_arimoto', tol=1e-10)
+    assert capacity == pytest.approx(model.calculate_bsc_capacity(e), abs=1e-9)
+    np.testing.assert_allclose(x, [0.5, 0.5], atol=1e-6)
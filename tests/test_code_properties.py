@@ -0,0 +1,58 @@
+"""Prefix-freeness and the Sardinas–Patterson test against brute-force double parsing"""
+import itertools
+
+import numpy as np
+import pytest
+
+from tabs.huffman.code_properties import is_prefix_free, is_uniquely_decodable
+
+# Longest string searched for two parsings: ample for codes of at most 5 words of up to 4 symbols
+MAX_PARSE_LENGTH = 14
+
+
+def has_double_parsing(codewords, max_length=MAX_PARSE_LENGTH):
+    """Whether some string of at most max_length symbols is a concatenation of codewords in two ways"""
+    words = list(codewords)
+    if len(set(words)) != len(words):
+        return True
+    ways = {'': 1}
+    for length in range(max_length):
+        for string in [s for s in ways if len(s) == length]:
+            for word in words:
+                extended = string + word
+                if len(extended) <= max_length:
+                    ways[extended] = ways.get(extended, 0) + ways[string]
+                    if ways[extended] > 1:
+                        return True
+    return False
+
+
+def brute_prefix_free(codewords):
+    return not any(a != b and b.startswith(a) for a, b in itertools.permutations(codewords, 2))
+
+
+def random_code(rng, alphabet='01'):
+    n = int(rng.integers(2, 6))
+    lengths = rng.integers(1, 5, n)
+    return list({''.join(rng.choice(list(alphabet), length)) for length in lengths})
+
+
+@pytest.mark.parametrize('seed', range(300))
+def test_sardinas_patterson_matches_double_parsing(seed):
+    rng = np.random.default_rng(seed)
+    code = random_code(rng, '01' if seed % 3 else '012')
+    assert is_uniquely_decodable(code) == (not has_double_parsing(code)), code
+    assert is_prefix_free(code) == brute_prefix_free(code), code
+
+
+@pytest.mark.parametrize('code, expected', [
+    (['0', '01', '011'], True),            # suffix code, not prefix-free
+    (['1', '10', '00'], True),
+    (['0', '01', '10'], False),            # 010 = 0·10 = 01·0
+    (['10', '01', '100', '0010'], False),
+    (['a', 'ab', 'b'], False),
+    (['0', '0'], False),                   # a repeated codeword is ambiguous
+])
+def test_known_codes(code, expected):
+    assert is_uniquely_decodable(code) == expected
+    assert has_double_parsing(code) != expected
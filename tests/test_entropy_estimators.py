@@ -0,0 +1,23 @@
+"""Bias-corrected entropy estimators on degenerate and batched histograms"""
+import numpy as np
+import pytest
+
+from tabs.entropy.entropy_model import ENTROPY_ESTIMATORS, EntropyModel
+
+
+@pytest.mark.parametrize('method', ENTROPY_ESTIMATORS)
+def test_single_sample_has_zero_entropy(method):
+    assert EntropyModel().estimate_entropy([0, 1, 0], method) == 0.0
+
+
+@pytest.mark.parametrize('method', ENTROPY_ESTIMATORS)
+def test_batched_rows_match_single_rows(method):
+    model = EntropyModel()
+    counts = np.array([[1, 0, 0], [3, 5, 0], [2, 2, 7]])
+    expected = [model.estimate_entropy(row, method) for row in counts]
+    np.testing.assert_allclose(model.estimate_entropy(counts, method), expected)
+
+
+def test_empty_histogram_is_rejected():
+    with pytest.raises(ValueError):
+        EntropyModel().estimate_entropy([0, 0], 'jackknife')
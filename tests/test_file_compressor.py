@@ -0,0 +1,48 @@
+"""Two-pass file compression: round trips and no partial output on failure"""
+import numpy as np
+import pytest
+
+from tabs.huffman.file_compressor import compress_file, decompress_file
+
+
+class Cancelled(Exception):
+    pass
+
+
+def cancel_after(calls):
+    def progress(fraction, message):
+        calls[0] -= 1
+        if calls[0] < 0:
+            raise Cancelled()
+    return progress
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / 'data.bin'
+    rng = np.random.default_rng(0)
+    path.write_bytes(rng.geometric(0.05, 300_000).clip(0, 255).astype(np.uint8).tobytes())
+    return path
+
+
+def test_round_trip_in_small_chunks(source, tmp_path):
+    stats = compress_file(source, tmp_path / 'data.huf', chunk_bytes=4096)
+    assert stats['output_bytes'] == (tmp_path / 'data.huf').stat().st_size < source.stat().st_size
+    decompress_file(tmp_path / 'data.huf', tmp_path / 'restored.bin', chunk_bytes=1000)
+    assert (tmp_path / 'restored.bin').read_bytes() == source.read_bytes()
+
+
+def test_cancelled_compression_leaves_no_file(source, tmp_path):
+    with pytest.raises(Cancelled):
+        compress_file(source, tmp_path / 'data.huf', chunk_bytes=4096, progress=cancel_after([100]))
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['data.bin']
+
+
+def test_cancelled_decompression_keeps_the_previous_file(source, tmp_path):
+    compress_file(source, tmp_path / 'data.huf')
+    (tmp_path / 'restored.bin').write_bytes(b'previous')
+    with pytest.raises(Cancelled):
+        decompress_file(tmp_path / 'data.huf', tmp_path / 'restored.bin', chunk_bytes=1000,
+                        progress=cancel_after([10]))
+    assert (tmp_path / 'restored.bin').read_bytes() == b'previous'
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['data.bin', 'data.huf', 'restored.bin']
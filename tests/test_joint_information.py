@@ -0,0 +1,64 @@
+"""Joint, conditional and mutual information from chunked, merged joint histograms"""
+import numpy as np
+import pytest
+
+from tabs.entropy.entropy_model import EntropyModel
+from tabs.entropy.joint_histogram import JointHistogram
+
+
+def entropy_of_counts(counts):
+    p = counts[counts > 0] / counts.sum()
+    return float(-(p * np.log2(p)).sum())
+
+
+def direct_information(x, y):
+    """H(X,Y), H(X|Y), H(Y|X) and I(X;Y) from np.unique counts of the whole sample"""
+    _, xy_counts = np.unique(np.stack([x, y]), axis=1, return_counts=True)
+    H_XY = entropy_of_counts(xy_counts)
+    H_X = entropy_of_counts(np.unique(x, return_counts=True)[1])
+    H_Y = entropy_of_counts(np.unique(y, return_counts=True)[1])
+    return {'H_XY': H_XY, 'H_X_given_Y': H_XY - H_Y, 'H_Y_given_X': H_XY - H_X, 'I_XY': H_X + H_Y - H_XY}
+
+
+@pytest.mark.parametrize('chunk_rows, dtype', [(1, np.int64), (37, np.int64), (1000, np.float64), (999, np.int16)])
+def test_chunked_and_merged_accumulation_matches_np_unique(chunk_rows, dtype):
+    rng = np.random.default_rng(chunk_rows)
+    x = rng.integers(-5, 12, 3000).astype(dtype)
+    y = (x * 3 + rng.integers(0, 4, x.size)) % 7   # Y depends on X, so I(X;Y) > 0
+    model = EntropyModel()
+
+    # two "sources" accumulated separately in chunks and then merged
+    first = model.build_joint_histogram(x[:1100], y[:1100], chunk_rows)
+    second = model.build_joint_histogram(x[1100:], y[1100:], chunk_rows)
+    stats = model.information_from_joint_counts(JointHistogram().merge(second).merge(first).counts)
+
+    expected = direct_information(x, y)
+    assert stats['n'] == x.size
+    assert expected['I_XY'] > 0.1
+    for key, value in expected.items():
+        assert stats[key] == pytest.approx(value, abs=1e-9), key
+
+
+def test_joint_table_matches_sample_counts():
+    """A probability table P(X,Y) gives the same quantities as samples drawn with those exact frequencies"""
+    P_XY = np.array([[0.25, 0.10, 0.05], [0.05, 0.20, 0.10], [0.05, 0.05, 0.15]])
+    counts = np.rint(P_XY * 100).astype(int)
+    x = np.repeat(np.arange(3), counts.sum(axis=1))
+    y = np.concatenate([np.repeat(np.arange(3), row) for row in counts])
+    stats = EntropyModel().information_from_joint_counts(P_XY)
+    for key, value in direct_information(x, y).items():
+        assert stats[key] == pytest.approx(value, abs=1e-9), key
+
+
+@pytest.mark.parametrize('axis, transpose', [(0, False), (-2, False), (1, True), (-1, True), ((1, 0), True)])
+def test_conditional_entropy_accepts_an_int_axis(axis, transpose):
+    P_XY = np.array([[0.25, 0.10, 0.05], [0.05, 0.20, 0.10], [0.05, 0.05, 0.15]])
+    model = EntropyModel()
+    expected = model.calculate_conditional_entropy(P_XY.T if transpose else P_XY)
+    assert model.calculate_conditional_entropy(P_XY, axis) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize('axis', [2, (0, 0), (0, 1, 2)])
+def test_conditional_entropy_rejects_invalid_axes(axis):
+    with pytest.raises(ValueError):
+        EntropyModel().calculate_conditional_entropy(np.full((2, 2), 0.25), axis)
@@ -0,0 +1,65 @@
+"""Incremental matrix-chain products against a full left-to-right recompute"""
+from functools import reduce
+
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+from tabs.channel.channel_model import ChannelModel
+
+
+def full_product(matrices):
+    return reduce(lambda a, b: a @ b, [m.toarray() if sp.issparse(m) else m for m in matrices])
+
+
+def dense(matrix):
+    return matrix.toarray() if sp.issparse(matrix) else matrix
+
+
+@pytest.mark.parametrize('cache', [False, True])
+@pytest.mark.parametrize('seed', range(5))
+def test_random_single_edits_match_a_full_recompute(cache, seed):
+    rng = np.random.default_rng(seed)
+    dims = rng.integers(1, 9, rng.integers(3, 7))
+    chain = [rng.random((dims[i], dims[i + 1])) for i in range(len(dims) - 1)]
+    model = ChannelModel(cache=cache)
+    orders = set()
+    for _ in range(25):
+        k = rng.integers(len(chain))
+        if rng.random() < 0.8:
+            chain[k] = rng.random(chain[k].shape)   # edit one matrix in place of the chain
+        result = model.combine_matrices(list(chain))
+        orders.add(model.last_chain_stats['order'].split(' ')[0])
+        np.testing.assert_allclose(dense(result), full_product(chain), rtol=1e-12)
+        result[...] = -1   # editing a returned product must not leak into the next call
+    assert 'incremental' in orders or cache
+
+
+def test_edits_after_an_unchanged_call():
+    rng = np.random.default_rng(7)
+    chain = [rng.random((4, 6)), rng.random((6, 2)), rng.random((2, 5)), rng.random((5, 3))]
+    model = ChannelModel(cache=False)
+    model.combine_matrices(chain)
+    model.combine_matrices(chain)[0, 0] = np.nan
+    assert model.last_chain_stats['order'] == 'unchanged'
+    chain[2] = rng.random((2, 5))
+    np.testing.assert_allclose(model.combine_matrices(chain), full_product(chain), rtol=1e-12)
+    assert model.last_chain_stats['order'].startswith('incremental')
+
+
+def test_sparse_chain_with_edits():
+    rng = np.random.default_rng(3)
+    chain = [sp.random(6, 6, density=0.4, format='csr', random_state=i) for i in range(4)]
+    model = ChannelModel(cache=False)
+    for k in [0, 3, 1, 1, 2]:
+        chain[k] = sp.random(6, 6, density=0.4, format='csr', random_state=int(rng.integers(1000)))
+        np.testing.assert_allclose(dense(model.combine_matrices(chain)), full_product(chain), rtol=1e-12)
+
+
+def test_changed_shape_recomputes_the_whole_chain():
+    rng = np.random.default_rng(5)
+    model = ChannelModel(cache=False)
+    chain = [rng.random((3, 4)), rng.random((4, 5)), rng.random((5, 2))]
+    model.combine_matrices(chain)
+    chain[1:] = [rng.random((4, 7)), rng.random((7, 2))]
+    np.testing.assert_allclose(model.combine_matrices(chain), full_product(chain), rtol=1e-12)
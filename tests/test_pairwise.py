@@ -0,0 +1,49 @@
+"""Tiled pairwise divergences against a brute-force loop over all pairs"""
+import numpy as np
+import pytest
+from scipy.special import rel_entr
+
+from tabs.entropy.pairwise import DIVERGENCE_MEASURES, pairwise_divergences, tile_shape
+
+
+def brute_force(measure, p, q):
+    if measure == 'kl':
+        return rel_entr(p, q).sum() / np.log(2)
+    if measure == 'symmetric_kl':
+        return (rel_entr(p, q).sum() + rel_entr(q, p).sum()) / np.log(2)
+    if measure == 'hellinger':
+        return np.sqrt(max(1 - np.sqrt(p * q).sum(), 0.0))
+    m = (p + q) / 2
+    return (rel_entr(p, m).sum() + rel_entr(q, m).sum()) / 2 / np.log(2)
+
+
+def random_distributions(n, k, seed):
+    rng = np.random.default_rng(seed)
+    P = rng.random((n, k)) * (rng.random((n, k)) > 0.3)   # zeros give infinite KL for some pairs
+    P[:, 0] += 0.01
+    return P / P.sum(axis=1, keepdims=True)
+
+
+@pytest.mark.parametrize('measure', DIVERGENCE_MEASURES)
+@pytest.mark.parametrize('tile_elements', [50, 2 ** 22])
+def test_matches_brute_force(measure, tile_elements):
+    P, Q = random_distributions(13, 6, 0), random_distributions(9, 6, 1)
+    atol = 1e-7 if measure == 'hellinger' else 1e-12   # √ of a rounding error near identical rows
+    expected = np.array([[brute_force(measure, p, q) for q in Q] for p in P])
+    if measure in ('kl', 'symmetric_kl'):
+        assert np.isinf(expected).any() and np.isfinite(expected).any()
+    np.testing.assert_allclose(pairwise_divergences(P, Q, measure, tile_elements=tile_elements),
+                               expected, atol=atol)
+    self_expected = np.array([[brute_force(measure, p, q) for q in P] for p in P])
+    np.testing.assert_allclose(pairwise_divergences(P, measure=measure, tile_elements=tile_elements),
+                               self_expected, atol=atol)
+
+
+@pytest.mark.parametrize('measure', DIVERGENCE_MEASURES)
+def test_tiles_respect_the_budget_for_every_measure(measure):
+    n_symbols, budget = 500, 2 ** 16
+    rows, cols = tile_shape(10_000, 10_000, n_symbols, measure, budget)
+    if measure == 'js':
+        assert rows * cols * n_symbols <= budget
+    else:
+        assert rows * cols <= budget and (rows + cols) * n_symbols <= budget